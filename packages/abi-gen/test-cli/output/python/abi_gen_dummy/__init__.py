@@ -11,7 +11,6 @@ from typing import (  # pylint: disable=unused-import
     Union,
 )
 
-from eth_utils import to_checksum_address
 from mypy_extensions import TypedDict  # pylint: disable=unused-import
 from hexbytes import HexBytes
 from web3 import Web3
@@ -19,7 +18,11 @@ from web3.contract import ContractFunction
 from web3.datastructures import AttributeDict
 from web3.providers.base import BaseProvider
 
-from zero_ex.contract_wrappers.bases import ContractMethod, Validator
+from zero_ex.contract_wrappers.bases import (
+    ContractMethod,
+    ContractWrapper,
+    Validator,
+)
 from zero_ex.contract_wrappers.tx_params import TxParams
 
 
@@ -218,6 +221,16 @@ class AcceptsAnArrayOfBytesMethod(
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(a).call(tx_params.as_dict())
 
+    async def call_async(
+        self, a: List[Union[bytes, str]], tx_params: Optional[TxParams] = None
+    ) -> None:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, a, tx_params=tx_params)
+
     def estimate_gas(
         self, a: List[Union[bytes, str]], tx_params: Optional[TxParams] = None
     ) -> int:
@@ -226,6 +239,16 @@ class AcceptsAnArrayOfBytesMethod(
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(a).estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, a: List[Union[bytes, str]], tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, a, tx_params=tx_params)
+
 
 class AcceptsBytesMethod(ContractMethod):  # pylint: disable=invalid-name
     """Various interfaces to the acceptsBytes method."""
@@ -260,6 +283,16 @@ class AcceptsBytesMethod(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(a).call(tx_params.as_dict())
 
+    async def call_async(
+        self, a: Union[bytes, str], tx_params: Optional[TxParams] = None
+    ) -> None:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, a, tx_params=tx_params)
+
     def estimate_gas(
         self, a: Union[bytes, str], tx_params: Optional[TxParams] = None
     ) -> int:
@@ -268,6 +301,16 @@ class AcceptsBytesMethod(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(a).estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, a: Union[bytes, str], tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, a, tx_params=tx_params)
+
 
 class ComplexInputComplexOutputMethod(
     ContractMethod
@@ -320,6 +363,20 @@ class ComplexInputComplexOutputMethod(
             dolor=returned[3],
         )
 
+    async def call_async(
+        self,
+        complex_input: AbiGenDummyComplexInput,
+        tx_params: Optional[TxParams] = None,
+    ) -> AbiGenDummyComplexOutput:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(
+            self.call, complex_input, tx_params=tx_params
+        )
+
     def estimate_gas(
         self,
         complex_input: AbiGenDummyComplexInput,
@@ -332,6 +389,20 @@ class ComplexInputComplexOutputMethod(
             tx_params.as_dict()
         )
 
+    async def estimate_gas_async(
+        self,
+        complex_input: AbiGenDummyComplexInput,
+        tx_params: Optional[TxParams] = None,
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(
+            self.estimate_gas, complex_input, tx_params=tx_params
+        )
+
 
 class EcrecoverFnMethod(ContractMethod):  # pylint: disable=invalid-name
     """Various interfaces to the ecrecoverFn method."""
@@ -402,6 +473,23 @@ class EcrecoverFnMethod(ContractMethod):  # pylint: disable=invalid-name
         )
         return str(returned)
 
+    async def call_async(
+        self,
+        _hash: Union[bytes, str],
+        v: int,
+        r: Union[bytes, str],
+        s: Union[bytes, str],
+        tx_params: Optional[TxParams] = None,
+    ) -> str:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(
+            self.call, _hash, v, r, s, tx_params=tx_params
+        )
+
     def estimate_gas(
         self,
         _hash: Union[bytes, str],
@@ -417,6 +505,23 @@ class EcrecoverFnMethod(ContractMethod):  # pylint: disable=invalid-name
             tx_params.as_dict()
         )
 
+    async def estimate_gas_async(
+        self,
+        _hash: Union[bytes, str],
+        v: int,
+        r: Union[bytes, str],
+        s: Union[bytes, str],
+        tx_params: Optional[TxParams] = None,
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(
+            self.estimate_gas, _hash, v, r, s, tx_params=tx_params
+        )
+
 
 class EmitSimpleEventMethod(ContractMethod):  # pylint: disable=invalid-name
     """Various interfaces to the emitSimpleEvent method."""
@@ -440,6 +545,14 @@ class EmitSimpleEventMethod(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method().call(tx_params.as_dict())
 
+    async def call_async(self, tx_params: Optional[TxParams] = None) -> None:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, tx_params=tx_params)
+
     def send_transaction(
         self, tx_params: Optional[TxParams] = None
     ) -> Union[HexBytes, bytes]:
@@ -450,16 +563,50 @@ class EmitSimpleEventMethod(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().transact(tx_params.as_dict())
 
+    async def send_transaction_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> Union[HexBytes, bytes]:
+        """Execute underlying contract method via eth_sendTransaction, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`send_transaction`.
+        """
+        return await self._run_async(
+            self.send_transaction, tx_params=tx_params
+        )
+
     def build_transaction(self, tx_params: Optional[TxParams] = None) -> dict:
         """Construct calldata to be used as input to the method."""
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().buildTransaction(tx_params.as_dict())
 
+    async def build_transaction_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> dict:
+        """Construct calldata to be used as input to the method, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`build_transaction`.
+        """
+        return await self._run_async(
+            self.build_transaction, tx_params=tx_params
+        )
+
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, tx_params=tx_params)
+
 
 class MethodAcceptingArrayOfArrayOfStructsMethod(
     ContractMethod
@@ -502,6 +649,18 @@ class MethodAcceptingArrayOfArrayOfStructsMethod(
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(index_0).call(tx_params.as_dict())
 
+    async def call_async(
+        self,
+        index_0: List[List[AbiGenDummyStruct]],
+        tx_params: Optional[TxParams] = None,
+    ) -> None:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, index_0, tx_params=tx_params)
+
     def estimate_gas(
         self,
         index_0: List[List[AbiGenDummyStruct]],
@@ -514,6 +673,20 @@ class MethodAcceptingArrayOfArrayOfStructsMethod(
             tx_params.as_dict()
         )
 
+    async def estimate_gas_async(
+        self,
+        index_0: List[List[AbiGenDummyStruct]],
+        tx_params: Optional[TxParams] = None,
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(
+            self.estimate_gas, index_0, tx_params=tx_params
+        )
+
 
 class MethodAcceptingArrayOfStructsMethod(
     ContractMethod
@@ -554,6 +727,18 @@ class MethodAcceptingArrayOfStructsMethod(
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(index_0).call(tx_params.as_dict())
 
+    async def call_async(
+        self,
+        index_0: List[AbiGenDummyStruct],
+        tx_params: Optional[TxParams] = None,
+    ) -> None:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, index_0, tx_params=tx_params)
+
     def estimate_gas(
         self,
         index_0: List[AbiGenDummyStruct],
@@ -566,6 +751,20 @@ class MethodAcceptingArrayOfStructsMethod(
             tx_params.as_dict()
         )
 
+    async def estimate_gas_async(
+        self,
+        index_0: List[AbiGenDummyStruct],
+        tx_params: Optional[TxParams] = None,
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(
+            self.estimate_gas, index_0, tx_params=tx_params
+        )
+
 
 class MethodReturningArrayOfStructsMethod(
     ContractMethod
@@ -602,11 +801,31 @@ class MethodReturningArrayOfStructsMethod(
             for element in returned
         ]
 
+    async def call_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> List[AbiGenDummyStruct]:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, tx_params=tx_params)
+
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, tx_params=tx_params)
+
 
 class MethodReturningMultipleValuesMethod(
     ContractMethod
@@ -636,11 +855,31 @@ class MethodReturningMultipleValuesMethod(
             returned[1],
         )
 
+    async def call_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> Tuple[int, str]:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, tx_params=tx_params)
+
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, tx_params=tx_params)
+
 
 class MethodUsingNestedStructWithInnerStructNotUsedElsewhereMethod(
     ContractMethod
@@ -671,11 +910,31 @@ class MethodUsingNestedStructWithInnerStructNotUsedElsewhereMethod(
             innerStruct=returned[0],
         )
 
+    async def call_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> AbiGenDummyNestedStructWithInnerStructNotUsedElsewhere:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, tx_params=tx_params)
+
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, tx_params=tx_params)
+
 
 class MultiInputMultiOutputMethod(
     ContractMethod
@@ -744,6 +1003,22 @@ class MultiInputMultiOutputMethod(
             returned[2],
         )
 
+    async def call_async(
+        self,
+        index_0: int,
+        index_1: Union[bytes, str],
+        index_2: str,
+        tx_params: Optional[TxParams] = None,
+    ) -> Tuple[Union[bytes, str], Union[bytes, str], str]:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(
+            self.call, index_0, index_1, index_2, tx_params=tx_params
+        )
+
     def estimate_gas(
         self,
         index_0: int,
@@ -760,6 +1035,22 @@ class MultiInputMultiOutputMethod(
             tx_params.as_dict()
         )
 
+    async def estimate_gas_async(
+        self,
+        index_0: int,
+        index_1: Union[bytes, str],
+        index_2: str,
+        tx_params: Optional[TxParams] = None,
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(
+            self.estimate_gas, index_0, index_1, index_2, tx_params=tx_params
+        )
+
 
 class NestedStructInputMethod(ContractMethod):  # pylint: disable=invalid-name
     """Various interfaces to the nestedStructInput method."""
@@ -796,6 +1087,16 @@ class NestedStructInputMethod(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(n).call(tx_params.as_dict())
 
+    async def call_async(
+        self, n: AbiGenDummyNestedStruct, tx_params: Optional[TxParams] = None
+    ) -> None:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, n, tx_params=tx_params)
+
     def estimate_gas(
         self, n: AbiGenDummyNestedStruct, tx_params: Optional[TxParams] = None
     ) -> int:
@@ -804,6 +1105,16 @@ class NestedStructInputMethod(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(n).estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, n: AbiGenDummyNestedStruct, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, n, tx_params=tx_params)
+
 
 class NestedStructOutputMethod(ContractMethod):  # pylint: disable=invalid-name
     """Various interfaces to the nestedStructOutput method."""
@@ -832,11 +1143,31 @@ class NestedStructOutputMethod(ContractMethod):  # pylint: disable=invalid-name
             innerStruct=returned[0], description=returned[1],
         )
 
+    async def call_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> AbiGenDummyNestedStruct:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, tx_params=tx_params)
+
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, tx_params=tx_params)
+
 
 class NoInputNoOutputMethod(ContractMethod):  # pylint: disable=invalid-name
     """Various interfaces to the noInputNoOutput method."""
@@ -862,11 +1193,29 @@ class NoInputNoOutputMethod(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method().call(tx_params.as_dict())
 
+    async def call_async(self, tx_params: Optional[TxParams] = None) -> None:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, tx_params=tx_params)
+
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, tx_params=tx_params)
+
 
 class NoInputSimpleOutputMethod(
     ContractMethod
@@ -895,11 +1244,29 @@ class NoInputSimpleOutputMethod(
         returned = self._underlying_method().call(tx_params.as_dict())
         return int(returned)
 
+    async def call_async(self, tx_params: Optional[TxParams] = None) -> int:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, tx_params=tx_params)
+
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, tx_params=tx_params)
+
 
 class NonPureMethodMethod(ContractMethod):  # pylint: disable=invalid-name
     """Various interfaces to the nonPureMethod method."""
@@ -924,6 +1291,14 @@ class NonPureMethodMethod(ContractMethod):  # pylint: disable=invalid-name
         returned = self._underlying_method().call(tx_params.as_dict())
         return int(returned)
 
+    async def call_async(self, tx_params: Optional[TxParams] = None) -> int:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, tx_params=tx_params)
+
     def send_transaction(
         self, tx_params: Optional[TxParams] = None
     ) -> Union[HexBytes, bytes]:
@@ -934,16 +1309,50 @@ class NonPureMethodMethod(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().transact(tx_params.as_dict())
 
+    async def send_transaction_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> Union[HexBytes, bytes]:
+        """Execute underlying contract method via eth_sendTransaction, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`send_transaction`.
+        """
+        return await self._run_async(
+            self.send_transaction, tx_params=tx_params
+        )
+
     def build_transaction(self, tx_params: Optional[TxParams] = None) -> dict:
         """Construct calldata to be used as input to the method."""
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().buildTransaction(tx_params.as_dict())
 
+    async def build_transaction_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> dict:
+        """Construct calldata to be used as input to the method, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`build_transaction`.
+        """
+        return await self._run_async(
+            self.build_transaction, tx_params=tx_params
+        )
+
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, tx_params=tx_params)
+
 
 class NonPureMethodThatReturnsNothingMethod(
     ContractMethod
@@ -969,6 +1378,14 @@ class NonPureMethodThatReturnsNothingMethod(
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method().call(tx_params.as_dict())
 
+    async def call_async(self, tx_params: Optional[TxParams] = None) -> None:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, tx_params=tx_params)
+
     def send_transaction(
         self, tx_params: Optional[TxParams] = None
     ) -> Union[HexBytes, bytes]:
@@ -979,16 +1396,50 @@ class NonPureMethodThatReturnsNothingMethod(
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().transact(tx_params.as_dict())
 
+    async def send_transaction_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> Union[HexBytes, bytes]:
+        """Execute underlying contract method via eth_sendTransaction, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`send_transaction`.
+        """
+        return await self._run_async(
+            self.send_transaction, tx_params=tx_params
+        )
+
     def build_transaction(self, tx_params: Optional[TxParams] = None) -> dict:
         """Construct calldata to be used as input to the method."""
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().buildTransaction(tx_params.as_dict())
 
+    async def build_transaction_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> dict:
+        """Construct calldata to be used as input to the method, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`build_transaction`.
+        """
+        return await self._run_async(
+            self.build_transaction, tx_params=tx_params
+        )
+
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, tx_params=tx_params)
+
 
 class OverloadedMethod2Method(ContractMethod):  # pylint: disable=invalid-name
     """Various interfaces to the overloadedMethod method."""
@@ -1023,6 +1474,16 @@ class OverloadedMethod2Method(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(a).call(tx_params.as_dict())
 
+    async def call_async(
+        self, a: str, tx_params: Optional[TxParams] = None
+    ) -> None:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, a, tx_params=tx_params)
+
     def estimate_gas(
         self, a: str, tx_params: Optional[TxParams] = None
     ) -> int:
@@ -1031,6 +1492,16 @@ class OverloadedMethod2Method(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(a).estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, a: str, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, a, tx_params=tx_params)
+
 
 class OverloadedMethod1Method(ContractMethod):  # pylint: disable=invalid-name
     """Various interfaces to the overloadedMethod method."""
@@ -1065,6 +1536,16 @@ class OverloadedMethod1Method(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(a).call(tx_params.as_dict())
 
+    async def call_async(
+        self, a: int, tx_params: Optional[TxParams] = None
+    ) -> None:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, a, tx_params=tx_params)
+
     def estimate_gas(
         self, a: int, tx_params: Optional[TxParams] = None
     ) -> int:
@@ -1073,6 +1554,16 @@ class OverloadedMethod1Method(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(a).estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, a: int, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, a, tx_params=tx_params)
+
 
 class PureFunctionWithConstantMethod(
     ContractMethod
@@ -1099,11 +1590,29 @@ class PureFunctionWithConstantMethod(
         returned = self._underlying_method().call(tx_params.as_dict())
         return int(returned)
 
+    async def call_async(self, tx_params: Optional[TxParams] = None) -> int:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, tx_params=tx_params)
+
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, tx_params=tx_params)
+
 
 class RequireWithConstantMethod(
     ContractMethod
@@ -1129,11 +1638,29 @@ class RequireWithConstantMethod(
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method().call(tx_params.as_dict())
 
+    async def call_async(self, tx_params: Optional[TxParams] = None) -> None:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, tx_params=tx_params)
+
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, tx_params=tx_params)
+
 
 class RevertWithConstantMethod(ContractMethod):  # pylint: disable=invalid-name
     """Various interfaces to the revertWithConstant method."""
@@ -1157,11 +1684,29 @@ class RevertWithConstantMethod(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method().call(tx_params.as_dict())
 
+    async def call_async(self, tx_params: Optional[TxParams] = None) -> None:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, tx_params=tx_params)
+
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, tx_params=tx_params)
+
 
 class SimpleInputNoOutputMethod(
     ContractMethod
@@ -1202,6 +1747,16 @@ class SimpleInputNoOutputMethod(
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(index_0).call(tx_params.as_dict())
 
+    async def call_async(
+        self, index_0: int, tx_params: Optional[TxParams] = None
+    ) -> None:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, index_0, tx_params=tx_params)
+
     def estimate_gas(
         self, index_0: int, tx_params: Optional[TxParams] = None
     ) -> int:
@@ -1212,6 +1767,18 @@ class SimpleInputNoOutputMethod(
             tx_params.as_dict()
         )
 
+    async def estimate_gas_async(
+        self, index_0: int, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(
+            self.estimate_gas, index_0, tx_params=tx_params
+        )
+
 
 class SimpleInputSimpleOutputMethod(
     ContractMethod
@@ -1253,6 +1820,16 @@ class SimpleInputSimpleOutputMethod(
         returned = self._underlying_method(index_0).call(tx_params.as_dict())
         return int(returned)
 
+    async def call_async(
+        self, index_0: int, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, index_0, tx_params=tx_params)
+
     def estimate_gas(
         self, index_0: int, tx_params: Optional[TxParams] = None
     ) -> int:
@@ -1263,6 +1840,18 @@ class SimpleInputSimpleOutputMethod(
             tx_params.as_dict()
         )
 
+    async def estimate_gas_async(
+        self, index_0: int, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(
+            self.estimate_gas, index_0, tx_params=tx_params
+        )
+
 
 class SimplePureFunctionMethod(ContractMethod):  # pylint: disable=invalid-name
     """Various interfaces to the simplePureFunction method."""
@@ -1287,11 +1876,29 @@ class SimplePureFunctionMethod(ContractMethod):  # pylint: disable=invalid-name
         returned = self._underlying_method().call(tx_params.as_dict())
         return int(returned)
 
+    async def call_async(self, tx_params: Optional[TxParams] = None) -> int:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, tx_params=tx_params)
+
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, tx_params=tx_params)
+
 
 class SimplePureFunctionWithInputMethod(
     ContractMethod
@@ -1331,6 +1938,16 @@ class SimplePureFunctionWithInputMethod(
         returned = self._underlying_method(x).call(tx_params.as_dict())
         return int(returned)
 
+    async def call_async(
+        self, x: int, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, x, tx_params=tx_params)
+
     def estimate_gas(
         self, x: int, tx_params: Optional[TxParams] = None
     ) -> int:
@@ -1339,6 +1956,16 @@ class SimplePureFunctionWithInputMethod(
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(x).estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, x: int, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, x, tx_params=tx_params)
+
 
 class SimpleRequireMethod(ContractMethod):  # pylint: disable=invalid-name
     """Various interfaces to the simpleRequire method."""
@@ -1362,11 +1989,29 @@ class SimpleRequireMethod(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method().call(tx_params.as_dict())
 
+    async def call_async(self, tx_params: Optional[TxParams] = None) -> None:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, tx_params=tx_params)
+
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, tx_params=tx_params)
+
 
 class SimpleRevertMethod(ContractMethod):  # pylint: disable=invalid-name
     """Various interfaces to the simpleRevert method."""
@@ -1390,11 +2035,29 @@ class SimpleRevertMethod(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method().call(tx_params.as_dict())
 
+    async def call_async(self, tx_params: Optional[TxParams] = None) -> None:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, tx_params=tx_params)
+
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, tx_params=tx_params)
+
 
 class StructInputMethod(ContractMethod):  # pylint: disable=invalid-name
     """Various interfaces to the structInput method."""
@@ -1429,6 +2092,16 @@ class StructInputMethod(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(s).call(tx_params.as_dict())
 
+    async def call_async(
+        self, s: AbiGenDummyStruct, tx_params: Optional[TxParams] = None
+    ) -> None:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, s, tx_params=tx_params)
+
     def estimate_gas(
         self, s: AbiGenDummyStruct, tx_params: Optional[TxParams] = None
     ) -> int:
@@ -1437,6 +2110,16 @@ class StructInputMethod(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(s).estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, s: AbiGenDummyStruct, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, s, tx_params=tx_params)
+
 
 class StructOutputMethod(ContractMethod):  # pylint: disable=invalid-name
     """Various interfaces to the structOutput method."""
@@ -1468,11 +2151,31 @@ class StructOutputMethod(ContractMethod):  # pylint: disable=invalid-name
             aString=returned[3],
         )
 
+    async def call_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> AbiGenDummyStruct:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, tx_params=tx_params)
+
     def estimate_gas(self, tx_params: Optional[TxParams] = None) -> int:
         """Estimate gas consumption of method call."""
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method().estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, tx_params=tx_params)
+
 
 class WithAddressInputMethod(ContractMethod):  # pylint: disable=invalid-name
     """Various interfaces to the withAddressInput method."""
@@ -1548,6 +2251,24 @@ class WithAddressInputMethod(ContractMethod):  # pylint: disable=invalid-name
         )
         return str(returned)
 
+    async def call_async(
+        self,
+        x: str,
+        a: int,
+        b: int,
+        y: str,
+        c: int,
+        tx_params: Optional[TxParams] = None,
+    ) -> str:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(
+            self.call, x, a, b, y, c, tx_params=tx_params
+        )
+
     def estimate_gas(
         self,
         x: str,
@@ -1564,6 +2285,24 @@ class WithAddressInputMethod(ContractMethod):  # pylint: disable=invalid-name
             tx_params.as_dict()
         )
 
+    async def estimate_gas_async(
+        self,
+        x: str,
+        a: int,
+        b: int,
+        y: str,
+        c: int,
+        tx_params: Optional[TxParams] = None,
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(
+            self.estimate_gas, x, a, b, y, c, tx_params=tx_params
+        )
+
 
 class WithdrawMethod(ContractMethod):  # pylint: disable=invalid-name
     """Various interfaces to the withdraw method."""
@@ -1598,6 +2337,16 @@ class WithdrawMethod(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         self._underlying_method(wad).call(tx_params.as_dict())
 
+    async def call_async(
+        self, wad: int, tx_params: Optional[TxParams] = None
+    ) -> None:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, wad, tx_params=tx_params)
+
     def send_transaction(
         self, wad: int, tx_params: Optional[TxParams] = None
     ) -> Union[HexBytes, bytes]:
@@ -1609,6 +2358,18 @@ class WithdrawMethod(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(wad).transact(tx_params.as_dict())
 
+    async def send_transaction_async(
+        self, wad: int, tx_params: Optional[TxParams] = None
+    ) -> Union[HexBytes, bytes]:
+        """Execute underlying contract method via eth_sendTransaction, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`send_transaction`.
+        """
+        return await self._run_async(
+            self.send_transaction, wad, tx_params=tx_params
+        )
+
     def build_transaction(
         self, wad: int, tx_params: Optional[TxParams] = None
     ) -> dict:
@@ -1619,6 +2380,18 @@ class WithdrawMethod(ContractMethod):  # pylint: disable=invalid-name
             tx_params.as_dict()
         )
 
+    async def build_transaction_async(
+        self, wad: int, tx_params: Optional[TxParams] = None
+    ) -> dict:
+        """Construct calldata to be used as input to the method, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`build_transaction`.
+        """
+        return await self._run_async(
+            self.build_transaction, wad, tx_params=tx_params
+        )
+
     def estimate_gas(
         self, wad: int, tx_params: Optional[TxParams] = None
     ) -> int:
@@ -1627,9 +2400,21 @@ class WithdrawMethod(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(wad).estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, wad: int, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(
+            self.estimate_gas, wad, tx_params=tx_params
+        )
+
 
 # pylint: disable=too-many-public-methods,too-many-instance-attributes
-class AbiGenDummy:
+class AbiGenDummy(ContractWrapper):
     """Wrapper class for AbiGenDummy Solidity contract.
 
     All method parameters of type `bytes`:code: should be encoded as UTF-8,
@@ -1637,165 +2422,292 @@ class AbiGenDummy:
     """
 
     accepts_an_array_of_bytes: AcceptsAnArrayOfBytesMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`AcceptsAnArrayOfBytesMethod`.
     """
 
     accepts_bytes: AcceptsBytesMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`AcceptsBytesMethod`.
     """
 
     complex_input_complex_output: ComplexInputComplexOutputMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`ComplexInputComplexOutputMethod`.
     """
 
     ecrecover_fn: EcrecoverFnMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`EcrecoverFnMethod`.
     """
 
     emit_simple_event: EmitSimpleEventMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`EmitSimpleEventMethod`.
     """
 
     method_accepting_array_of_array_of_structs: MethodAcceptingArrayOfArrayOfStructsMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`MethodAcceptingArrayOfArrayOfStructsMethod`.
     """
 
     method_accepting_array_of_structs: MethodAcceptingArrayOfStructsMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`MethodAcceptingArrayOfStructsMethod`.
     """
 
     method_returning_array_of_structs: MethodReturningArrayOfStructsMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`MethodReturningArrayOfStructsMethod`.
     """
 
     method_returning_multiple_values: MethodReturningMultipleValuesMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`MethodReturningMultipleValuesMethod`.
     """
 
     method_using_nested_struct_with_inner_struct_not_used_elsewhere: MethodUsingNestedStructWithInnerStructNotUsedElsewhereMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`MethodUsingNestedStructWithInnerStructNotUsedElsewhereMethod`.
     """
 
     multi_input_multi_output: MultiInputMultiOutputMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`MultiInputMultiOutputMethod`.
     """
 
     nested_struct_input: NestedStructInputMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`NestedStructInputMethod`.
     """
 
     nested_struct_output: NestedStructOutputMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`NestedStructOutputMethod`.
     """
 
     no_input_no_output: NoInputNoOutputMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`NoInputNoOutputMethod`.
     """
 
     no_input_simple_output: NoInputSimpleOutputMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`NoInputSimpleOutputMethod`.
     """
 
     non_pure_method: NonPureMethodMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`NonPureMethodMethod`.
     """
 
     non_pure_method_that_returns_nothing: NonPureMethodThatReturnsNothingMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`NonPureMethodThatReturnsNothingMethod`.
     """
 
     overloaded_method2: OverloadedMethod2Method
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`OverloadedMethod2Method`.
     """
 
     overloaded_method1: OverloadedMethod1Method
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`OverloadedMethod1Method`.
     """
 
     pure_function_with_constant: PureFunctionWithConstantMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`PureFunctionWithConstantMethod`.
     """
 
     require_with_constant: RequireWithConstantMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`RequireWithConstantMethod`.
     """
 
     revert_with_constant: RevertWithConstantMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`RevertWithConstantMethod`.
     """
 
     simple_input_no_output: SimpleInputNoOutputMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`SimpleInputNoOutputMethod`.
     """
 
     simple_input_simple_output: SimpleInputSimpleOutputMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`SimpleInputSimpleOutputMethod`.
     """
 
     simple_pure_function: SimplePureFunctionMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`SimplePureFunctionMethod`.
     """
 
     simple_pure_function_with_input: SimplePureFunctionWithInputMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`SimplePureFunctionWithInputMethod`.
     """
 
     simple_require: SimpleRequireMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`SimpleRequireMethod`.
     """
 
     simple_revert: SimpleRevertMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`SimpleRevertMethod`.
     """
 
     struct_input: StructInputMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`StructInputMethod`.
     """
 
     struct_output: StructOutputMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`StructOutputMethod`.
     """
 
     with_address_input: WithAddressInputMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`WithAddressInputMethod`.
     """
 
     withdraw: WithdrawMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`WithdrawMethod`.
     """
 
+    _contract_methods = {
+        "accepts_an_array_of_bytes": (
+            AcceptsAnArrayOfBytesMethod,
+            "acceptsAnArrayOfBytes",
+            True,
+        ),
+        "accepts_bytes": (AcceptsBytesMethod, "acceptsBytes", True),
+        "complex_input_complex_output": (
+            ComplexInputComplexOutputMethod,
+            "complexInputComplexOutput",
+            True,
+        ),
+        "ecrecover_fn": (EcrecoverFnMethod, "ecrecoverFn", True),
+        "emit_simple_event": (EmitSimpleEventMethod, "emitSimpleEvent", False),
+        "method_accepting_array_of_array_of_structs": (
+            MethodAcceptingArrayOfArrayOfStructsMethod,
+            "methodAcceptingArrayOfArrayOfStructs",
+            True,
+        ),
+        "method_accepting_array_of_structs": (
+            MethodAcceptingArrayOfStructsMethod,
+            "methodAcceptingArrayOfStructs",
+            True,
+        ),
+        "method_returning_array_of_structs": (
+            MethodReturningArrayOfStructsMethod,
+            "methodReturningArrayOfStructs",
+            False,
+        ),
+        "method_returning_multiple_values": (
+            MethodReturningMultipleValuesMethod,
+            "methodReturningMultipleValues",
+            False,
+        ),
+        "method_using_nested_struct_with_inner_struct_not_used_elsewhere": (
+            MethodUsingNestedStructWithInnerStructNotUsedElsewhereMethod,
+            "methodUsingNestedStructWithInnerStructNotUsedElsewhere",
+            False,
+        ),
+        "multi_input_multi_output": (
+            MultiInputMultiOutputMethod,
+            "multiInputMultiOutput",
+            True,
+        ),
+        "nested_struct_input": (
+            NestedStructInputMethod,
+            "nestedStructInput",
+            True,
+        ),
+        "nested_struct_output": (
+            NestedStructOutputMethod,
+            "nestedStructOutput",
+            False,
+        ),
+        "no_input_no_output": (
+            NoInputNoOutputMethod,
+            "noInputNoOutput",
+            False,
+        ),
+        "no_input_simple_output": (
+            NoInputSimpleOutputMethod,
+            "noInputSimpleOutput",
+            False,
+        ),
+        "non_pure_method": (NonPureMethodMethod, "nonPureMethod", False),
+        "non_pure_method_that_returns_nothing": (
+            NonPureMethodThatReturnsNothingMethod,
+            "nonPureMethodThatReturnsNothing",
+            False,
+        ),
+        "overloaded_method2": (
+            OverloadedMethod2Method,
+            "overloadedMethod",
+            True,
+        ),
+        "overloaded_method1": (
+            OverloadedMethod1Method,
+            "overloadedMethod",
+            True,
+        ),
+        "pure_function_with_constant": (
+            PureFunctionWithConstantMethod,
+            "pureFunctionWithConstant",
+            False,
+        ),
+        "require_with_constant": (
+            RequireWithConstantMethod,
+            "requireWithConstant",
+            False,
+        ),
+        "revert_with_constant": (
+            RevertWithConstantMethod,
+            "revertWithConstant",
+            False,
+        ),
+        "simple_input_no_output": (
+            SimpleInputNoOutputMethod,
+            "simpleInputNoOutput",
+            True,
+        ),
+        "simple_input_simple_output": (
+            SimpleInputSimpleOutputMethod,
+            "simpleInputSimpleOutput",
+            True,
+        ),
+        "simple_pure_function": (
+            SimplePureFunctionMethod,
+            "simplePureFunction",
+            False,
+        ),
+        "simple_pure_function_with_input": (
+            SimplePureFunctionWithInputMethod,
+            "simplePureFunctionWithInput",
+            True,
+        ),
+        "simple_require": (SimpleRequireMethod, "simpleRequire", False),
+        "simple_revert": (SimpleRevertMethod, "simpleRevert", False),
+        "struct_input": (StructInputMethod, "structInput", True),
+        "struct_output": (StructOutputMethod, "structOutput", False),
+        "with_address_input": (
+            WithAddressInputMethod,
+            "withAddressInput",
+            True,
+        ),
+        "withdraw": (WithdrawMethod, "withdraw", True),
+    }
+
     def __init__(
         self,
         web3_or_provider: Union[Web3, BaseProvider],
@@ -1809,15 +2721,6 @@ class AbiGenDummy:
         :param contract_address: where the contract has been deployed
         :param validator: for validation of method inputs.
         """
-        # pylint: disable=too-many-statements
-
-        self.contract_address = contract_address
-
-        if not validator:
-            validator = AbiGenDummyValidator(
-                web3_or_provider, contract_address
-            )
-
         web3 = None
         if isinstance(web3_or_provider, BaseProvider):
             web3 = Web3(web3_or_provider)
@@ -1846,195 +2749,10 @@ class AbiGenDummy:
                 ):
                     pass
 
-        self._web3_eth = web3.eth
-
-        functions = self._web3_eth.contract(
-            address=to_checksum_address(contract_address),
-            abi=AbiGenDummy.abi(),
-        ).functions
-
-        self.accepts_an_array_of_bytes = AcceptsAnArrayOfBytesMethod(
-            web3_or_provider,
-            contract_address,
-            functions.acceptsAnArrayOfBytes,
-            validator,
-        )
-
-        self.accepts_bytes = AcceptsBytesMethod(
-            web3_or_provider,
-            contract_address,
-            functions.acceptsBytes,
-            validator,
-        )
-
-        self.complex_input_complex_output = ComplexInputComplexOutputMethod(
-            web3_or_provider,
-            contract_address,
-            functions.complexInputComplexOutput,
-            validator,
-        )
-
-        self.ecrecover_fn = EcrecoverFnMethod(
-            web3_or_provider,
-            contract_address,
-            functions.ecrecoverFn,
-            validator,
-        )
-
-        self.emit_simple_event = EmitSimpleEventMethod(
-            web3_or_provider, contract_address, functions.emitSimpleEvent
-        )
-
-        self.method_accepting_array_of_array_of_structs = MethodAcceptingArrayOfArrayOfStructsMethod(
-            web3_or_provider,
-            contract_address,
-            functions.methodAcceptingArrayOfArrayOfStructs,
-            validator,
-        )
-
-        self.method_accepting_array_of_structs = MethodAcceptingArrayOfStructsMethod(
-            web3_or_provider,
-            contract_address,
-            functions.methodAcceptingArrayOfStructs,
-            validator,
-        )
-
-        self.method_returning_array_of_structs = MethodReturningArrayOfStructsMethod(
-            web3_or_provider,
-            contract_address,
-            functions.methodReturningArrayOfStructs,
-        )
-
-        self.method_returning_multiple_values = MethodReturningMultipleValuesMethod(
-            web3_or_provider,
-            contract_address,
-            functions.methodReturningMultipleValues,
-        )
-
-        self.method_using_nested_struct_with_inner_struct_not_used_elsewhere = MethodUsingNestedStructWithInnerStructNotUsedElsewhereMethod(
-            web3_or_provider,
-            contract_address,
-            functions.methodUsingNestedStructWithInnerStructNotUsedElsewhere,
-        )
-
-        self.multi_input_multi_output = MultiInputMultiOutputMethod(
-            web3_or_provider,
-            contract_address,
-            functions.multiInputMultiOutput,
-            validator,
-        )
-
-        self.nested_struct_input = NestedStructInputMethod(
-            web3_or_provider,
-            contract_address,
-            functions.nestedStructInput,
-            validator,
-        )
-
-        self.nested_struct_output = NestedStructOutputMethod(
-            web3_or_provider, contract_address, functions.nestedStructOutput
-        )
-
-        self.no_input_no_output = NoInputNoOutputMethod(
-            web3_or_provider, contract_address, functions.noInputNoOutput
-        )
-
-        self.no_input_simple_output = NoInputSimpleOutputMethod(
-            web3_or_provider, contract_address, functions.noInputSimpleOutput
-        )
-
-        self.non_pure_method = NonPureMethodMethod(
-            web3_or_provider, contract_address, functions.nonPureMethod
-        )
-
-        self.non_pure_method_that_returns_nothing = NonPureMethodThatReturnsNothingMethod(
-            web3_or_provider,
-            contract_address,
-            functions.nonPureMethodThatReturnsNothing,
-        )
-
-        self.overloaded_method2 = OverloadedMethod2Method(
-            web3_or_provider,
-            contract_address,
-            functions.overloadedMethod,
-            validator,
-        )
-
-        self.overloaded_method1 = OverloadedMethod1Method(
-            web3_or_provider,
-            contract_address,
-            functions.overloadedMethod,
-            validator,
-        )
-
-        self.pure_function_with_constant = PureFunctionWithConstantMethod(
-            web3_or_provider,
-            contract_address,
-            functions.pureFunctionWithConstant,
-        )
-
-        self.require_with_constant = RequireWithConstantMethod(
-            web3_or_provider, contract_address, functions.requireWithConstant
-        )
-
-        self.revert_with_constant = RevertWithConstantMethod(
-            web3_or_provider, contract_address, functions.revertWithConstant
-        )
-
-        self.simple_input_no_output = SimpleInputNoOutputMethod(
-            web3_or_provider,
-            contract_address,
-            functions.simpleInputNoOutput,
-            validator,
-        )
-
-        self.simple_input_simple_output = SimpleInputSimpleOutputMethod(
-            web3_or_provider,
-            contract_address,
-            functions.simpleInputSimpleOutput,
-            validator,
-        )
-
-        self.simple_pure_function = SimplePureFunctionMethod(
-            web3_or_provider, contract_address, functions.simplePureFunction
-        )
-
-        self.simple_pure_function_with_input = SimplePureFunctionWithInputMethod(
-            web3_or_provider,
-            contract_address,
-            functions.simplePureFunctionWithInput,
-            validator,
-        )
-
-        self.simple_require = SimpleRequireMethod(
-            web3_or_provider, contract_address, functions.simpleRequire
-        )
-
-        self.simple_revert = SimpleRevertMethod(
-            web3_or_provider, contract_address, functions.simpleRevert
-        )
-
-        self.struct_input = StructInputMethod(
-            web3_or_provider,
-            contract_address,
-            functions.structInput,
-            validator,
-        )
-
-        self.struct_output = StructOutputMethod(
-            web3_or_provider, contract_address, functions.structOutput
-        )
-
-        self.with_address_input = WithAddressInputMethod(
-            web3_or_provider,
-            contract_address,
-            functions.withAddressInput,
-            validator,
-        )
+        if not validator:
+            validator = AbiGenDummyValidator(web3, contract_address)
 
-        self.withdraw = WithdrawMethod(
-            web3_or_provider, contract_address, functions.withdraw, validator
-        )
+        super().__init__(web3, contract_address, validator)
 
     def get_simple_event_event(
         self, tx_hash: Union[HexBytes, bytes]
@@ -2044,14 +2762,7 @@ class AbiGenDummy:
         :param tx_hash: hash of transaction emitting SimpleEvent event
         """
         tx_receipt = self._web3_eth.getTransactionReceipt(tx_hash)
-        return (
-            self._web3_eth.contract(
-                address=to_checksum_address(self.contract_address),
-                abi=AbiGenDummy.abi(),
-            )
-            .events.SimpleEvent()
-            .processReceipt(tx_receipt)
-        )
+        return self._get_event("SimpleEvent").processReceipt(tx_receipt)
 
     def get_withdrawal_event(
         self, tx_hash: Union[HexBytes, bytes]
@@ -2061,14 +2772,7 @@ class AbiGenDummy:
         :param tx_hash: hash of transaction emitting Withdrawal event
         """
         tx_receipt = self._web3_eth.getTransactionReceipt(tx_hash)
-        return (
-            self._web3_eth.contract(
-                address=to_checksum_address(self.contract_address),
-                abi=AbiGenDummy.abi(),
-            )
-            .events.Withdrawal()
-            .processReceipt(tx_receipt)
-        )
+        return self._get_event("Withdrawal").processReceipt(tx_receipt)
 
     @staticmethod
     def abi():
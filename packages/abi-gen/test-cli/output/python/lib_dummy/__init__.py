@@ -11,7 +11,6 @@ from typing import (  # pylint: disable=unused-import
     Union,
 )
 
-from eth_utils import to_checksum_address
 from mypy_extensions import TypedDict  # pylint: disable=unused-import
 from hexbytes import HexBytes
 from web3 import Web3
@@ -19,7 +18,11 @@ from web3.contract import ContractFunction
 from web3.datastructures import AttributeDict
 from web3.providers.base import BaseProvider
 
-from zero_ex.contract_wrappers.bases import ContractMethod, Validator
+from zero_ex.contract_wrappers.bases import (
+    ContractMethod,
+    ContractWrapper,
+    Validator,
+)
 from zero_ex.contract_wrappers.tx_params import TxParams
 
 
@@ -47,9 +50,11 @@ except ImportError:
 
 
 # pylint: disable=too-many-public-methods,too-many-instance-attributes
-class LibDummy:
+class LibDummy(ContractWrapper):
     """Wrapper class for LibDummy Solidity contract."""
 
+    _contract_methods = {}
+
     def __init__(
         self,
         web3_or_provider: Union[Web3, BaseProvider],
@@ -63,13 +68,6 @@ class LibDummy:
         :param contract_address: where the contract has been deployed
         :param validator: for validation of method inputs.
         """
-        # pylint: disable=too-many-statements
-
-        self.contract_address = contract_address
-
-        if not validator:
-            validator = LibDummyValidator(web3_or_provider, contract_address)
-
         web3 = None
         if isinstance(web3_or_provider, BaseProvider):
             web3 = Web3(web3_or_provider)
@@ -98,7 +96,10 @@ class LibDummy:
                 ):
                     pass
 
-        self._web3_eth = web3.eth
+        if not validator:
+            validator = LibDummyValidator(web3, contract_address)
+
+        super().__init__(web3, contract_address, validator)
 
     @staticmethod
     def abi():
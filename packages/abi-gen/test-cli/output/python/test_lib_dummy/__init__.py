@@ -11,7 +11,6 @@ from typing import (  # pylint: disable=unused-import
     Union,
 )
 
-from eth_utils import to_checksum_address
 from mypy_extensions import TypedDict  # pylint: disable=unused-import
 from hexbytes import HexBytes
 from web3 import Web3
@@ -19,7 +18,11 @@ from web3.contract import ContractFunction
 from web3.datastructures import AttributeDict
 from web3.providers.base import BaseProvider
 
-from zero_ex.contract_wrappers.bases import ContractMethod, Validator
+from zero_ex.contract_wrappers.bases import (
+    ContractMethod,
+    ContractWrapper,
+    Validator,
+)
 from zero_ex.contract_wrappers.tx_params import TxParams
 
 
@@ -82,6 +85,16 @@ class PublicAddConstantMethod(ContractMethod):  # pylint: disable=invalid-name
         returned = self._underlying_method(x).call(tx_params.as_dict())
         return int(returned)
 
+    async def call_async(
+        self, x: int, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, x, tx_params=tx_params)
+
     def estimate_gas(
         self, x: int, tx_params: Optional[TxParams] = None
     ) -> int:
@@ -90,6 +103,16 @@ class PublicAddConstantMethod(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(x).estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, x: int, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, x, tx_params=tx_params)
+
 
 class PublicAddOneMethod(ContractMethod):  # pylint: disable=invalid-name
     """Various interfaces to the publicAddOne method."""
@@ -125,6 +148,16 @@ class PublicAddOneMethod(ContractMethod):  # pylint: disable=invalid-name
         returned = self._underlying_method(x).call(tx_params.as_dict())
         return int(returned)
 
+    async def call_async(
+        self, x: int, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Execute underlying contract method via eth_call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`call`.
+        """
+        return await self._run_async(self.call, x, tx_params=tx_params)
+
     def estimate_gas(
         self, x: int, tx_params: Optional[TxParams] = None
     ) -> int:
@@ -133,21 +166,40 @@ class PublicAddOneMethod(ContractMethod):  # pylint: disable=invalid-name
         tx_params = super().normalize_tx_params(tx_params)
         return self._underlying_method(x).estimateGas(tx_params.as_dict())
 
+    async def estimate_gas_async(
+        self, x: int, tx_params: Optional[TxParams] = None
+    ) -> int:
+        """Estimate gas consumption of method call, without blocking.
+
+        Takes the same arguments, and returns the same value, as
+        :meth:`estimate_gas`.
+        """
+        return await self._run_async(self.estimate_gas, x, tx_params=tx_params)
+
 
 # pylint: disable=too-many-public-methods,too-many-instance-attributes
-class TestLibDummy:
+class TestLibDummy(ContractWrapper):
     """Wrapper class for TestLibDummy Solidity contract."""
 
     public_add_constant: PublicAddConstantMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`PublicAddConstantMethod`.
     """
 
     public_add_one: PublicAddOneMethod
-    """Constructor-initialized instance of
+    """Lazily-initialized instance of
     :class:`PublicAddOneMethod`.
     """
 
+    _contract_methods = {
+        "public_add_constant": (
+            PublicAddConstantMethod,
+            "publicAddConstant",
+            True,
+        ),
+        "public_add_one": (PublicAddOneMethod, "publicAddOne", True),
+    }
+
     def __init__(
         self,
         web3_or_provider: Union[Web3, BaseProvider],
@@ -161,15 +213,6 @@ class TestLibDummy:
         :param contract_address: where the contract has been deployed
         :param validator: for validation of method inputs.
         """
-        # pylint: disable=too-many-statements
-
-        self.contract_address = contract_address
-
-        if not validator:
-            validator = TestLibDummyValidator(
-                web3_or_provider, contract_address
-            )
-
         web3 = None
         if isinstance(web3_or_provider, BaseProvider):
             web3 = Web3(web3_or_provider)
@@ -198,26 +241,10 @@ class TestLibDummy:
                 ):
                     pass
 
-        self._web3_eth = web3.eth
-
-        functions = self._web3_eth.contract(
-            address=to_checksum_address(contract_address),
-            abi=TestLibDummy.abi(),
-        ).functions
-
-        self.public_add_constant = PublicAddConstantMethod(
-            web3_or_provider,
-            contract_address,
-            functions.publicAddConstant,
-            validator,
-        )
+        if not validator:
+            validator = TestLibDummyValidator(web3, contract_address)
 
-        self.public_add_one = PublicAddOneMethod(
-            web3_or_provider,
-            contract_address,
-            functions.publicAddOne,
-            validator,
-        )
+        super().__init__(web3, contract_address, validator)
 
     @staticmethod
     def abi():
@@ -208,6 +208,7 @@ setup(
         "0x-contract-artifacts",
         "0x-json-schemas",
         "0x-order-utils",
+        "aiohttp",
         "web3",
         "attrs",
         "eth_utils",
@@ -0,0 +1,162 @@
+"""Make contract calls and transactions without blocking an event loop.
+
+Every generated contract method has awaitable counterparts of its
+blocking interfaces: `call_async()`:code:, `estimate_gas_async()`:code:
+and, for methods which aren't constant, `send_transaction_async()`:code:
+and `build_transaction_async()`:code:.  They take the same arguments, and
+return the same values, as their blocking counterparts::
+
+    balances = await asyncio.gather(
+        *(erc20_token.balance_of.call_async(owner) for owner in owners)
+    )
+
+Requests to an :class:`web3.HTTPProvider`'s endpoint are made through one
+`aiohttp`:code: session per event loop, so that concurrent requests share a
+pool of at most `CONNECTION_LIMIT`:code: connections, and any number of
+them may be awaited at once.  Requests to other providers are made in the
+event loop's default executor.
+
+The arguments are validated, and the requests encoded, by the same code as
+for the blocking interfaces.  The first time that code needs an answer from
+the node, it is stopped, and the request is sent asynchronously.  Then the
+code is run again, handing it the answers to the requests it has made so
+far, until it needs no more.  The chain id, which web3's validation
+middleware asks for before every call, is asked for once per
+:class:`web3.Web3` instance.
+
+So a call making N requests is run N + 1 times, and the work it does
+before each request, such as validating and encoding its arguments, is
+done again on every run: it costs O(N²) in all.  A `call()`:code: or
+`estimate_gas()`:code: makes one request once the chain id is known, and a
+`send_transaction()`:code: a few, for which that's cheap, but a function
+making many requests is better run in an executor.
+"""
+
+import asyncio
+from itertools import count
+import json
+from typing import Any, Callable, Dict
+from weakref import WeakKeyDictionary
+
+from aiohttp import ClientSession, TCPConnector
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+from .batch import _install_middleware, _RequestRecorded, _state
+
+CONNECTION_LIMIT = 100
+"""The most connections open at once through each event loop's session.
+
+Takes effect for sessions opened after it's changed.
+"""
+
+_sessions: "WeakKeyDictionary[asyncio.AbstractEventLoop, ClientSession]" = (
+    WeakKeyDictionary()
+)
+
+_chain_ids: "WeakKeyDictionary[Web3, Dict[str, Any]]" = WeakKeyDictionary()
+"""The response to eth_chainId, for each Web3 instance."""
+
+_request_ids = count()
+
+
+def _get_session() -> ClientSession:
+    """Get the session of the running event loop, opening it if need be."""
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        session = ClientSession(connector=TCPConnector(limit=CONNECTION_LIMIT))
+        _sessions[loop] = session
+    return session
+
+
+async def close_session():
+    """Close the connections opened through the running event loop.
+
+    Call it before the event loop is closed, to avoid warnings about an
+    unclosed session.
+    """
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+async def _make_request(
+    provider: BaseProvider, method: str, params: Any
+) -> Dict[str, Any]:
+    """Send a JSON-RPC request to `provider`:code:, and get its response."""
+    if not isinstance(provider, Web3.HTTPProvider):
+        return await asyncio.get_running_loop().run_in_executor(
+            None, provider.make_request, method, params
+        )
+
+    payload = {
+        "jsonrpc": "2.0",
+        "method": method,
+        "params": params,
+        "id": next(_request_ids),
+    }
+    async with _get_session().post(
+        provider.endpoint_uri,
+        data=json.dumps(payload),
+        headers=provider.get_request_kwargs().get("headers"),
+    ) as response:
+        response.raise_for_status()
+        return json.loads(await response.read())
+
+
+class _Script:
+    """The responses had so far to the requests of a call."""
+
+    def __init__(self):
+        """Start with no responses."""
+        self._responses: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _key(method: str, params: Any) -> str:
+        return json.dumps([method, params], sort_keys=True, default=str)
+
+    def add(self, method: str, params: Any, response: Dict[str, Any]):
+        """Remember the response to a request."""
+        self._responses[self._key(method, params)] = response
+
+    def answer(self, web3: Web3, method: str, params: Any):
+        """Get the response to a request, if it has been had."""
+        if method == "eth_chainId" and web3 in _chain_ids:
+            return _chain_ids[web3]
+        try:
+            return self._responses[self._key(method, params)]
+        except KeyError:
+            raise _RequestRecorded(web3.provider, method, params) from None
+
+
+async def run_async(web3: Web3, function: Callable, *args, **kwargs) -> Any:
+    """Evaluate `function(*args, **kwargs)`:code: without blocking.
+
+    :param web3: the instance of :class:`web3.Web3` through which
+        `function`:code: makes its requests to the node.
+    :param function: a function making requests to the node through
+        `web3`:code: and nothing else that blocks, typically the
+        `call()`:code: of a contract method.
+    :returns: what `function`:code: returns.
+    """
+    _install_middleware(web3)
+    script = _Script()
+    while True:
+        _state.script = script
+        try:
+            return function(*args, **kwargs)
+        except _RequestRecorded as request:
+            (provider, method, params) = (
+                request.provider,
+                request.method,
+                request.params,
+            )
+        finally:
+            _state.script = None
+
+        response = await _make_request(provider, method, params)
+        if method == "eth_chainId" and "error" not in response:
+            _chain_ids[web3] = response
+        else:
+            script.add(method, params, response)
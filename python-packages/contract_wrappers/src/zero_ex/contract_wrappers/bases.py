@@ -1,11 +1,32 @@
 """Base wrapper class for accessing ethereum smart contracts."""
 
-from typing import Any, Union
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from time import monotonic
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
-from eth_utils import is_address, to_checksum_address
+from eth_utils import event_abi_to_log_topic, is_address, to_checksum_address
+from hexbytes import HexBytes
 from web3 import Web3
+from web3._utils.events import get_event_data
+from web3.contract import Contract
+from web3.datastructures import AttributeDict
+from web3.exceptions import InvalidEventABI, LogTopicError, MismatchedABI
 from web3.providers.base import BaseProvider
 
+from .async_calls import run_async
+from .batch import DeferrableCall
 from .tx_params import TxParams
 
 
@@ -31,6 +52,57 @@ class Validator:
         """
 
 
+@lru_cache(maxsize=4096)
+def _validate_and_checksum_address(address: str) -> str:
+    if not is_address(address):
+        raise TypeError("Invalid address provided: {}".format(address))
+    return to_checksum_address(address)
+
+
+class AccountCache:
+    """The default account of a node, remembered to save repeated lookups.
+
+    Transactions and calls without a sender are sent from the first account
+    reported by the node.  Rather than asking the node for its accounts
+    every time, the answer is kept until :meth:`invalidate` is called, or
+    until it is older than `ttl`:code:.
+
+    :param ttl: Number of seconds after which the account is looked up
+        again, or None (the default) to keep it until invalidated.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        """Initialize an empty cache."""
+        self.ttl = ttl
+        self._account: Optional[str] = None
+        self._fetched_at: Optional[float] = None
+
+    def get_account(self, web3_eth: Any) -> Optional[str]:
+        """Get the checksummed default account of the node behind `web3_eth`.
+
+        :param web3_eth: the `eth`:code: module of a :class:`web3.Web3`
+            instance, used to look up the account when needed.
+        :returns: the address of the node's first account, or None if it
+            has none.
+        """
+        now = monotonic()
+        if self._fetched_at is None or (
+            self.ttl is not None and now - self._fetched_at >= self.ttl
+        ):
+            accounts = web3_eth.accounts
+            self._account = (
+                _validate_and_checksum_address(accounts[0])
+                if accounts
+                else None
+            )
+            self._fetched_at = now
+        return self._account
+
+    def invalidate(self):
+        """Forget the account, so that the next use looks it up again."""
+        self._fetched_at = None
+
+
 class ContractMethod:
     """Base class for wrapping an Ethereum smart contract method."""
 
@@ -57,17 +129,32 @@ class ContractMethod:
                 + " Web3 or BaseProvider"
             )
 
+        self._web3 = web3
         self._web3_eth = web3.eth  # pylint: disable=no-member
+        call = getattr(self, "call", None)
+        if call is not None:
+            # shadow the subclass's call() with one that can also be deferred
+            setattr(self, "call", DeferrableCall(web3, call))
         if validator is None:
             validator = Validator(web3_or_provider, contract_address)
         self.validator = validator
+        self.account_cache = AccountCache()
+        """Where the node's default account is remembered.  Shared by all
+        the methods of a :class:`ContractWrapper`.
+        """
+
+    async def _run_async(self, function: Callable, *args, **kwargs) -> Any:
+        """Evaluate `function(*args, **kwargs)`:code: without blocking.
+
+        :param function: one of the blocking interfaces to the method, such
+            as :code:`self.call`.
+        """
+        return await run_async(self._web3, function, *args, **kwargs)
 
     @staticmethod
     def validate_and_checksum_address(address: str):
         """Validate the given address, and return it's checksum address."""
-        if not is_address(address):
-            raise TypeError("Invalid address provided: {}".format(address))
-        return to_checksum_address(address)
+        return _validate_and_checksum_address(address)
 
     def normalize_tx_params(self, tx_params) -> TxParams:
         """Normalize and return the given transaction parameters."""
@@ -75,12 +162,163 @@ class ContractMethod:
             tx_params = TxParams()
         if not tx_params.from_:
             tx_params.from_ = self._web3_eth.defaultAccount or (
-                self._web3_eth.accounts[0]
-                if len(self._web3_eth.accounts) > 0
-                else None
+                self.account_cache.get_account(self._web3_eth)
             )
         if tx_params.from_:
             tx_params.from_ = self.validate_and_checksum_address(
                 tx_params.from_
             )
         return tx_params
+
+
+class ContractWrapper(ABC):
+    """Base class for wrapping a whole Ethereum smart contract.
+
+    The :class:`ContractMethod` instances for the contract's methods are only
+    constructed the first time each of them is accessed, and they all share
+    the wrapper's :class:`web3.Web3` instance and :class:`AccountCache`.
+    """
+
+    _contract_methods: Dict[str, Tuple[Type[ContractMethod], str, bool]] = {}
+    """The attribute name of each of the contract's methods, mapped to the
+    class wrapping it, the name of the method in the ABI, and whether that
+    class takes a validator.
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        contract_address: str,
+        validator: Validator,
+    ):
+        """Persist instance data.
+
+        :param web3: Instance of :class:`web3.Web3`, shared by all methods.
+        :param contract_address: Where the contract has been deployed to.
+        :param validator: Used to validate method inputs.
+        """
+        self.contract_address = contract_address
+        self._web3 = web3
+        self._web3_eth = web3.eth  # pylint: disable=no-member
+        self._validator = validator
+        self._lazily_built: Dict[Any, Any] = {}
+        """The web3 contract object, its events, and the ABIs of its events
+        by topic, each built the first time it's needed.
+        """
+        self.account_cache = AccountCache()
+        """Where the node's default account is remembered.  Set its
+        `ttl`:code: to have the account looked up again periodically, or call
+        its `invalidate()`:code: after the node's accounts change.
+        """
+
+    @staticmethod
+    @abstractmethod
+    def abi():
+        """Return the ABI to the underlying contract."""
+
+    def __getattr__(self, name: str):
+        """Construct the wrapper for a contract method on first access."""
+        try:
+            (method_class, function_name, takes_validator,) = type(
+                self
+            )._contract_methods[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from None
+
+        args = [
+            self._web3,
+            self.contract_address,
+            getattr(self._get_contract().functions, function_name),
+        ]
+        if takes_validator:
+            args.append(self._validator)
+
+        method = method_class(*args)  # type: ignore
+        method.account_cache = self.account_cache
+        setattr(self, name, method)
+        return method
+
+    def _get_contract(self) -> Contract:
+        """Get the web3 contract object, parsing the ABI on first use."""
+        if "contract" not in self._lazily_built:
+            self._lazily_built["contract"] = self._web3_eth.contract(
+                address=to_checksum_address(self.contract_address),
+                abi=self.abi(),
+            )
+        return self._lazily_built["contract"]
+
+    def _get_event(self, event_name: str) -> Any:
+        """Get the web3 object for one of the contract's events."""
+        key = ("event", event_name)
+        if key not in self._lazily_built:
+            self._lazily_built[key] = getattr(
+                self._get_contract().events, event_name
+            )()
+        return self._lazily_built[key]
+
+    def _get_event_abis_by_topic(self) -> Dict[bytes, dict]:
+        """Index the ABIs of the contract's events by their first topic."""
+        if "event_abis_by_topic" not in self._lazily_built:
+            self._lazily_built["event_abis_by_topic"] = {
+                bytes(event_abi_to_log_topic(abi)): abi
+                for abi in self._get_contract().abi
+                if abi["type"] == "event" and not abi.get("anonymous")
+            }
+        return self._lazily_built["event_abis_by_topic"]
+
+    def decode_logs(self, logs: Sequence[Any]) -> Tuple[AttributeDict, ...]:
+        """Decode the log entries of the contract's events among `logs`.
+
+        A log entry is decoded whenever its first topic is that of one of
+        the contract's events.  Log entries which don't fit the event's ABI
+        are skipped.
+
+        :param logs: log entries, as found in a transaction receipt or
+            returned by `eth_getLogs`:code:.
+        :returns: the decoded log entries, in order.  The name of the event
+            of each entry is in its `event`:code: field.
+        """
+        event_abis = self._get_event_abis_by_topic()
+        codec = self._web3.codec
+        events = []
+        for log in logs:
+            if not log["topics"]:
+                continue
+            event_abi = event_abis.get(bytes(log["topics"][0]))
+            if event_abi is None:
+                continue
+            try:
+                events.append(get_event_data(codec, event_abi, log))
+            except (MismatchedABI, LogTopicError, InvalidEventABI, TypeError):
+                continue
+        return tuple(events)
+
+    def get_events_from_receipts(
+        self,
+        tx_hashes: Sequence[Union[HexBytes, bytes]],
+        max_workers: Optional[int] = 8,
+    ) -> List[Tuple[AttributeDict, ...]]:
+        """Get the log entries for all of the contract's events.
+
+        The receipts of the transactions are fetched concurrently, and their
+        log entries are decoded with :meth:`decode_logs`.
+
+        :param tx_hashes: hashes of the transactions emitting the events.
+        :param max_workers: the largest number of receipts to fetch at
+            once, or None for the default of
+            :class:`concurrent.futures.ThreadPoolExecutor`.
+        :returns: for each transaction, its decoded log entries, in the
+            order they were emitted.  The name of the event of each entry
+            is in its `event`:code: field.
+        """
+
+        def _get_events(tx_hash) -> Tuple[AttributeDict, ...]:
+            receipt = self._web3_eth.getTransactionReceipt(tx_hash)
+            return self.decode_logs(receipt["logs"])
+
+        if len(tx_hashes) <= 1:
+            return [_get_events(tx_hash) for tx_hash in tx_hashes]
+        with ThreadPoolExecutor(max_workers) as executor:
+            return list(executor.map(_get_events, tx_hashes))
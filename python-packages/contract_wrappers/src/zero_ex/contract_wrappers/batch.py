@@ -0,0 +1,348 @@
+"""Send many contract calls to the node in a single request.
+
+Every `call()`:code: on a contract method normally costs a round trip to the
+node.  When reading the same thing for many accounts, or from many
+contracts, those round trips dominate.  Inside a :func:`batch`, any
+`call()`:code: can instead be deferred, with the same arguments, by calling
+its `defer()`:code:.  Deferring validates the arguments and encodes the
+`eth_call`:code: request straight away, and returns a
+:class:`concurrent.futures.Future`.  When the `with`:code: block exits, all
+the deferred requests are sent to the node as one JSON-RPC batch, and each
+future is resolved with the value that `call()`:code: would have returned,
+or with the exception it would have raised::
+
+    with batch():
+        balances = [
+            erc20_token.balance_of.call.defer(owner) for owner in owners
+        ]
+    print([balance.result() for balance in balances])
+
+Requests to an :class:`web3.HTTPProvider` are sent as a JSON array in a
+single HTTP request.  Other providers don't support batches, so requests to
+them are sent one after the other.
+"""
+
+from concurrent.futures import Future
+import json
+import threading
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from web3 import Web3
+from web3._utils.request import make_post_request
+from web3.providers.base import BaseProvider
+
+_MIDDLEWARE_NAME = "zero_ex_batch"
+
+_middleware_lock = threading.Lock()
+
+_state = threading.local()
+"""What the calling thread is doing with contract calls.
+
+`batches`:code: is the stack of active batches, `recording`:code: is the
+batch currently deferring a call, if any, and `replaying`:code: is the
+batch currently handing a response to a call, if any.  `response`:code: is
+that response, until it has been handed over.  `script`:code: is an object
+answering every request, if any, through its `answer(web3, method,
+params)`:code:, which returns a response or raises
+:class:`_RequestRecorded`.
+"""
+
+
+class _RequestRecorded(Exception):
+    """Raised from the middleware to stop a call at its request."""
+
+    def __init__(self, provider: BaseProvider, method: str, params: Any):
+        super().__init__(method)
+        self.provider = provider
+        self.method = method
+        self.params = params
+
+
+class _DeferredCall(NamedTuple):
+    call: Callable
+    args: tuple
+    kwargs: dict
+    provider: BaseProvider
+    method: str
+    params: Any
+    future: Future
+
+
+def _batch_middleware(make_request, web3):
+    """Return a middleware to record eth_call requests and replay responses.
+
+    While a call is being deferred, its request is captured rather than
+    sent.  When the call is made again with the response to that request
+    at hand, the response is returned rather than asking the node again, so
+    that every middleware further out treats it as usual.  A call made
+    asynchronously is driven the same way, by a script answering all of its
+    requests.
+    """
+    # noqa: D202 (No blank lines allowed after function docstring
+
+    def middleware(method, params):
+        script = getattr(_state, "script", None)
+        if script is not None:
+            return script.answer(web3, method, params)
+        recording = getattr(_state, "recording", None)
+        active_batch = (
+            recording
+            if recording is not None
+            else getattr(_state, "replaying", None)
+        )
+        if active_batch is None:
+            return make_request(method, params)
+        if method == "eth_call":
+            if recording is not None:
+                raise _RequestRecorded(web3.provider, method, params)
+            response, _state.response = _state.response, None
+            if response is not None:
+                return response
+        elif method == "eth_chainId":
+            # web3's validation middleware asks for the chain id before
+            # every eth_call
+            # pylint: disable=protected-access
+            return active_batch._get_chain_id(
+                web3, lambda: make_request(method, params)
+            )
+        return make_request(method, params)
+
+    return middleware
+
+
+def _install_middleware(web3: Web3):
+    """Make the batch middleware the innermost layer of `web3`:code:."""
+    with _middleware_lock:
+        onion = web3.middleware_onion
+        if onion.middlewares[-1][1] == _MIDDLEWARE_NAME:
+            return
+        if _MIDDLEWARE_NAME in onion:
+            onion.remove(_MIDDLEWARE_NAME)
+        onion.inject(_batch_middleware, name=_MIDDLEWARE_NAME, layer=0)
+
+
+def _send_requests(provider: BaseProvider, requests: List[tuple]) -> list:
+    """Send JSON-RPC `requests`:code:, and return their responses in order.
+
+    :param provider: where to send the requests.
+    :param requests: the method and parameters of each request.
+    """
+    if not isinstance(provider, Web3.HTTPProvider):
+        return [
+            provider.make_request(method, params)
+            for (method, params) in requests
+        ]
+
+    payload = [
+        {"jsonrpc": "2.0", "method": method, "params": params, "id": index}
+        for (index, (method, params)) in enumerate(requests)
+    ]
+    responses = json.loads(
+        make_post_request(
+            provider.endpoint_uri,
+            json.dumps(payload).encode("utf-8"),
+            **provider.get_request_kwargs(),
+        )
+    )
+    if not isinstance(responses, list):
+        # the node rejected the batch as a whole
+        raise ValueError(responses.get("error", responses))
+    responses_by_id = {response.get("id"): response for response in responses}
+    return [
+        responses_by_id.get(
+            index,
+            {"error": {"code": -32603, "message": "No response to request"}},
+        )
+        for index in range(len(requests))
+    ]
+
+
+class Batch:
+    """Contract calls to be sent to the node together.
+
+    Rather than constructing one directly, use :func:`batch`.
+
+    :param max_size: the largest number of requests to send in one batch,
+        for nodes that limit it.  None (the default) means no limit.
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        """Initialize an empty batch."""
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._pending: List[_DeferredCall] = []
+        self._chain_ids: Dict[int, Any] = {}
+
+    def __len__(self) -> int:
+        """Get the number of calls waiting to be sent."""
+        return len(self._pending)
+
+    def __enter__(self) -> "Batch":
+        """Make this the batch to which deferred calls are added."""
+        if not hasattr(_state, "batches"):
+            _state.batches = []
+        _state.batches.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Send the deferred calls, unless the block raised an exception.
+
+        If it did, the futures of the deferred calls are cancelled.
+        """
+        _state.batches.remove(self)
+        if exc_type is None:
+            self.flush()
+        else:
+            pending, self._pending = self._pending, []
+            for deferred in pending:
+                deferred.future.cancel()
+
+    def defer(
+        self,
+        web3: Web3,
+        call: Callable,
+        args: tuple = (),
+        kwargs: Optional[dict] = None,
+    ) -> Future:
+        """Add a call to the batch.
+
+        `call(*args, **kwargs)`:code: is evaluated up to the point where it
+        would send an `eth_call`:code: request to the node through `web3`,
+        and then again once the response is in.
+
+        :param web3: the instance of :class:`web3.Web3` which `call`:code:
+            uses.
+        :param call: a function making exactly one `eth_call`:code:
+            request, typically the `call()`:code: of a contract method.
+        :param args: the positional arguments to `call`:code:.
+        :param kwargs: the keyword arguments to `call`:code:.
+        :returns: the future result of the call.
+        """
+        kwargs = kwargs or {}
+        _install_middleware(web3)
+        future: Future = Future()
+        _state.recording = self
+        try:
+            result = call(*args, **kwargs)
+        except _RequestRecorded as request:
+            self._pending.append(
+                _DeferredCall(
+                    call,
+                    args,
+                    kwargs,
+                    request.provider,
+                    request.method,
+                    request.params,
+                    future,
+                )
+            )
+            return future
+        finally:
+            _state.recording = None
+
+        # there was nothing to ask the node
+        future.set_result(result)
+        return future
+
+    def flush(self):
+        """Send the calls deferred so far, and resolve their futures."""
+        pending, self._pending = self._pending, []
+        by_provider: Dict[int, List[_DeferredCall]] = {}
+        for deferred in pending:
+            by_provider.setdefault(id(deferred.provider), []).append(deferred)
+        for calls in by_provider.values():
+            chunk_size = self.max_size or len(calls)
+            for start in range(0, len(calls), chunk_size):
+                self._send(calls[slice(start, start + chunk_size)])
+
+    def _send(self, calls: List[_DeferredCall]):
+        try:
+            responses = self._send_requests(
+                calls[0].provider,
+                [(deferred.method, deferred.params) for deferred in calls],
+            )
+        except Exception as error:  # pylint: disable=broad-except
+            for deferred in calls:
+                deferred.future.set_exception(error)
+            return
+
+        for (deferred, response) in zip(calls, responses):
+            _state.replaying = self
+            _state.response = response
+            try:
+                result = deferred.call(*deferred.args, **deferred.kwargs)
+            except Exception as error:  # pylint: disable=broad-except
+                deferred.future.set_exception(error)
+            else:
+                deferred.future.set_result(result)
+            finally:
+                _state.replaying = None
+                _state.response = None
+
+    def _send_requests(  # pylint: disable=no-self-use
+        self, provider: BaseProvider, requests: List[tuple]
+    ) -> list:
+        """Send JSON-RPC `requests`:code:, and return their responses in order.
+
+        :param provider: where to send the requests.
+        :param requests: the method and parameters of each request.
+        """
+        return _send_requests(provider, requests)
+
+    def _get_chain_id(self, web3: Web3, make_request: Callable) -> Any:
+        """Get the response to eth_chainId for `web3`:code:, asking once."""
+        if id(web3) not in self._chain_ids:
+            self._chain_ids[id(web3)] = make_request()
+        return self._chain_ids[id(web3)]
+
+
+def batch(max_size: Optional[int] = None) -> Batch:
+    """Get a context in which contract calls can be deferred and batched.
+
+    :param max_size: the largest number of requests to send in one batch,
+        for nodes that limit it.  None (the default) means no limit.
+
+    >>> with batch() as calls:
+    ...     len(calls)
+    0
+    """
+    return Batch(max_size)
+
+
+def current_batch() -> Batch:
+    """Get the innermost active :func:`batch` of the calling thread.
+
+    :raises RuntimeError: if there is none.
+    """
+    batches = getattr(_state, "batches", None)
+    if not batches:
+        raise RuntimeError("Calls can only be deferred inside a batch()")
+    return batches[-1]
+
+
+class DeferrableCall:
+    """The `call()`:code: of a contract method, which can also be deferred.
+
+    Calling it calls the method straight away, as usual.
+    """
+
+    def __init__(self, web3: Web3, call: Callable):
+        """Wrap `call`:code:, which uses `web3`:code: to reach the node."""
+        self._web3 = web3
+        self._call = call
+        self.__doc__ = call.__doc__
+        self.__wrapped__ = call
+
+    def __call__(self, *args, **kwargs):
+        """Call the method straight away."""
+        return self._call(*args, **kwargs)
+
+    def defer(self, *args, **kwargs) -> Future:
+        """Call the method as part of the innermost active :func:`batch`.
+
+        Takes the same arguments as calling the method straight away.
+
+        :returns: a future, resolved when the batch is sent.
+        """
+        return current_batch().defer(self._web3, self._call, args, kwargs)
@@ -1,9 +1,76 @@
 """Exception classes common to all wrappers."""
 
+from functools import lru_cache
 from inspect import isclass
-from typing import List
+import re
+from typing import Any, Dict, List, Tuple, Union
 
 from eth_abi import decode_abi
+from web3.exceptions import ContractLogicError
+
+
+@lru_cache(maxsize=None)
+def _abi_types(abi_signature: str) -> Tuple[str, ...]:
+    """Get the types of the parameters in `abi_signature`:code:.
+
+    >>> _abi_types("Error(uint8,bytes32)")
+    ('uint8', 'bytes32')
+    >>> _abi_types("Error()")
+    ()
+    """
+    arguments = abi_signature[
+        slice(abi_signature.index("(") + 1, abi_signature.index(")"))
+    ]
+    return tuple(arguments.split(",")) if arguments else ()
+
+
+_TOO_LARGE = re.compile(
+    "|".join(
+        [
+            "out of gas",
+            "gas limit",
+            "gas required exceeds",
+            "too large",
+            "limit exceeded",
+            "size exceeded",
+            "response size",
+            "timeout",
+            "timed out",
+        ]
+    ),
+    re.IGNORECASE,
+)
+"""What the errors of various nodes say when a call asks too much of them.
+
+The phrases are specific, since other errors mention gas too, eg a sender
+having "insufficient funds for gas".
+"""
+
+
+def _is_too_large(error: Union[Exception, dict]) -> bool:
+    """Tell whether `error`:code: is a node balking at the size of a call.
+
+    `error`:code: is either the exception raised by a call, or the error
+    object of a JSON-RPC response.  A revert is the call's own fault, and is
+    never too large, however much the call is about.
+
+    >>> _is_too_large(ValueError({"code": -32000, "message": "out of gas"}))
+    True
+    >>> _is_too_large({"code": -32000, "message": "request timed out"})
+    True
+    >>> _is_too_large(ContractLogicError("execution reverted"))
+    False
+    >>> _is_too_large(ValueError("insufficient funds for gas * price + value"))
+    False
+    """
+    if isinstance(error, ContractLogicError):
+        return False
+    details: Any = error
+    if isinstance(details, Exception):
+        details = details.args[0] if details.args else None
+    if isinstance(details, dict):
+        details = details.get("message")
+    return bool(_TOO_LARGE.search(str(details)))
 
 
 class RichRevert(Exception):
@@ -13,11 +80,8 @@ class RichRevert(Exception):
         self, abi_signature: str, param_names: List[str], return_data: str
     ):
         """Populate instance variables with decoded return data values."""
-        arg_start_index = abi_signature.index("(") + 1
-        arg_end_index = abi_signature.index(")")
         arguments = decode_abi(
-            abi_signature[arg_start_index:arg_end_index].split(","),
-            bytes.fromhex(return_data[10:]),
+            _abi_types(abi_signature), bytes.fromhex(return_data[10:])
         )
         for (param_name, argument) in zip(param_names, arguments):
             setattr(self, param_name, argument)
@@ -28,6 +92,25 @@ class NoExceptionForSelector(Exception):
     """Indicates that no exception could be found for the given selector."""
 
 
+@lru_cache(maxsize=None)
+def rich_revert_classes(exceptions_module) -> Dict[str, type]:
+    """Index the rich revert exception classes in a module by selector.
+
+    The module is only looked through the first time it is asked about.
+
+    :param exceptions_module: The Python module in which to look for
+        classes with a `selector`:code: attribute.
+    :returns: a dict from each selector, a string of the format
+        '0xffffffff', to the class having it.
+    """
+    classes: Dict[str, type] = {}
+    for name in dir(exceptions_module):
+        value = getattr(exceptions_module, name)
+        if isclass(value) and hasattr(value, "selector"):
+            classes.setdefault(value.selector, value)
+    return classes
+
+
 def exception_class_from_rich_revert_selector(
     selector: str, exceptions_module
 ) -> RichRevert:
@@ -41,40 +124,8 @@ def exception_class_from_rich_revert_selector(
         with a `selector`:code: attribute matching the value of the
         `selector`:code: argument.
     """
-    # noqa: D202 (No blank lines allowed after function docstring
-    def _get_rich_revert_exception_classes():
-        def _exception_name_is_class_with_selector(name: str):
-            if not isclass(getattr(exceptions_module, name)):
-                return False
-
-            try:
-                getattr(exceptions_module, name).selector
-            except AttributeError:
-                return False
-
-            return True
-
-        def _convert_class_name_to_class(name: str):
-            return getattr(exceptions_module, name)
-
-        return list(
-            map(
-                _convert_class_name_to_class,
-                filter(
-                    _exception_name_is_class_with_selector,
-                    dir(exceptions_module),
-                ),
-            )
-        )
-
-    rich_reverts = _get_rich_revert_exception_classes()
-
     try:
-        return next(
-            filter(
-                lambda rich_revert: rich_revert.selector == selector,
-                rich_reverts,
-            )
-        )
-    except StopIteration:
-        raise NoExceptionForSelector(selector)
+        exception_class: Any = rich_revert_classes(exceptions_module)[selector]
+    except (KeyError, TypeError) as error:
+        raise NoExceptionForSelector(selector) from error
+    return exception_class
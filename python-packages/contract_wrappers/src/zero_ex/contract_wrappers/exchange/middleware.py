@@ -1,33 +1,40 @@
 """Web3.py-compatible middleware to be injected upon contract instantiation."""
 
-from zero_ex.contract_wrappers.exceptions import (
-    exception_class_from_rich_revert_selector,
-    NoExceptionForSelector,
-)
+from zero_ex.contract_wrappers.exceptions import rich_revert_classes
 
 from . import exceptions
 
+_EXCEPTIONS_BY_SELECTOR = rich_revert_classes(exceptions)
+
+
+def _looks_like_rich_revert(result) -> bool:
+    """Tell whether `result`:code: could be a selector and ABI-encoded data.
+
+    >>> _looks_like_rich_revert("0x7e5a2318" + "00" * 32)
+    True
+    >>> _looks_like_rich_revert("0x7e5a2318" + "00" * 31)
+    False
+    >>> _looks_like_rich_revert({"to": "0x7e5a2318"})
+    False
+    """
+    return (
+        isinstance(result, str)
+        and len(result) >= 10
+        and (len(result) - 10) % 64 == 0
+        and result.startswith("0x")
+    )
+
 
 def rich_revert_handler(make_request, _):
     """Return a middlware to raise exceptions for rich revert return data."""
     # noqa: D202 (No blank lines allowed after function docstring
     def middleware(method, params):
         response = make_request(method, params)
-        try:
-            raise exception_class_from_rich_revert_selector(
-                response["result"][0:10], exceptions
-            )(response["result"])
-        except NoExceptionForSelector:
-            # response prefix didn't indicate a known error
-            pass
-        except TypeError:
-            # eg "unhashable type: 'slice'". if response["result"] isn't
-            # sliceable (eg if it's a dict), then it definitely isn't a rich
-            # revert.
-            pass
-        except KeyError:
-            # response doesn't have a "result" key
-            pass
+        result = response.get("result")
+        if _looks_like_rich_revert(result):
+            exception_class = _EXCEPTIONS_BY_SELECTOR.get(result[0:10])
+            if exception_class is not None:
+                raise exception_class(result)
         return response
 
     return middleware
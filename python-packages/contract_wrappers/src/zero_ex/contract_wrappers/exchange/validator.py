@@ -1,25 +1,84 @@
 """Validate inputs to the Exchange contract."""
 
-from typing import Any, Union
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union, cast
 
 from web3 import Web3
 from web3.providers.base import BaseProvider
 
-from zero_ex import json_schemas
 from zero_ex.contract_wrappers.order_conversions import order_to_jsdict
 
 from ..bases import Validator
+from .types import Order
+
+
+# Chain id of each node, keyed by the endpoint of its provider, so that it's
+# only requested once per process rather than once per validator.
+_CHAIN_ID_BY_ENDPOINT: Dict[str, int] = {}
+
+
+def _get_chain_id(web3: Web3) -> int:
+    """Get the chain id of the node behind `web3`:code:."""
+    provider = web3.provider
+    endpoint = getattr(provider, "endpoint_uri", None) or getattr(
+        provider, "ipc_path", None
+    )
+    if endpoint is None:
+        return web3.eth.chainId  # pylint: disable=no-member
+    endpoint = str(endpoint)
+    try:
+        return _CHAIN_ID_BY_ENDPOINT[endpoint]
+    except KeyError:
+        chain_id = web3.eth.chainId  # pylint: disable=no-member
+        _CHAIN_ID_BY_ENDPOINT[endpoint] = chain_id
+        return chain_id
+
+
+@lru_cache(maxsize=10000)
+def _assert_valid_order(
+    order_items: Tuple[Tuple[str, type, Any], ...],
+    chain_id: int,
+    exchange_address: str,
+) -> None:
+    """Validate an order, given as a tuple of its names, types and values.
+
+    The type of each value is part of the cache key, since values of
+    different types may compare equal, eg `True == 1`:code: or
+    `1.0 == 1`:code:, while only one of them is valid.
+
+    `order_to_jsdict()`:code: validates the order against the order schema
+    as it converts it.  Only valid orders are remembered by the cache, since
+    invalid ones raise.
+    """
+    order_to_jsdict(
+        cast(Order, {name: value for (name, _, value) in order_items}),
+        chain_id,
+        exchange_address,
+    )
 
 
 class ExchangeValidator(Validator):
-    """Validate inputs to Exchange methods."""
+    """Validate inputs to Exchange methods.
+
+    Orders which have been found valid are remembered, so that validating
+    the same orders again, eg when retrying a transaction, is nearly free.
+    """
 
     def __init__(
         self,
         web3_or_provider: Union[Web3, BaseProvider],
         contract_address: str,
+        chain_id: Optional[int] = None,
     ):
-        """Initialize the class."""
+        """Initialize the class.
+
+        :param web3_or_provider: Either an instance of `web3.Web3`:code: or
+            `web3.providers.base.BaseProvider`:code:
+        :param contract_address: where the contract has been deployed
+        :param chain_id: the id of the chain the contract is deployed on.  If
+            not given, it is requested from the node the first time it's
+            needed, once per node.
+        """
         super().__init__(web3_or_provider, contract_address)
 
         web3 = None
@@ -34,7 +93,15 @@ class ExchangeValidator(Validator):
             )
 
         self.contract_address = contract_address
-        self.chain_id = web3.eth.chainId
+        self._web3 = web3
+        self._chain_id = chain_id
+
+    @property
+    def chain_id(self) -> int:
+        """Get the id of the chain the contract is deployed on."""
+        if self._chain_id is None:
+            self._chain_id = _get_chain_id(self._web3)
+        return self._chain_id
 
     def assert_valid(
         self, method_name: str, parameter_name: str, argument_value: Any
@@ -47,18 +114,22 @@ class ExchangeValidator(Validator):
         :param argument_value: Value of argument to parameter to be validated.
         """
         if parameter_name == "order":
-            json_schemas.assert_valid(
-                order_to_jsdict(
-                    argument_value, self.chain_id, self.contract_address
-                ),
-                "/orderSchema",
-            )
+            self._assert_valid_order(argument_value)
 
         if parameter_name == "orders":
             for order in argument_value:
-                json_schemas.assert_valid(
-                    order_to_jsdict(
-                        order, self.chain_id, self.contract_address
-                    ),
-                    "/orderSchema",
-                )
+                self._assert_valid_order(order)
+
+    def _assert_valid_order(self, order: Any) -> None:
+        order_items = tuple(
+            (name, type(value), value) for (name, value) in order.items()
+        )
+        try:
+            hash(order_items)
+        except TypeError:
+            # some value in the order can't be hashed, so it can't be cached
+            order_to_jsdict(order, self.chain_id, self.contract_address)
+        else:
+            _assert_valid_order(
+                order_items, self.chain_id, self.contract_address
+            )
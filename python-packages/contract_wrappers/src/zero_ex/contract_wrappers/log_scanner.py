@@ -0,0 +1,220 @@
+"""Follow a contract's events over many blocks with `eth_getLogs`:code:.
+
+:func:`scan_logs` asks the node for the log entries of some of a contract's
+events one range of blocks at a time, decodes them with the contract
+wrapper's ABI, and yields them in the order they were emitted::
+
+    exchange = Exchange(
+        provider, chain_to_addresses(ChainId.MAINNET).exchange
+    )
+    for event in scan_logs(
+        exchange,
+        ["Fill", "Cancel", "CancelUpTo"],
+        from_block=8952139,
+        checkpoint=FileCheckpoint("exchange-events.json"),
+    ):
+        print(event["event"], event["blockNumber"], event["args"])
+
+Nodes limit how many results one `eth_getLogs`:code: may return, or how
+long it may take.  When the node rejects a range as too big, the range is
+halved and asked for again; after each range that succeeds, the next one
+is twice as big, up to a maximum.
+
+A :class:`Checkpoint` remembers the first block not yet scanned.  It is
+saved once all the log entries of a range have been consumed, so a scan
+which is stopped, and then started again with the same checkpoint, resumes
+from the start of the range it was in.  Entries of that range may therefore
+be yielded twice, but none are missed.
+"""
+
+import json
+import os
+import re
+from typing import Any, Iterator, List, Optional, Sequence
+
+from web3.datastructures import AttributeDict
+
+from .bases import ContractWrapper
+
+_TOO_MANY_RESULTS = re.compile(
+    "|".join(
+        [
+            "more than",
+            "too many",
+            "too large",
+            "exceed",
+            "response size",
+            "timeout",
+            "timed out",
+        ]
+    ),
+    re.IGNORECASE,
+)
+"""What the errors of various nodes say when a range is too big."""
+
+
+def _is_too_many_results(error: ValueError) -> bool:
+    """Tell whether `error`:code: is a node rejecting too big a range.
+
+    >>> _is_too_many_results(ValueError({
+    ...     "code": -32005, "message": "query returned more than 10000 results"
+    ... }))
+    True
+    >>> _is_too_many_results(ValueError({
+    ...     "code": -32602, "message": "invalid argument 0"
+    ... }))
+    False
+    """
+    details = error.args[0] if error.args else None
+    if isinstance(details, dict):
+        if details.get("code") == -32005:
+            return True
+        details = details.get("message")
+    return bool(_TOO_MANY_RESULTS.search(str(details)))
+
+
+class Checkpoint:
+    """Where a scan remembers the first block it hasn't scanned yet.
+
+    This one only remembers it in memory.  Subclasses can override
+    :meth:`load` and :meth:`save` to keep it somewhere more permanent.
+
+    :param next_block: the first block not yet scanned, if known.
+    """
+
+    def __init__(self, next_block: Optional[int] = None):
+        """Initialize the checkpoint."""
+        self.next_block = next_block
+
+    def load(self) -> Optional[int]:
+        """Get the first block not yet scanned, or None if unknown."""
+        return self.next_block
+
+    def save(self, next_block: int):
+        """Remember that all blocks before `next_block`:code: are scanned."""
+        self.next_block = next_block
+
+
+class FileCheckpoint(Checkpoint):
+    """A checkpoint kept in a JSON file.
+
+    The file is replaced as a whole each time the checkpoint is saved, so
+    it is never left half written.
+
+    :param path: where to keep the checkpoint.  If the file doesn't exist,
+        the checkpoint isn't known yet.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the checkpoint."""
+        super().__init__()
+        self.path = path
+
+    def load(self) -> Optional[int]:
+        """Read the first block not yet scanned from the file, if any."""
+        try:
+            with open(self.path, encoding="utf-8") as checkpoint_file:
+                self.next_block = json.load(checkpoint_file)["next_block"]
+        except FileNotFoundError:
+            self.next_block = None
+        return self.next_block
+
+    def save(self, next_block: int):
+        """Write the first block not yet scanned to the file."""
+        temporary_path = self.path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as checkpoint_file:
+            json.dump({"next_block": next_block}, checkpoint_file)
+        os.replace(temporary_path, self.path)
+        self.next_block = next_block
+
+
+def _get_topics(
+    wrapper: ContractWrapper, event_names: Optional[Sequence[str]]
+) -> List[str]:
+    """Get the first topic of each of the events named, or of all events."""
+    # pylint: disable=protected-access
+    event_abis = wrapper._get_event_abis_by_topic()
+    if event_names is not None:
+        if not event_names:
+            # no topics at all would match the logs of every event
+            raise ValueError("event_names must name at least one event")
+        unknown = set(event_names) - {
+            abi["name"] for abi in event_abis.values()
+        }
+        if unknown:
+            raise ValueError(
+                f"{type(wrapper).__name__} has no events named "
+                + ", ".join(sorted(unknown))
+            )
+    return [
+        "0x" + topic.hex()
+        for (topic, abi) in event_abis.items()
+        if event_names is None or abi["name"] in event_names
+    ]
+
+
+def scan_logs(  # pylint: disable=too-many-arguments
+    wrapper: ContractWrapper,
+    event_names: Optional[Sequence[str]] = None,
+    from_block: int = 0,
+    to_block: Optional[int] = None,
+    checkpoint: Optional[Checkpoint] = None,
+    initial_range: int = 2000,
+    max_range: int = 100000,
+) -> Iterator[AttributeDict]:
+    """Yield the decoded log entries of a contract's events, block by block.
+
+    :param wrapper: the contract whose events to scan for, and the node to
+        ask.
+    :param event_names: the names of the events to scan for, or None (the
+        default) for all of the contract's events.
+    :param from_block: the first block to scan, unless `checkpoint`:code:
+        knows where to resume.
+    :param to_block: the last block to scan.  Defaults to the latest block
+        when the scan starts.
+    :param checkpoint: where to remember the progress of the scan, and to
+        resume it from.
+    :param initial_range: the number of blocks to ask about at first.
+    :param max_range: the largest number of blocks to ask about at once.
+    :returns: the log entries, in the order they were emitted, each with
+        the name of its event in its `event`:code: field.
+    :raises ValueError: if `event_names`:code: is empty, or names an event
+        which the contract doesn't have, or if the node rejects even a
+        single block.
+    """
+    # pylint: disable=protected-access
+    topics = _get_topics(wrapper, event_names)
+    if initial_range < 1 or max_range < 1:
+        raise ValueError("initial_range and max_range must be at least 1")
+
+    resume_block = checkpoint.load() if checkpoint is not None else None
+    if resume_block is not None:
+        from_block = resume_block
+    if to_block is None:
+        to_block = wrapper._web3_eth.blockNumber
+    address = wrapper._get_contract().address
+
+    block_range = min(initial_range, max_range)
+    start = from_block
+    while start <= to_block:
+        end = min(start + block_range - 1, to_block)
+        try:
+            logs: Any = wrapper._web3_eth.getLogs(
+                {
+                    "address": address,
+                    "topics": [topics],
+                    "fromBlock": start,
+                    "toBlock": end,
+                }
+            )
+        except ValueError as error:
+            if end == start or not _is_too_many_results(error):
+                raise
+            block_range = max(1, (end - start + 1) // 2)
+            continue
+
+        yield from wrapper.decode_logs(logs)
+        if checkpoint is not None:
+            checkpoint.save(end + 1)
+        start = end + 1
+        block_range = min(block_range * 2, max_range)
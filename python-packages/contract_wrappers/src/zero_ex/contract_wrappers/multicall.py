@@ -0,0 +1,213 @@
+"""Aggregate many contract calls into a single `eth_call`:code:.
+
+A :class:`Multicall` is used just like a
+:func:`~zero_ex.contract_wrappers.batch.batch`: inside its `with`:code:
+block, the `call()`:code: of any contract method can be deferred by calling
+its `defer()`:code:, which returns a :class:`concurrent.futures.Future`::
+
+    with Multicall():
+        balances = [
+            erc20_token.balance_of.call.defer(owner) for owner in owners
+        ]
+    print([balance.result() for balance in balances])
+
+Rather than sending each call to the node, even in one batch, the calls are
+passed to the `aggregate3()`:code: function of a `Multicall3
+<https://github.com/mds1/multicall>`_ contract, which makes them all from
+within a single `eth_call`:code:.  All of them therefore see the state of
+the chain as of the same block, and the node only has to handle one
+request.  Each future is resolved with the value that `call()`:code: would
+have returned, or with the exception it would have raised if the call
+reverted.
+
+The calls are made by the Multicall contract, so calls whose result
+depends on `msg.sender`:code: may not return what they would have returned
+if they'd been made directly.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from eth_abi import decode_abi, encode_abi
+from eth_utils import to_checksum_address
+from web3.providers.base import BaseProvider
+
+from .batch import Batch
+from .exceptions import _is_too_large
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+"""Where Multicall3 is deployed on mainnet, and on most other chains."""
+
+_AGGREGATE3_SELECTOR = "0x82ad56cb"
+"""The selector of `aggregate3((address,bool,bytes)[])`:code:."""
+
+_ERROR_SELECTOR = "0x08c379a0"
+"""The selector of `Error(string)`:code:, which encodes revert reasons."""
+
+
+def _call_response(success: bool, return_data: bytes) -> dict:
+    """Get the response a node would give to a call returning `return_data`.
+
+    >>> _call_response(True, bytes([42]))
+    {'jsonrpc': '2.0', 'id': 0, 'result': '0x2a'}
+    >>> _call_response(False, b"")["error"]["message"]
+    'execution reverted'
+    """
+    response: Dict[str, Any] = {"jsonrpc": "2.0", "id": 0}
+    if success:
+        response["result"] = "0x" + return_data.hex()
+        return response
+
+    message = "execution reverted"
+    if return_data.hex().startswith(_ERROR_SELECTOR[2:]):
+        try:
+            (reason,) = decode_abi(["string"], return_data[4:])
+            message += ": " + reason
+        except Exception:  # pylint: disable=broad-except
+            # not a well formed revert reason
+            pass
+    response["error"] = {
+        "code": 3,
+        "message": message,
+        "data": "0x" + return_data.hex(),
+    }
+    return response
+
+
+class Multicall(Batch):
+    """Contract calls to be aggregated into as few `eth_call`:code: as can be.
+
+    When the `with`:code: block exits, the deferred calls are aggregated in
+    chunks of at most `max_size`:code: calls.  Each chunk is sent with the
+    gas limit of the latest block, or `gas_limit`:code: if given, and for
+    the block that was the latest when the first chunk was sent, so that
+    all calls see the same state of the chain.  If a whole chunk is too
+    large for the node, because it runs out of gas for example, it is split
+    in two and each half is tried again.  Any other error of the whole chunk
+    fails each of its calls.
+
+    :param address: where the Multicall3 contract is deployed.
+    :param max_size: the largest number of calls to aggregate into one
+        `eth_call`:code:.
+    :param gas_limit: the gas to allow each aggregated `eth_call`:code:.
+        Defaults to the gas limit of the block.
+    """
+
+    def __init__(
+        self,
+        address: str = MULTICALL3_ADDRESS,
+        max_size: Optional[int] = 500,
+        gas_limit: Optional[int] = None,
+    ):
+        """Initialize an empty batch of calls."""
+        super().__init__(max_size)
+        self.address = to_checksum_address(address)
+        self.gas_limit = gas_limit
+        self._blocks: Dict[int, Tuple[str, int]] = {}
+
+    def flush(self):
+        """Make the calls deferred so far, and resolve their futures."""
+        self._blocks = {}
+        super().flush()
+
+    def _get_block(self, provider: BaseProvider) -> Tuple[str, int]:
+        """Get the number and gas limit of the block to make calls at."""
+        if id(provider) not in self._blocks:
+            response = provider.make_request(
+                "eth_getBlockByNumber", ["latest", False]
+            )
+            if "error" in response:
+                raise ValueError(response["error"])
+            block = response["result"]
+            self._blocks[id(provider)] = (
+                block["number"],
+                int(block["gasLimit"], 16),
+            )
+        return self._blocks[id(provider)]
+
+    def _send_requests(
+        self, provider: BaseProvider, requests: List[tuple]
+    ) -> list:
+        """Aggregate the `eth_call`:code: `requests`:code: into few requests.
+
+        :param provider: where to send the aggregated requests.
+        :param requests: the method and parameters of each request.
+        :returns: for each request, the response it would have got if it
+            had been sent on its own.
+        """
+        (block_number, gas_limit) = self._get_block(provider)
+        indices_by_block: Dict[Any, List[int]] = {}
+        for (index, (_, params)) in enumerate(requests):
+            block = params[1] if len(params) > 1 else "latest"
+            if block in ("latest", "pending"):
+                block = block_number
+            indices_by_block.setdefault(block, []).append(index)
+
+        responses: List[Any] = [None] * len(requests)
+        for (block, indices) in indices_by_block.items():
+            for (index, response) in zip(
+                indices,
+                self._aggregate(
+                    provider,
+                    [requests[index][1][0] for index in indices],
+                    block,
+                    self.gas_limit or gas_limit,
+                ),
+            ):
+                responses[index] = response
+        return responses
+
+    def _aggregate(
+        self,
+        provider: BaseProvider,
+        transactions: List[dict],
+        block: Any,
+        gas_limit: int,
+    ) -> list:
+        """Make the calls in `transactions`:code: with one `eth_call`:code:.
+
+        If the node finds that too large, split the calls in two and try
+        again.  If it fails otherwise, every call gets the error.
+        """
+        data = _AGGREGATE3_SELECTOR + (
+            encode_abi(
+                ["(address,bool,bytes)[]"],
+                [
+                    [
+                        (
+                            transaction["to"],
+                            True,
+                            bytes.fromhex(transaction["data"][2:]),
+                        )
+                        for transaction in transactions
+                    ]
+                ],
+            ).hex()
+        )
+        response = provider.make_request(
+            "eth_call",
+            [
+                {"to": self.address, "data": data, "gas": hex(gas_limit)},
+                block,
+            ],
+        )
+        if "error" in response:
+            if len(transactions) == 1 or not _is_too_large(response["error"]):
+                return [response] * len(transactions)
+            half = len(transactions) // 2
+            return self._aggregate(
+                provider, transactions[:half], block, gas_limit
+            ) + self._aggregate(
+                provider, transactions[half:], block, gas_limit
+            )
+        if response["result"] in ("0x", None):
+            raise ValueError(
+                f"No Multicall3 contract at {self.address} on this chain"
+            )
+
+        (results,) = decode_abi(
+            ["(bool,bytes)[]"], bytes.fromhex(response["result"][2:])
+        )
+        return [
+            _call_response(success, return_data)
+            for (success, return_data) in results
+        ]
@@ -0,0 +1,135 @@
+"""Get the on-chain state of many orders at once.
+
+The DevUtils contract can report the state of a whole array of orders in a
+single call, but nodes limit the gas, and the size, of a call.
+:func:`get_orders_state` splits a list of orders into chunks that stay
+within those limits, gets the state of the chunks concurrently, and puts
+the results back together in the order of the input.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .dev_utils import DevUtils
+from .exceptions import _is_too_large
+from .exchange.types import Order, OrderStatus
+from .tx_params import TxParams
+
+
+class OrdersState(NamedTuple):
+    """The state of a list of orders, as columns aligned to that list."""
+
+    statuses: List[OrderStatus]
+    """The status of each order."""
+
+    order_hashes: List[bytes]
+    """The hash of each order."""
+
+    taker_asset_filled_amounts: List[int]
+    """How much of each order's taker asset amount has been filled."""
+
+    fillable_taker_asset_amounts: List[int]
+    """How much of each order's taker asset amount can still be filled,
+    given the balances and allowances of its maker.
+    """
+
+    signature_validities: List[bool]
+    """Whether each order's signature is valid."""
+
+
+def _get_chunk_state(
+    dev_utils: DevUtils,
+    orders: Sequence[Order],
+    signatures: Sequence[Union[bytes, str]],
+    tx_params: Optional[TxParams],
+) -> List[Tuple[tuple, int, bool]]:
+    """Get the state of a chunk of orders, halving it if the node balks.
+
+    A node rejects a call that needs more gas than it allows, whose request
+    is too large, or which takes too long, in which case each half of the
+    chunk is tried on its own.  Any other error, such as a revert, is
+    raised at once.
+    """
+    try:
+        (
+            infos,
+            fillable_amounts,
+            validities,
+        ) = dev_utils.get_order_relevant_states.call(
+            list(orders), list(signatures), tx_params
+        )
+    except (ValueError, OSError) as error:
+        if len(orders) == 1 or not _is_too_large(error):
+            raise
+        half = len(orders) // 2
+        return _get_chunk_state(
+            dev_utils, orders[:half], signatures[:half], tx_params
+        ) + _get_chunk_state(
+            dev_utils, orders[half:], signatures[half:], tx_params
+        )
+    return list(zip(infos, fillable_amounts, validities))
+
+
+def get_orders_state(  # pylint: disable=too-many-arguments
+    dev_utils: DevUtils,
+    orders: Sequence[Order],
+    signatures: Sequence[Union[bytes, str]],
+    chunk_size: int = 100,
+    max_workers: Optional[int] = 4,
+    tx_params: Optional[TxParams] = None,
+) -> OrdersState:
+    """Get the state of `orders`:code:, in chunks, concurrently.
+
+    :param dev_utils: the DevUtils contract to ask.
+    :param orders: the orders to get the state of.
+    :param signatures: the signature of each order.
+    :param chunk_size: the largest number of orders to ask about in one
+        call.  A chunk which turns out to be too much for the node is split
+        further.
+    :param max_workers: the largest number of calls to have in flight at
+        once, or None for the default of
+        :class:`concurrent.futures.ThreadPoolExecutor`.
+    :param tx_params: transaction parameters for the calls.
+    :returns: the state of each order, aligned to `orders`:code:.
+
+    >>> get_orders_state(None, [], [])
+    OrdersState(statuses=[], order_hashes=[], taker_asset_filled_amounts=[], fillable_taker_asset_amounts=[], signature_validities=[])
+    """  # noqa: E501 (line too long)
+    if len(orders) != len(signatures):
+        raise ValueError(
+            f"Got {len(orders)} orders but {len(signatures)} signatures"
+        )
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    starts = range(0, len(orders), chunk_size)
+    chunks = (
+        (
+            orders[slice(start, start + chunk_size)],
+            signatures[slice(start, start + chunk_size)],
+        )
+        for start in starts
+    )
+    states: List[Tuple[tuple, int, bool]] = []
+    if len(starts) == 1:
+        (chunk_orders, chunk_signatures) = next(chunks)
+        states = _get_chunk_state(
+            dev_utils, chunk_orders, chunk_signatures, tx_params
+        )
+    elif len(starts) > 1:
+        with ThreadPoolExecutor(max_workers) as executor:
+            for chunk_states in executor.map(
+                lambda chunk: _get_chunk_state(
+                    dev_utils, chunk[0], chunk[1], tx_params
+                ),
+                chunks,
+            ):
+                states.extend(chunk_states)
+
+    return OrdersState(
+        statuses=[OrderStatus(info[0]) for (info, _, _) in states],
+        order_hashes=[info[1] for (info, _, _) in states],
+        taker_asset_filled_amounts=[info[2] for (info, _, _) in states],
+        fillable_taker_asset_amounts=[amount for (_, amount, _) in states],
+        signature_validities=[validity for (_, _, validity) in states],
+    )
@@ -1,7 +1,9 @@
-from typing import Union
+from typing import Any, Dict, Union
 
 def to_checksum_address(address: str) -> str: ...
 
 def remove_0x_prefix(hex_string: str) -> str: ...
 
 def is_address(address: Union[str, bytes]) -> bool: ...
+
+def event_abi_to_log_topic(event_abi: Dict[str, Any]) -> bytes: ...
@@ -1,6 +1,6 @@
-from typing import Callable
+from typing import Any, Callable, Union
 
-def fixture(scope: str) -> Callable:
+def fixture(scope: Union[str, Callable] = ..., **kwargs: Any) -> Any:
     ...
 
 class ExceptionInfo:
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from hexbytes import HexBytes
 from eth_account.local import LocalAccount
@@ -9,10 +9,16 @@ from web3.providers.base import BaseProvider
 
 class Web3:
     class HTTPProvider(BaseProvider):
+        endpoint_uri: str
+
+        def get_request_kwargs(self) -> Dict[str, Any]: ...
+
         ...
 
     def __init__(self, provider: BaseProvider) -> None: ...
 
+    provider: BaseProvider
+
     @staticmethod
     def sha3(
         primitive: Optional[Union[bytes, int, None]] = None,
@@ -23,14 +29,23 @@ class Web3:
     @staticmethod
     def isAddress(address: str) -> bool: ...
 
+    @staticmethod
+    def toChecksumAddress(value: str) -> str: ...
+
     class middleware_stack:
         @staticmethod
         def get(key: str) -> Callable: ...
 
         def inject(
-            self, middleware_func: object, layer: object
+            self, middleware_func: object, layer: object, name: str = None
         ) -> None: ...
 
+        def remove(self, middleware: object) -> None: ...
+
+        def __contains__(self, middleware: object) -> bool: ...
+
+        middlewares: List[Tuple[Callable, str]]
+
         ...
 
     middleware_onion: middleware_stack
@@ -44,6 +59,7 @@ class Web3:
         defaultAccount: str
         accounts: List[str]
         chainId: int
+        blockNumber: int
         ...
 
         class account:
@@ -54,6 +70,9 @@ class Web3:
         @staticmethod
         def getTransactionReceipt(tx_hash: Union[HexBytes, bytes]) -> Any: ...
         
+        @staticmethod
+        def getLogs(filter_params: Dict[str, Any]) -> List[Any]: ...
+
         @staticmethod
         def contract(address: str, abi: Dict) -> Contract: ...
         ...
@@ -64,4 +83,6 @@ class Web3:
 
     eth: Eth
 
+    codec: Any
+
     ...
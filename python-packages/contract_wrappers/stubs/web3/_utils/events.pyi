@@ -0,0 +1,8 @@
+from typing import Any, Dict
+
+from web3.datastructures import AttributeDict
+
+
+def get_event_data(
+    abi_codec: Any, event_abi: Dict[str, Any], log_entry: Any
+) -> AttributeDict: ...
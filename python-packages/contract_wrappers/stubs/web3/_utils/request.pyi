@@ -0,0 +1,6 @@
+from typing import Any
+
+
+def make_post_request(
+    endpoint_uri: str, data: bytes, *args: Any, **kwargs: Any
+) -> bytes: ...
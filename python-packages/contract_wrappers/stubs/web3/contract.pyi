@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Dict, List
 
 
 class Contract:
@@ -7,6 +7,10 @@ class Contract:
     functions: Any
 
     events: Any
+
+    abi: List[Dict[str, Any]]
+
+    address: str
     ...
 
 
@@ -1,2 +1,14 @@
 class BadFunctionCallOutput(Exception):
     ...
+
+class MismatchedABI(Exception):
+    ...
+
+class LogTopicError(ValueError):
+    ...
+
+class InvalidEventABI(ValueError):
+    ...
+
+class ContractLogicError(ValueError):
+    ...
@@ -1,2 +1,7 @@
+from typing import Any
+
+
 class BaseProvider:
+    def make_request(self, method: str, params: Any) -> Any: ...
+
     ...
@@ -0,0 +1,107 @@
+"""Measure the throughput of concurrent contract calls from asyncio.
+
+The calls go over HTTP to a local stand-in for a node, started by the
+benchmark, with and without some latency.  Blocking calls are made one
+after the other, and in a thread pool as asyncio code had to before
+`call_async()`:code:, and awaitable calls are made all at once.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import sys
+from timeit import default_timer
+
+from web3 import Web3
+
+from zero_ex.contract_addresses import chain_to_addresses, ChainId
+from zero_ex.contract_wrappers.async_calls import close_session
+from zero_ex.contract_wrappers.erc20_token import ERC20Token
+
+from ..stand_in_node import StandInNode
+
+N_CALLS = 1000
+
+LATENCIES = (0.0, 0.05)
+
+THREADS = 32
+
+
+def report(label: str, n_calls: int, seconds: float) -> None:
+    """Print the rate of calls."""
+    print(f"{label:<50} {n_calls / seconds:>9,.0f} calls/second")
+
+
+async def measure_async(erc20_token: ERC20Token, owners: list) -> list:
+    """Make the calls in a thread pool, then as coroutines."""
+    loop = asyncio.get_running_loop()
+    start = default_timer()
+    in_threads = await asyncio.gather(
+        *(
+            loop.run_in_executor(None, erc20_token.balance_of.call, owner)
+            for owner in owners
+        )
+    )
+    report(
+        f"  balance_of.call() in {THREADS} threads",
+        len(owners),
+        default_timer() - start,
+    )
+
+    # warm up the connection pool
+    await erc20_token.balance_of.call_async(owners[0])
+    start = default_timer()
+    awaited = await asyncio.gather(
+        *(erc20_token.balance_of.call_async(owner) for owner in owners)
+    )
+    report(
+        "  balance_of.call_async(), all at once",
+        len(owners),
+        default_timer() - start,
+    )
+    await close_session()
+    assert awaited == in_threads
+    return awaited
+
+
+def measure(owners: list, latency: float) -> None:
+    """Report the rate of calls to a node with the given latency."""
+    print(f"latency {latency * 1000:g} ms:")
+    with StandInNode(latency) as node:
+        erc20_token = ERC20Token(
+            Web3.HTTPProvider(node.endpoint_uri),
+            chain_to_addresses(ChainId.MAINNET).zrx_token,
+        )
+        # look up the default account before timing anything
+        erc20_token.balance_of.call(owners[0])
+
+        n_sequential = min(len(owners), 100)
+        start = default_timer()
+        for owner in owners[:n_sequential]:
+            erc20_token.balance_of.call(owner)
+        report(
+            "  balance_of.call(), one after the other",
+            n_sequential,
+            default_timer() - start,
+        )
+
+        async def main():
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(THREADS)
+            )
+            return await measure_async(erc20_token, owners)
+
+        asyncio.run(main())
+
+
+def main(n_calls: int = N_CALLS):
+    """Run the benchmarks and print the results."""
+    owners = [
+        Web3.toChecksumAddress("0x{:040x}".format(index))
+        for index in range(1, n_calls + 1)
+    ]
+    for latency in LATENCIES:
+        measure(owners, latency)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,78 @@
+"""Measure contract calls per second, made one by one, batched, aggregated.
+
+The calls go over HTTP to a local stand-in for a node, started by the
+benchmark.  With no latency, the numbers mostly reflect the work done per
+request by the client.  With some latency, they show the effect of saving
+network round trips, as against a remote node.
+"""
+
+import sys
+from timeit import default_timer
+
+from web3 import Web3
+
+from zero_ex.contract_addresses import chain_to_addresses, ChainId
+from zero_ex.contract_wrappers.batch import batch
+from zero_ex.contract_wrappers.erc20_token import ERC20Token
+from zero_ex.contract_wrappers.multicall import Multicall
+
+from ..stand_in_node import MULTICALL_ADDRESS, StandInNode
+
+N_CALLS = 500
+
+LATENCIES = (0.0, 0.005)
+
+
+def report(label: str, n_calls: int, seconds: float) -> None:
+    """Print the rate of calls."""
+    print(f"{label:<50} {n_calls / seconds:>9,.0f} calls/second")
+
+
+def measure(owners: list, latency: float) -> None:
+    """Report the rate of calls to a node with the given latency."""
+    n_calls = len(owners)
+    print(f"latency {latency * 1000:g} ms:")
+    with StandInNode(latency) as node:
+        erc20_token = ERC20Token(
+            Web3.HTTPProvider(node.endpoint_uri),
+            chain_to_addresses(ChainId.MAINNET).zrx_token,
+        )
+        # look up the default account before timing anything
+        erc20_token.balance_of.call(owners[0])
+
+        start = default_timer()
+        sequential = [erc20_token.balance_of.call(owner) for owner in owners]
+        report("  balance_of.call()", n_calls, default_timer() - start)
+
+        for (label, calls) in (
+            ("batch()", lambda: batch()),
+            ("batch(max_size=100)", lambda: batch(max_size=100)),
+            ("Multicall()", lambda: Multicall(MULTICALL_ADDRESS)),
+        ):
+            start = default_timer()
+            with calls():
+                futures = [
+                    erc20_token.balance_of.call.defer(owner)
+                    for owner in owners
+                ]
+            batched = [future.result() for future in futures]
+            report(
+                f"  balance_of.call.defer() in {label}",
+                n_calls,
+                default_timer() - start,
+            )
+            assert batched == sequential
+
+
+def main(n_calls: int = N_CALLS):
+    """Run the benchmarks and print the results."""
+    owners = [
+        Web3.toChecksumAddress("0x{:040x}".format(index))
+        for index in range(1, n_calls + 1)
+    ]
+    for latency in LATENCIES:
+        measure(owners, latency)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
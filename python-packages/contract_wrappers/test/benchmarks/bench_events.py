@@ -0,0 +1,133 @@
+"""Measure transaction receipts decoded per second.
+
+The receipts are served over HTTP by a local stand-in for a node, started
+by the benchmark, each with one `Transfer`:code: event of an ERC20 token.
+Building a web3 contract object for every receipt, as the `get_*_event()`:code:
+methods used to, is compared with the cached event objects, one receipt
+at a time and all at once.
+"""
+
+import sys
+from timeit import default_timer
+
+from eth_abi import encode_abi
+from web3 import Web3
+
+from zero_ex.contract_addresses import chain_to_addresses, ChainId
+from zero_ex.contract_wrappers.erc20_token import ERC20Token
+from zero_ex.contract_wrappers.exchange import Exchange
+
+from ..stand_in_node import StandInNode
+
+N_RECEIPTS = 500
+
+LATENCIES = (0.0, 0.005)
+
+TOKEN = Web3.toChecksumAddress(chain_to_addresses(ChainId.MAINNET).zrx_token)
+
+
+def report(
+    label: str, n_things: int, seconds: float, things: str = "receipts"
+) -> None:
+    """Print the rate of things."""
+    print(f"{label:<50} {n_things / seconds:>9,.0f} {things}/second")
+
+
+def _receipts(n_receipts: int) -> dict:
+    """Get receipts with one `Transfer`:code: each, by transaction hash."""
+    topic = Web3.toHex(Web3.keccak(text="Transfer(address,address,uint256)"))
+    receipts = {}
+    for index in range(n_receipts):
+        tx_hash = "0x{:064x}".format(index + 1)
+        receipts[tx_hash] = {
+            "transactionHash": tx_hash,
+            "status": "0x1",
+            "logs": [
+                {
+                    "address": TOKEN,
+                    "topics": [
+                        topic,
+                        "0x{:064x}".format(index + 1),
+                        "0x{:064x}".format(index + 2),
+                    ],
+                    "data": "0x" + encode_abi(["uint256"], [index]).hex(),
+                    "blockNumber": "0x2a",
+                    "blockHash": "0x" + "bb" * 32,
+                    "transactionHash": tx_hash,
+                    "transactionIndex": "0x0",
+                    "logIndex": "0x0",
+                    "removed": False,
+                }
+            ],
+        }
+    return receipts
+
+
+def measure(n_receipts: int, latency: float) -> None:
+    """Report the rate of receipts from a node with the given latency."""
+    print(f"latency {latency * 1000:g} ms:")
+    with StandInNode(latency) as node:
+        node.receipts = _receipts(n_receipts)
+        tx_hashes = list(node.receipts)
+        erc20_token = ERC20Token(Web3.HTTPProvider(node.endpoint_uri), TOKEN)
+        # pylint: disable=protected-access
+        web3_eth = erc20_token._web3_eth
+
+        start = default_timer()
+        for tx_hash in tx_hashes:
+            web3_eth.contract(
+                address=TOKEN, abi=ERC20Token.abi()
+            ).events.Transfer().processReceipt(
+                web3_eth.getTransactionReceipt(tx_hash)
+            )
+        report(
+            "  new contract object per receipt",
+            n_receipts,
+            default_timer() - start,
+        )
+
+        start = default_timer()
+        for tx_hash in tx_hashes:
+            erc20_token.get_transfer_event(tx_hash)
+        report("  get_transfer_event()", n_receipts, default_timer() - start)
+
+        start = default_timer()
+        erc20_token.get_events_from_receipts(tx_hashes)
+        report(
+            "  get_events_from_receipts()", n_receipts, default_timer() - start
+        )
+
+
+def measure_event_objects(n_times: int) -> None:
+    """Report the rate of getting the Exchange's `Fill`:code: event object."""
+    exchange = Exchange(
+        Web3.HTTPProvider("http://127.0.0.1:8545"),
+        chain_to_addresses(ChainId.MAINNET).exchange,
+    )
+    # pylint: disable=protected-access
+    web3_eth = exchange._web3_eth
+    print("Exchange Fill event object, without a node:")
+    start = default_timer()
+    for _ in range(n_times):
+        web3_eth.contract(
+            address=Web3.toChecksumAddress(exchange.contract_address),
+            abi=Exchange.abi(),
+        ).events.Fill()
+    report(
+        "  new contract object", n_times, default_timer() - start, "objects"
+    )
+    start = default_timer()
+    for _ in range(n_times):
+        exchange._get_event("Fill")
+    report("  cached", n_times, default_timer() - start, "objects")
+
+
+def main(n_receipts: int = N_RECEIPTS) -> None:
+    """Report the rates for each latency."""
+    for latency in LATENCIES:
+        measure(n_receipts, latency)
+    measure_event_objects(n_receipts)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
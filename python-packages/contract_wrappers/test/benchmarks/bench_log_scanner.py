@@ -0,0 +1,75 @@
+"""Measure Exchange events scanned per second with `eth_getLogs`:code:.
+
+The events are served over HTTP by a local stand-in for a node, started by
+the benchmark, which refuses to return more than 10,000 log entries at
+once.  Most blocks have few events, and a stretch of them has many, as
+around a busy day.  Scanning with a fixed range small enough for the busy
+stretch is compared with the adaptive range of
+:func:`~zero_ex.contract_wrappers.log_scanner.scan_logs`.
+"""
+
+import sys
+from timeit import default_timer
+
+from web3 import Web3
+
+from zero_ex.contract_wrappers.exchange import Exchange
+from zero_ex.contract_wrappers.log_scanner import scan_logs
+
+from ..stand_in_node import StandInNode
+from ..test_log_scanner import _cancel_up_to, EXCHANGE_ADDRESS
+
+N_BLOCKS = 1000000
+
+LATENCY = 0.005
+
+
+def report(label: str, n_events: int, seconds: float, n_requests: int):
+    """Print the rate of events, and the number of requests."""
+    print(
+        f"{label:<40} {n_events / seconds:>9,.0f} events/second"
+        f" {n_requests:>6,} requests"
+    )
+
+
+def main(n_blocks: int = N_BLOCKS) -> None:
+    """Report the rates with a fixed range and an adaptive one."""
+    busy = range(n_blocks // 2, n_blocks // 2 + n_blocks // 100)
+    block_numbers = sorted(
+        set(range(0, n_blocks, 500)) | set(range(busy.start, busy.stop, 2))
+    )
+    with StandInNode(LATENCY) as node:
+        node.logs = [
+            _cancel_up_to(block_number) for block_number in block_numbers
+        ]
+        exchange = Exchange(
+            Web3.HTTPProvider(node.endpoint_uri), EXCHANGE_ADDRESS
+        )
+        print(f"{len(node.logs):,} events in {n_blocks:,} blocks:")
+        for (label, initial_range, max_range) in (
+            ("  fixed range of 2,000 blocks", 2000, 2000),
+            ("  adaptive range", 2000, 100000),
+        ):
+            node.log_queries.clear()
+            start = default_timer()
+            n_events = sum(
+                1
+                for _ in scan_logs(
+                    exchange,
+                    ["Fill", "Cancel", "CancelUpTo"],
+                    from_block=0,
+                    to_block=n_blocks - 1,
+                    initial_range=initial_range,
+                    max_range=max_range,
+                )
+            )
+            report(
+                label,
+                n_events,
+                default_timer() - start,
+                len(node.log_queries),
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,60 @@
+"""Measure responses per second through the rich revert middleware.
+
+Every response to the Exchange wrapper passes through the middleware, so
+what it costs for responses which are not rich reverts matters most.
+"""
+
+import sys
+from timeit import default_timer
+
+from eth_abi import encode_abi
+
+from zero_ex.contract_wrappers.exchange.exceptions import SignatureError
+from zero_ex.contract_wrappers.exchange.middleware import (
+    rich_revert_handler,
+)
+
+N_RESPONSES = 100000
+
+RESPONSES = (
+    ("uint256 result", {"result": "0x" + "00" * 31 + "2a"}),
+    ("transaction hash", {"result": "0x" + "ab" * 32}),
+    ("receipt", {"result": {"status": 1}}),
+    ("error", {"error": {"code": -32000, "message": "execution reverted"}}),
+)
+
+
+def report(label: str, n_responses: int, seconds: float) -> None:
+    """Print the rate of responses."""
+    print(f"{label:<30} {n_responses / seconds:>12,.0f} responses/second")
+
+
+def main(n_responses: int = N_RESPONSES) -> None:
+    """Report the rate of responses of each kind."""
+    for (label, response) in RESPONSES:
+        middleware = rich_revert_handler(lambda *_, r=response: r, None)
+        start = default_timer()
+        for _ in range(n_responses):
+            middleware("eth_call", [])
+        report(label, n_responses, default_timer() - start)
+
+    rich_revert = {
+        "result": SignatureError.selector
+        + encode_abi(
+            ["uint8", "bytes32", "address", "bytes"],
+            [0, b"\x00" * 32, "0x" + "00" * 20, b""],
+        ).hex()
+    }
+    middleware = rich_revert_handler(lambda *_: rich_revert, None)
+    n_reverts = max(1, n_responses // 10)
+    start = default_timer()
+    for _ in range(n_reverts):
+        try:
+            middleware("eth_call", [])
+        except SignatureError:
+            pass
+    report("rich revert", n_reverts, default_timer() - start)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,81 @@
+"""Measure the time and memory taken to instantiate contract wrappers.
+
+No node is needed: instantiating a wrapper doesn't make any requests.
+"""
+
+import sys
+from timeit import default_timer
+import tracemalloc
+
+from web3 import Web3
+
+from zero_ex.contract_addresses import chain_to_addresses, ChainId
+from zero_ex.contract_wrappers.erc20_token import ERC20Token
+from zero_ex.contract_wrappers.exchange import Exchange
+
+N_WRAPPERS = 100
+
+PROVIDER = Web3.HTTPProvider("http://127.0.0.1:8545")
+
+
+def report(label: str, n_wrappers: int, seconds: float, size: int) -> None:
+    """Print the time and memory taken per wrapper."""
+    print(
+        f"{label:<40} {seconds / n_wrappers * 1000:>9,.3f} ms"
+        + f" {size / n_wrappers / 1024:>9,.1f} KiB per wrapper"
+    )
+
+
+def measure(label: str, n_wrappers: int, instantiate) -> None:
+    """Instantiate `n_wrappers` wrappers and report the cost.
+
+    Time and memory are measured in separate runs, because tracing memory
+    allocations slows everything down.
+    """
+    start = default_timer()
+    wrappers = [instantiate() for _ in range(n_wrappers)]
+    seconds = default_timer() - start
+    del wrappers
+
+    tracemalloc.start()
+    wrappers = [instantiate() for _ in range(n_wrappers)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    report(label, n_wrappers, seconds, size)
+
+
+def main(n_wrappers: int = N_WRAPPERS):
+    """Run the benchmarks and print the results."""
+    addresses = chain_to_addresses(ChainId.MAINNET)
+    web3 = Web3(PROVIDER)
+    for wrapper_class, address in (
+        (Exchange, addresses.exchange),
+        (ERC20Token, addresses.zrx_token),
+    ):
+        name = wrapper_class.__name__
+        measure(
+            f"{name}(provider)",
+            n_wrappers,
+            lambda: wrapper_class(PROVIDER, address),
+        )
+        measure(
+            f"{name}(web3)", n_wrappers, lambda: wrapper_class(web3, address)
+        )
+
+        def instantiate_and_use_one_method():
+            wrapper = wrapper_class(web3, address)
+            getattr(wrapper, "get_order_info", None) or getattr(
+                wrapper, "balance_of"
+            )
+            return wrapper
+
+        measure(
+            f"{name}(web3) + one method",
+            n_wrappers,
+            instantiate_and_use_one_method,
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
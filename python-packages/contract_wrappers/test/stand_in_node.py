@@ -0,0 +1,219 @@
+"""A local HTTP stand-in for an Ethereum node, serving contract calls."""
+
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+from eth_abi import decode_abi, encode_abi
+
+CHAIN_ID = 1337
+
+BLOCK_NUMBER = 42
+
+MULTICALL_ADDRESS = "0x" + "ca11" * 10
+
+GAS_PER_CALL = 10000
+"""The gas each call costs, when aggregated, and the estimate for any call."""
+
+TRANSACTION_HASH = "0x" + "ab" * 32
+"""The hash of every transaction sent."""
+
+
+def balance_of(address: str) -> int:
+    """Get the balance the stand-in reports for `address`."""
+    return int(address[-8:], 16)
+
+
+class _Server(ThreadingHTTPServer):
+    """Accept many concurrent connections."""
+
+    request_queue_size = 1024
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Answer single and batched JSON-RPC requests."""
+
+    protocol_version = "HTTP/1.1"
+
+    disable_nagle_algorithm = True
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Answer a request, or a batch of them."""
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        node = self.server.node  # type: ignore
+        time.sleep(node.latency)
+        with node.lock:
+            node.http_requests += 1
+            if isinstance(body, list):
+                node.batch_sizes.append(len(body))
+        if isinstance(body, list):
+            response = [node.answer(request) for request in body]
+        else:
+            response = node.answer(body)
+        content = json.dumps(response).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Keep quiet."""
+
+
+class StandInNode:
+    """Serve eth_chainId, eth_accounts, and eth_call to `balanceOf()`:code:.
+
+    Gas estimates and transactions are accepted without question,
+    transaction receipts are served from :attr:`receipts`, and log entries
+    from :attr:`logs`.  Calls to
+    any other function revert, except that there is no contract
+    at the zero address.  A Multicall3 contract at
+    `MULTICALL_ADDRESS`:code: aggregates calls with `aggregate3()`:code:.
+    Use it as a context manager to run it in a background thread.
+
+    :param latency: seconds to wait before answering each HTTP request, to
+        stand in for the network between a client and a remote node.
+    :param gas_limit: the gas limit of the latest block.
+    """
+
+    def __init__(self, latency: float = 0.0, gas_limit: int = 30000000):
+        """Bind to a free local port."""
+        self.latency = latency
+        self.gas_limit = gas_limit
+        self.lock = threading.Lock()
+        self.http_requests = 0
+        self.batch_sizes: list = []
+        self.methods: Counter = Counter()
+        """The number of requests for each JSON-RPC method."""
+        self.aggregated: list = []
+        """The number of calls and the block of each aggregated call."""
+        self.receipts: dict = {}
+        """The receipt of each transaction, by hash."""
+        self.logs: list = []
+        """The log entries served by eth_getLogs, in order."""
+        self.max_logs = 10000
+        """The most log entries eth_getLogs returns before refusing."""
+        self.log_queries: list = []
+        """The block range of each eth_getLogs request."""
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.node = self  # type: ignore
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            daemon=True,
+        )
+
+    @property
+    def endpoint_uri(self) -> str:
+        """Get the URL to connect to."""
+        return "http://127.0.0.1:{}".format(self._server.server_port)
+
+    def answer(self, request: dict) -> dict:
+        """Get the response to a single JSON-RPC request."""
+        response = {"jsonrpc": "2.0", "id": request["id"]}
+        with self.lock:
+            self.methods[request["method"]] += 1
+        if request["method"] == "eth_chainId":
+            response["result"] = hex(CHAIN_ID)
+        elif request["method"] == "eth_accounts":
+            response["result"] = []
+        elif request["method"] == "eth_estimateGas":
+            response["result"] = hex(GAS_PER_CALL)
+        elif request["method"] == "eth_sendTransaction":
+            response["result"] = TRANSACTION_HASH
+        elif request["method"] == "eth_getTransactionReceipt":
+            response["result"] = self.receipts.get(request["params"][0])
+        elif request["method"] == "eth_blockNumber":
+            response["result"] = hex(BLOCK_NUMBER)
+        elif request["method"] == "eth_getLogs":
+            response.update(self._get_logs(request["params"][0]))
+        elif request["method"] == "eth_getBlockByNumber":
+            response["result"] = {
+                "number": hex(BLOCK_NUMBER),
+                "gasLimit": hex(self.gas_limit),
+            }
+        elif request["method"] == "eth_call":
+            transaction = request["params"][0]
+            if int(transaction["to"], 16) == 0:
+                # no contract there
+                response["result"] = "0x"
+            elif transaction["to"].lower() == MULTICALL_ADDRESS:
+                response.update(self._aggregate(request["params"]))
+            elif transaction["data"].startswith("0x70a08231"):
+                address = transaction["data"][-40:]
+                response["result"] = "0x{:064x}".format(balance_of(address))
+            else:
+                response["error"] = {
+                    "code": -32000,
+                    "message": "execution reverted",
+                }
+        return response
+
+    def _get_logs(self, log_filter: dict) -> dict:
+        """Answer eth_getLogs, or refuse if there are too many results."""
+        from_block = int(log_filter["fromBlock"], 16)
+        to_block = int(log_filter["toBlock"], 16)
+        with self.lock:
+            self.log_queries.append((from_block, to_block))
+        addresses = log_filter["address"]
+        if isinstance(addresses, str):
+            addresses = [addresses]
+        addresses = [address.lower() for address in addresses]
+        topics = log_filter.get("topics") or [None]
+        logs = [
+            log
+            for log in self.logs
+            if from_block <= int(log["blockNumber"], 16) <= to_block
+            and log["address"].lower() in addresses
+            and (topics[0] is None or log["topics"][0] in topics[0])
+        ]
+        if len(logs) > self.max_logs:
+            return {
+                "error": {
+                    "code": -32005,
+                    "message": "query returned more than "
+                    f"{self.max_logs} results",
+                }
+            }
+        return {"result": logs}
+
+    def _aggregate(self, params: list) -> dict:
+        """Answer a call to aggregate3((address,bool,bytes)[])."""
+        (calls,) = decode_abi(
+            ["(address,bool,bytes)[]"],
+            bytes.fromhex(params[0]["data"][10:]),
+        )
+        with self.lock:
+            self.aggregated.append((len(calls), params[1]))
+        if len(calls) * GAS_PER_CALL > int(params[0]["gas"], 16):
+            return {"error": {"code": -32000, "message": "out of gas"}}
+        results = []
+        for (_, _, data) in calls:
+            if data[:4].hex() == "70a08231":
+                results.append(
+                    (True, balance_of(data[-20:].hex()).to_bytes(32, "big"))
+                )
+            else:
+                results.append(
+                    (
+                        False,
+                        bytes.fromhex("08c379a0")
+                        + encode_abi(["string"], ["unsupported"]),
+                    )
+                )
+        return {
+            "result": "0x" + encode_abi(["(bool,bytes)[]"], [results]).hex()
+        }
+
+    def __enter__(self) -> "StandInNode":
+        """Start serving."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        """Stop serving."""
+        self._server.shutdown()
+        self._server.server_close()
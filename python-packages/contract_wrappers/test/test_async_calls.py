@@ -0,0 +1,143 @@
+"""Tests for :mod:`zero_ex.contract_wrappers.async_calls`."""
+
+import asyncio
+
+import pytest
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+from zero_ex.contract_addresses import chain_to_addresses, ChainId
+from zero_ex.contract_wrappers import TxParams
+from zero_ex.contract_wrappers.async_calls import close_session
+from zero_ex.contract_wrappers.erc20_token import ERC20Token
+
+from .stand_in_node import (
+    balance_of,
+    GAS_PER_CALL,
+    StandInNode,
+    TRANSACTION_HASH,
+)
+
+OWNERS = [
+    Web3.toChecksumAddress("0x{:040x}".format(index))
+    for index in range(1, 201)
+]
+
+SENDER = Web3.toChecksumAddress("0x5409ed021d9299bf6814279a6a1411a7e866a631")
+
+
+@pytest.fixture
+def node():
+    """Run a stand-in node for the duration of a test."""
+    with StandInNode() as stand_in:
+        yield stand_in
+
+
+@pytest.fixture
+def erc20_wrapper(node):  # pylint: disable=redefined-outer-name
+    """Get an ERC20Token wrapper talking to the stand-in node."""
+    return ERC20Token(
+        Web3.HTTPProvider(node.endpoint_uri),
+        chain_to_addresses(ChainId.GANACHE).ether_token,
+    )
+
+
+def _run(coroutine):
+    """Run `coroutine` in a new event loop, closing its session after."""
+
+    async def run_and_close():
+        try:
+            return await coroutine
+        finally:
+            await close_session()
+
+    return asyncio.run(run_and_close())
+
+
+def test_call_async__concurrent_calls(
+    node, erc20_wrapper  # pylint: disable=redefined-outer-name
+):
+    """Test that concurrent calls return what the blocking calls return."""
+
+    async def get_balances():
+        return await asyncio.gather(
+            *(erc20_wrapper.balance_of.call_async(owner) for owner in OWNERS)
+        )
+
+    balances = _run(get_balances())
+    assert balances == [balance_of(owner) for owner in OWNERS]
+    assert node.methods["eth_call"] == len(OWNERS)
+    # at most one each, unless several calls asked before the first answer
+    assert node.methods["eth_accounts"] <= len(OWNERS)
+    assert node.methods["eth_chainId"] <= len(OWNERS)
+
+    node.methods.clear()
+    assert _run(erc20_wrapper.balance_of.call_async(OWNERS[0])) == (
+        balance_of(OWNERS[0])
+    )
+    assert node.methods == {"eth_call": 1}
+
+
+def test_call_async__errors(
+    erc20_wrapper,  # pylint: disable=redefined-outer-name
+):
+    """Test that invalid arguments and reverts raise as usual."""
+    with pytest.raises(TypeError):
+        _run(erc20_wrapper.balance_of.call_async("not an address"))
+    with pytest.raises(ValueError, match="execution reverted"):
+        _run(erc20_wrapper.total_supply.call_async())
+
+
+def test_transactions_async(
+    node, erc20_wrapper  # pylint: disable=redefined-outer-name
+):
+    """Test the async counterparts of the other interfaces."""
+    tx_params = TxParams(from_=SENDER, gas_price=1)
+    assert (
+        _run(
+            erc20_wrapper.transfer.estimate_gas_async(
+                OWNERS[0], 1, tx_params=tx_params
+            )
+        )
+        == GAS_PER_CALL
+    )
+    transaction = _run(
+        erc20_wrapper.transfer.build_transaction_async(
+            OWNERS[0], 1, tx_params=tx_params
+        )
+    )
+    assert transaction == erc20_wrapper.transfer.build_transaction(
+        OWNERS[0], 1, tx_params=tx_params
+    )
+    assert transaction["gas"] == GAS_PER_CALL
+
+    node.methods.clear()
+    tx_params = TxParams(from_=SENDER, gas=GAS_PER_CALL, gas_price=1)
+    tx_hash = _run(
+        erc20_wrapper.transfer.send_transaction_async(
+            OWNERS[0], 1, tx_params=tx_params
+        )
+    )
+    assert tx_hash.hex() == TRANSACTION_HASH
+    assert node.methods["eth_sendTransaction"] == 1
+
+
+class _SyncProvider(BaseProvider):
+    """Answer eth_call with 42, and eth_chainId."""
+
+    def make_request(self, method, params):
+        """Answer the request."""
+        results = {
+            "eth_accounts": [],
+            "eth_call": "0x" + "00" * 31 + "2a",
+            "eth_chainId": "0x539",
+        }
+        return {"jsonrpc": "2.0", "id": 1, "result": results[method]}
+
+
+def test_call_async__other_providers():
+    """Test that requests to other providers are made in the executor."""
+    wrapper = ERC20Token(
+        _SyncProvider(), chain_to_addresses(ChainId.GANACHE).ether_token
+    )
+    assert _run(wrapper.balance_of.call_async(OWNERS[0])) == 42
@@ -13,3 +13,16 @@ def contract_wrapper(ganache_provider):
         web3_or_provider=ganache_provider,
         contract_address=chain_to_addresses(ChainId.GANACHE).ether_token,
     )
+
+
+def test_validate_and_checksum_address():
+    """Test that addresses are checksummed, and bad ones rejected."""
+    address = "0x5409ed021d9299bf6814279a6a1411a7e866a631"
+    checksummed = "0x5409ED021D9299bf6814279A6A1411A7e866A631"
+    for _ in range(2):
+        assert (
+            ContractMethod.validate_and_checksum_address(address)
+            == checksummed
+        )
+        with pytest.raises(TypeError):
+            ContractMethod.validate_and_checksum_address("0x5409ed")
@@ -0,0 +1,118 @@
+"""Tests for :mod:`zero_ex.contract_wrappers.batch`."""
+
+from concurrent.futures import Future
+
+import pytest
+from web3 import Web3
+
+from zero_ex.contract_addresses import chain_to_addresses, ChainId
+from zero_ex.contract_wrappers.batch import batch
+from zero_ex.contract_wrappers.erc20_token import ERC20Token
+
+from .stand_in_node import balance_of, StandInNode
+
+OWNERS = [
+    Web3.toChecksumAddress("0x{:040x}".format(index)) for index in range(1, 21)
+]
+
+
+@pytest.fixture
+def node():
+    """Run a stand-in node for the duration of a test."""
+    with StandInNode() as stand_in:
+        yield stand_in
+
+
+@pytest.fixture
+def erc20_wrapper(node):  # pylint: disable=redefined-outer-name
+    """Get an ERC20Token wrapper talking to the stand-in node."""
+    return ERC20Token(
+        Web3.HTTPProvider(node.endpoint_uri),
+        chain_to_addresses(ChainId.GANACHE).ether_token,
+    )
+
+
+def test_batch__one_http_request(
+    node, erc20_wrapper  # pylint: disable=redefined-outer-name
+):
+    """Test that deferred calls are sent together and decoded as usual."""
+    sequential = [erc20_wrapper.balance_of.call(owner) for owner in OWNERS]
+    assert sequential == [balance_of(owner) for owner in OWNERS]
+
+    node.http_requests = 0
+    with batch() as calls:
+        futures = [
+            erc20_wrapper.balance_of.call.defer(owner) for owner in OWNERS
+        ]
+        assert len(calls) == len(OWNERS)
+        assert node.http_requests == 1  # just eth_chainId
+        assert not any(future.done() for future in futures)
+
+    assert [future.result() for future in futures] == sequential
+    assert node.http_requests == 2
+    assert node.batch_sizes == [len(OWNERS)]
+    assert len(calls) == 0
+
+
+def test_batch__max_size(
+    node, erc20_wrapper  # pylint: disable=redefined-outer-name
+):
+    """Test that a batch is split into requests of at most `max_size`."""
+    with batch(max_size=8):
+        futures = [
+            erc20_wrapper.balance_of.call.defer(owner) for owner in OWNERS
+        ]
+    assert [future.result() for future in futures] == [
+        balance_of(owner) for owner in OWNERS
+    ]
+    assert node.batch_sizes == [8, 8, 4]
+
+
+def test_batch__errors_resolve_their_own_futures(
+    node, erc20_wrapper  # pylint: disable=redefined-outer-name
+):
+    """Test that a call failing on the node only fails its own future."""
+    with batch():
+        total_supply = erc20_wrapper.total_supply.call.defer()
+        balance = erc20_wrapper.balance_of.call.defer(OWNERS[0])
+    assert node.batch_sizes == [2]
+    with pytest.raises(ValueError, match="execution reverted"):
+        total_supply.result()
+    assert balance.result() == balance_of(OWNERS[0])
+
+
+def test_batch__invalid_arguments_raise_immediately(
+    erc20_wrapper,  # pylint: disable=redefined-outer-name
+):
+    """Test that arguments are validated when the call is deferred."""
+    with batch() as calls:
+        with pytest.raises(TypeError):
+            erc20_wrapper.balance_of.call.defer("not an address")
+        assert len(calls) == 0
+
+
+def test_batch__exception_in_block_cancels(
+    node, erc20_wrapper  # pylint: disable=redefined-outer-name
+):
+    """Test that nothing is sent if the with block raises."""
+    future = Future()
+    with pytest.raises(KeyboardInterrupt):
+        with batch():
+            future = erc20_wrapper.balance_of.call.defer(OWNERS[0])
+            raise KeyboardInterrupt()
+    assert future.cancelled()
+    assert node.batch_sizes == []
+
+
+def test_batch__calls_outside_a_batch(
+    erc20_wrapper,  # pylint: disable=redefined-outer-name
+):
+    """Test that calls can't be deferred outside a batch, but still work."""
+    with pytest.raises(RuntimeError):
+        erc20_wrapper.balance_of.call.defer(OWNERS[0])
+    with batch():
+        # calls that aren't deferred are made straight away
+        assert erc20_wrapper.balance_of.call(OWNERS[0]) == balance_of(
+            OWNERS[0]
+        )
+    assert erc20_wrapper.balance_of.call(OWNERS[1]) == balance_of(OWNERS[1])
@@ -0,0 +1,180 @@
+"""Tests for :class:`ContractWrapper`."""
+
+import pytest
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+from zero_ex.contract_addresses import chain_to_addresses, ChainId
+import zero_ex.contract_wrappers.exchange
+from zero_ex.contract_wrappers import TxParams
+from zero_ex.contract_wrappers.bases import ContractWrapper, Validator
+from zero_ex.contract_wrappers.erc20_token import (
+    ERC20Token,
+    ERC20TokenValidator,
+    TotalSupplyMethod,
+    TransferMethod,
+)
+from zero_ex.contract_wrappers.exchange.validator import ExchangeValidator
+
+
+@pytest.fixture
+def erc20_wrapper():
+    """Get an ERC20Token wrapper, which needs no node until it's used."""
+    return ERC20Token(
+        Web3.HTTPProvider("http://127.0.0.1:8545"),
+        chain_to_addresses(ChainId.GANACHE).ether_token,
+    )
+
+
+def test_contract_wrapper__methods_constructed_on_first_access(
+    erc20_wrapper,  # pylint: disable=redefined-outer-name
+):
+    """Test that no method wrappers exist until they're accessed."""
+    assert isinstance(erc20_wrapper, ContractWrapper)
+    assert "transfer" not in vars(erc20_wrapper)
+
+    transfer = erc20_wrapper.transfer
+    assert isinstance(transfer, TransferMethod)
+    assert transfer._underlying_method.fn_name == "transfer"
+    assert vars(erc20_wrapper)["transfer"] is transfer
+    assert erc20_wrapper.transfer is transfer
+    assert "balance_of" not in vars(erc20_wrapper)
+
+
+def test_contract_wrapper__methods_share_web3_and_validator(
+    erc20_wrapper,  # pylint: disable=redefined-outer-name
+):
+    """Test that all methods use the wrapper's Web3 instance and validator."""
+    transfer = erc20_wrapper.transfer
+    total_supply = erc20_wrapper.total_supply
+    assert isinstance(total_supply, TotalSupplyMethod)
+    # pylint: disable=protected-access
+    assert transfer._web3_eth is erc20_wrapper._web3_eth
+    assert total_supply._web3_eth is erc20_wrapper._web3_eth
+    assert isinstance(transfer.validator, ERC20TokenValidator)
+    assert transfer.validator is erc20_wrapper.balance_of.validator
+
+
+def test_contract_wrapper__validator_shares_web3(monkeypatch):
+    """Test that the default validator uses the wrapper's Web3 instance."""
+    monkeypatch.setattr(
+        zero_ex.contract_wrappers.exchange,
+        "ExchangeValidator",
+        ExchangeValidator,
+    )
+    wrapper = zero_ex.contract_wrappers.exchange.Exchange(
+        Web3.HTTPProvider("http://127.0.0.1:8545"),
+        chain_to_addresses(ChainId.GANACHE).exchange,
+    )
+    # pylint: disable=protected-access
+    assert isinstance(wrapper._validator, ExchangeValidator)
+    assert wrapper._validator._web3 is wrapper._web3
+
+
+def test_contract_wrapper__abi_required():
+    """Test that a wrapper without an ABI can't be instantiated."""
+
+    class NoAbi(ContractWrapper):  # pylint: disable=abstract-method
+        """A wrapper which doesn't implement abi()."""
+
+    with pytest.raises(TypeError, match="abi"):
+        NoAbi(  # pylint: disable=abstract-class-instantiated
+            Web3(Web3.HTTPProvider("http://127.0.0.1:8545")),
+            chain_to_addresses(ChainId.GANACHE).exchange,
+            Validator(None, chain_to_addresses(ChainId.GANACHE).exchange),
+        )
+
+
+def test_contract_wrapper__unknown_attribute(
+    erc20_wrapper,  # pylint: disable=redefined-outer-name
+):
+    """Test that other missing attributes still raise AttributeError."""
+    with pytest.raises(AttributeError, match="no_such_method"):
+        erc20_wrapper.no_such_method  # pylint: disable=pointless-statement
+    assert not hasattr(erc20_wrapper, "no_such_method")
+
+
+class _CountingProvider(BaseProvider):
+    """Answer eth_accounts and eth_call, and remember each request."""
+
+    def __init__(self, accounts):
+        """Serve `accounts` from eth_accounts."""
+        self.accounts = accounts
+        self.requests = []
+
+    def make_request(self, method, params):
+        """Record the request and answer it."""
+        # recent versions of web3's validation middleware check the chain id
+        # before every eth_call, which is beyond the wrappers' control
+        if method != "eth_chainId":
+            self.requests.append(method)
+        results = {
+            "eth_accounts": self.accounts,
+            "eth_call": "0x" + "00" * 31 + "2a",
+            "eth_chainId": "0x539",
+        }
+        return {"jsonrpc": "2.0", "id": 1, "result": results[method]}
+
+
+ACCOUNT = "0x5409ed021d9299bf6814279a6a1411a7e866a631"
+
+
+def test_contract_wrapper__default_account_looked_up_once():
+    """Test that only the first call without a sender asks for accounts."""
+    provider = _CountingProvider([ACCOUNT])
+    wrapper = ERC20Token(
+        provider, chain_to_addresses(ChainId.GANACHE).ether_token
+    )
+
+    assert wrapper.balance_of.call(ACCOUNT) == 42
+    assert provider.requests == ["eth_accounts", "eth_call"]
+
+    provider.requests.clear()
+    assert wrapper.balance_of.call(ACCOUNT) == 42
+    assert wrapper.total_supply.call() == 42
+    assert provider.requests == ["eth_call", "eth_call"]
+
+    provider.requests.clear()
+    tx_params = TxParams()
+    wrapper.total_supply.call(tx_params=tx_params)
+    assert tx_params.from_ == Web3.toChecksumAddress(ACCOUNT)
+    assert provider.requests == ["eth_call"]
+
+
+def test_contract_wrapper__default_account_invalidation():
+    """Test that the account is looked up again when asked or expired."""
+    provider = _CountingProvider([ACCOUNT])
+    wrapper = ERC20Token(
+        provider, chain_to_addresses(ChainId.GANACHE).ether_token
+    )
+    wrapper.total_supply.call()
+
+    provider.requests.clear()
+    wrapper.account_cache.invalidate()
+    wrapper.total_supply.call()
+    wrapper.total_supply.call()
+    assert provider.requests == ["eth_accounts", "eth_call", "eth_call"]
+
+    provider.requests.clear()
+    wrapper.account_cache.ttl = 0
+    wrapper.total_supply.call()
+    wrapper.balance_of.call(ACCOUNT)
+    assert provider.requests == [
+        "eth_accounts",
+        "eth_call",
+        "eth_accounts",
+        "eth_call",
+    ]
+
+
+def test_contract_wrapper__no_default_account():
+    """Test calls without a sender on a node without accounts."""
+    provider = _CountingProvider([])
+    wrapper = ERC20Token(
+        provider, chain_to_addresses(ChainId.GANACHE).ether_token
+    )
+    tx_params = TxParams()
+    wrapper.total_supply.call(tx_params=tx_params)
+    wrapper.total_supply.call()
+    assert tx_params.from_ is None
+    assert provider.requests == ["eth_accounts", "eth_call", "eth_call"]
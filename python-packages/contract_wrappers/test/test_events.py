@@ -0,0 +1,151 @@
+"""Tests for getting contract events from transaction receipts."""
+
+from eth_abi import encode_abi
+import pytest
+from web3 import Web3
+
+from zero_ex.contract_addresses import chain_to_addresses, ChainId
+from zero_ex.contract_wrappers.erc20_token import ERC20Token
+
+from .stand_in_node import StandInNode
+
+TOKEN = chain_to_addresses(ChainId.GANACHE).ether_token
+
+TRANSFER_TOPIC = Web3.toHex(
+    Web3.keccak(text="Transfer(address,address,uint256)")
+)
+
+APPROVAL_TOPIC = Web3.toHex(
+    Web3.keccak(text="Approval(address,address,uint256)")
+)
+
+OWNER = Web3.toChecksumAddress("0x" + "11" * 20)
+
+SPENDER = Web3.toChecksumAddress("0x" + "22" * 20)
+
+
+def _topic(address: str) -> str:
+    return "0x" + "00" * 12 + address[2:].lower()
+
+
+def _log(topics: list, data: bytes, log_index: int) -> dict:
+    return {
+        "address": TOKEN,
+        "topics": topics,
+        "data": "0x" + data.hex(),
+        "blockNumber": "0x2a",
+        "blockHash": "0x" + "bb" * 32,
+        "transactionHash": "0x" + "{:064x}".format(log_index),
+        "transactionIndex": "0x0",
+        "logIndex": hex(log_index),
+        "removed": False,
+    }
+
+
+def _receipt(tx_hash: str, logs: list) -> dict:
+    return {
+        "transactionHash": tx_hash,
+        "blockNumber": "0x2a",
+        "status": "0x1",
+        "logs": logs,
+    }
+
+
+@pytest.fixture
+def node():
+    """Run a stand-in node with the receipts of a few transactions."""
+    with StandInNode() as stand_in:
+        value = encode_abi(["uint256"], [5])
+        stand_in.receipts = {
+            "0x"
+            + "01"
+            * 32: _receipt(
+                "0x" + "01" * 32,
+                [
+                    _log(
+                        [TRANSFER_TOPIC, _topic(OWNER), _topic(SPENDER)],
+                        value,
+                        0,
+                    ),
+                    # not an event of the contract
+                    _log(["0x" + "ee" * 32], b"", 1),
+                    _log(
+                        [APPROVAL_TOPIC, _topic(OWNER), _topic(SPENDER)],
+                        value,
+                        2,
+                    ),
+                ],
+            ),
+            "0x"
+            + "02"
+            * 32: _receipt(
+                "0x" + "02" * 32,
+                [
+                    # an ERC721 transfer, with the token id as a topic
+                    _log(
+                        [
+                            TRANSFER_TOPIC,
+                            _topic(OWNER),
+                            _topic(SPENDER),
+                            "0x" + "00" * 31 + "05",
+                        ],
+                        b"",
+                        0,
+                    ),
+                    _log([], b"", 1),
+                ],
+            ),
+        }
+        yield stand_in
+
+
+@pytest.fixture
+def erc20_wrapper(node):  # pylint: disable=redefined-outer-name
+    """Get an ERC20Token wrapper talking to the stand-in node."""
+    return ERC20Token(Web3.HTTPProvider(node.endpoint_uri), TOKEN)
+
+
+def test_get_event__abi_parsed_once(
+    erc20_wrapper, monkeypatch  # pylint: disable=redefined-outer-name
+):
+    """The ABI and event objects are reused across calls."""
+    abi_calls = []
+    abi = ERC20Token.abi
+    monkeypatch.setattr(
+        erc20_wrapper, "abi", lambda: abi_calls.append(1) or abi()
+    )
+
+    for _ in range(3):
+        (transfer,) = erc20_wrapper.get_transfer_event("0x" + "01" * 32)
+        (approval,) = erc20_wrapper.get_approval_event("0x" + "01" * 32)
+    assert transfer["args"] == {"_from": OWNER, "_to": SPENDER, "_value": 5}
+    assert approval["args"] == {
+        "_owner": OWNER,
+        "_spender": SPENDER,
+        "_value": 5,
+    }
+    erc20_wrapper.total_supply  # pylint: disable=pointless-statement
+    assert len(abi_calls) == 1
+
+
+def test_get_events_from_receipts(
+    erc20_wrapper, node  # pylint: disable=redefined-outer-name
+):
+    """The contract's events are decoded from each receipt, in order."""
+    tx_hashes = ["0x" + "01" * 32, "0x" + "02" * 32] * 5
+    events = erc20_wrapper.get_events_from_receipts(tx_hashes, max_workers=4)
+
+    assert len(events) == len(tx_hashes)
+    assert [event["event"] for event in events[0]] == ["Transfer", "Approval"]
+    assert events[0][0]["args"]["_value"] == 5
+    assert events[0][1]["logIndex"] == 2
+    assert events[1] == ()
+    assert events[2] == events[0]
+    assert node.methods["eth_getTransactionReceipt"] == len(tx_hashes)
+
+
+def test_get_events_from_receipts__none(
+    erc20_wrapper,  # pylint: disable=redefined-outer-name
+):
+    """No transactions have no events."""
+    assert erc20_wrapper.get_events_from_receipts([]) == []
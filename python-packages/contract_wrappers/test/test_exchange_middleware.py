@@ -0,0 +1,70 @@
+"""Tests for :mod:`zero_ex.contract_wrappers.exchange.middleware`."""
+
+from eth_abi import encode_abi
+import pytest
+
+from zero_ex.contract_wrappers.exceptions import (
+    exception_class_from_rich_revert_selector,
+    NoExceptionForSelector,
+)
+from zero_ex.contract_wrappers.exchange import exceptions
+from zero_ex.contract_wrappers.exchange.exceptions import (
+    SignatureError,
+    SignatureErrorCodes,
+)
+from zero_ex.contract_wrappers.exchange.middleware import (
+    rich_revert_handler,
+)
+
+
+def _respond_with(response: dict):
+    """Get the middleware, wrapped around a node giving `response`."""
+    return rich_revert_handler(lambda method, params: response, None)
+
+
+def test_rich_revert_handler__raises_rich_revert():
+    """A rich revert is raised as its exception, with decoded fields."""
+    signer_address = "0x" + "12" * 20
+    return_data = SignatureError.selector + (
+        encode_abi(
+            ["uint8", "bytes32", "address", "bytes"],
+            [2, b"\x01" * 32, signer_address, b"\x03\x04"],
+        ).hex()
+    )
+    with pytest.raises(SignatureError) as raised:
+        _respond_with({"result": return_data})("eth_call", [])
+    assert (
+        SignatureErrorCodes(raised.value.errorCode)
+        == SignatureErrorCodes.INVALID_LENGTH
+    )
+    assert raised.value.hash == b"\x01" * 32
+    assert raised.value.signerAddress == signer_address
+    assert raised.value.signature == b"\x03\x04"
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        {"result": "0x" + "00" * 31 + "2a"},
+        {"result": "0x12345678" + "00" * 32},
+        {"result": SignatureError.selector + "00" * 31},
+        {"result": {"status": 1}},
+        {"result": None},
+        {"error": {"code": -32000, "message": "execution reverted"}},
+    ],
+)
+def test_rich_revert_handler__passes_other_responses(response):
+    """Responses which aren't known rich reverts are returned as they are."""
+    assert _respond_with(response)("eth_call", []) is response
+
+
+def test_exception_class_from_rich_revert_selector():
+    """Exception classes are looked up by selector."""
+    assert (
+        exception_class_from_rich_revert_selector(
+            SignatureError.selector, exceptions
+        )
+        is SignatureError
+    )
+    with pytest.raises(NoExceptionForSelector):
+        exception_class_from_rich_revert_selector("0x12345678", exceptions)
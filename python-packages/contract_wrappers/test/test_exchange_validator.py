@@ -0,0 +1,182 @@
+"""Tests for ExchangeValidator."""
+
+from jsonschema import ValidationError
+import pytest
+from web3 import Web3
+
+from zero_ex.contract_addresses import chain_to_addresses, ChainId
+from zero_ex.contract_wrappers import order_conversions
+from zero_ex.contract_wrappers.exchange import validator as validator_module
+from zero_ex.contract_wrappers.exchange.types import Order
+from zero_ex.contract_wrappers.exchange.validator import ExchangeValidator
+
+EXCHANGE_ADDRESS = chain_to_addresses(ChainId.GANACHE).exchange
+
+
+class _ChainIdProvider(Web3.HTTPProvider):
+    """Answer eth_chainId without a node, and count the requests."""
+
+    def __init__(self, endpoint_uri):
+        """Pretend to serve `endpoint_uri`."""
+        super().__init__(endpoint_uri)
+        self.n_requests = 0
+
+    def make_request(self, method, params):
+        """Count the request and answer it."""
+        assert method == "eth_chainId"
+        self.n_requests += 1
+        return {"jsonrpc": "2.0", "id": 1, "result": "0x539"}
+
+
+def _make_order(salt):
+    return Order(
+        makerAddress="0x5409ed021d9299bf6814279a6a1411a7e866a631",
+        takerAddress="0x0000000000000000000000000000000000000000",
+        feeRecipientAddress="0x0000000000000000000000000000000000000000",
+        senderAddress="0x0000000000000000000000000000000000000000",
+        makerAssetAmount=1000000000000000000,
+        takerAssetAmount=500000000000000000000,
+        makerFee=0,
+        takerFee=0,
+        expirationTimeSeconds=100000000000000,
+        salt=salt,
+        makerAssetData=bytes.fromhex("f47261b0" + "00" * 32),
+        takerAssetData=bytes.fromhex("f47261b0" + "11" * 32),
+        makerFeeAssetData=b"",
+        takerFeeAssetData=b"",
+    )
+
+
+@pytest.fixture
+def count_validations(monkeypatch):
+    """Count the orders the validator converts to JSON and validates."""
+    # pylint: disable=protected-access
+    validator_module._assert_valid_order.cache_clear()
+    calls = []
+    order_to_jsdict = validator_module.order_to_jsdict
+
+    def counting_order_to_jsdict(order, *args, **kwargs):
+        calls.append(order)
+        return order_to_jsdict(order, *args, **kwargs)
+
+    monkeypatch.setattr(
+        validator_module, "order_to_jsdict", counting_order_to_jsdict
+    )
+    return calls
+
+
+def test_exchange_validator__chain_id_requested_once_per_endpoint():
+    """Test that validators for the same node share its chain id."""
+    # pylint: disable=protected-access
+    validator_module._CHAIN_ID_BY_ENDPOINT.clear()
+    provider = _ChainIdProvider("http://chain-id-test:8545")
+    validators = [
+        ExchangeValidator(provider, EXCHANGE_ADDRESS),
+        ExchangeValidator(
+            _ChainIdProvider("http://chain-id-test:8545"), EXCHANGE_ADDRESS
+        ),
+    ]
+    assert provider.n_requests == 0
+    assert [validator.chain_id for validator in validators] == [1337, 1337]
+    assert provider.n_requests == 1
+
+    other_provider = _ChainIdProvider("http://other-chain-id-test:8545")
+    assert ExchangeValidator(other_provider, EXCHANGE_ADDRESS).chain_id == 1337
+    assert other_provider.n_requests == 1
+
+
+def test_exchange_validator__explicit_chain_id():
+    """Test that an explicit chain id spares the request."""
+    provider = _ChainIdProvider("http://explicit-chain-id-test:8545")
+    validator = ExchangeValidator(provider, EXCHANGE_ADDRESS, chain_id=50)
+    validator.assert_valid("fillOrder", "order", _make_order(1))
+    assert validator.chain_id == 50
+    assert provider.n_requests == 0
+
+
+def test_exchange_validator__valid_orders_remembered(
+    count_validations,  # pylint: disable=redefined-outer-name
+):
+    """Test that re-validating the same orders skips the schema checks."""
+    validator = ExchangeValidator(
+        Web3.HTTPProvider("http://127.0.0.1:8545"), EXCHANGE_ADDRESS, 1337
+    )
+    orders = [_make_order(salt) for salt in range(3)]
+
+    validator.assert_valid("batchFillOrders", "orders", orders)
+    assert len(count_validations) == 3
+    validator.assert_valid("batchFillOrders", "orders", orders)
+    validator.assert_valid("fillOrder", "order", orders[1])
+    assert len(count_validations) == 3
+
+    validator.assert_valid("fillOrder", "order", _make_order(3))
+    assert len(count_validations) == 4
+
+
+def test_exchange_validator__invalid_orders_always_rejected(
+    count_validations,  # pylint: disable=redefined-outer-name
+):
+    """Test that invalid orders are not remembered."""
+    validator = ExchangeValidator(
+        Web3.HTTPProvider("http://127.0.0.1:8545"), EXCHANGE_ADDRESS, 1337
+    )
+    order = {**_make_order(1), "makerAssetAmount": -1}
+    for _ in range(2):
+        with pytest.raises(ValidationError, match="does not match"):
+            validator.assert_valid("fillOrder", "order", order)
+    assert len(count_validations) == 2
+
+    unhashable_order = {**_make_order(2), "makerAssetData": bytearray(36)}
+    for _ in range(2):
+        with pytest.raises(TypeError, match="bytearray"):
+            validator.assert_valid("fillOrder", "order", unhashable_order)
+    assert len(count_validations) == 4
+
+
+@pytest.mark.parametrize(
+    "name,value",
+    [("salt", True), ("takerFee", False), ("makerAssetAmount", 1e18)],
+)
+def test_exchange_validator__equal_values_of_other_types_rejected(name, value):
+    """Test that a remembered order doesn't vouch for equal, invalid ones."""
+    # pylint: disable=protected-access
+    validator_module._assert_valid_order.cache_clear()
+    validator = ExchangeValidator(
+        Web3.HTTPProvider("http://127.0.0.1:8545"), EXCHANGE_ADDRESS, 1337
+    )
+    order = _make_order(1)
+    assert order[name] == value
+    validator.assert_valid("fillOrder", "order", order)
+
+    with pytest.raises(ValidationError, match="does not match"):
+        validator.assert_valid("fillOrder", "order", {**order, name: value})
+
+
+def test_exchange_validator__each_order_validated_once(monkeypatch):
+    """Test that an order not yet remembered is validated only once."""
+    # pylint: disable=protected-access
+    validator_module._assert_valid_order.cache_clear()
+    schema_validations = []
+    assert_valid = order_conversions.assert_valid
+
+    def counting_assert_valid(data, schema_id):
+        schema_validations.append(schema_id)
+        return assert_valid(data, schema_id)
+
+    monkeypatch.setattr(
+        order_conversions, "assert_valid", counting_assert_valid
+    )
+    validator = ExchangeValidator(
+        Web3.HTTPProvider("http://127.0.0.1:8545"), EXCHANGE_ADDRESS, 1337
+    )
+
+    validator.assert_valid("fillOrder", "order", _make_order(1))
+    assert schema_validations == ["/orderSchema"]
+
+    schema_validations.clear()
+    validator.assert_valid(
+        "batchFillOrders",
+        "orders",
+        [_make_order(salt) for salt in range(2, 5)],
+    )
+    assert schema_validations == ["/orderSchema"] * 3
@@ -0,0 +1,232 @@
+"""Tests for :mod:`zero_ex.contract_wrappers.log_scanner`."""
+
+from eth_abi import encode_abi
+from eth_utils import event_abi_to_log_topic
+import pytest
+from web3 import Web3
+
+from zero_ex.contract_addresses import chain_to_addresses, ChainId
+from zero_ex.contract_wrappers.exchange import Exchange
+from zero_ex.contract_wrappers.log_scanner import (
+    Checkpoint,
+    FileCheckpoint,
+    scan_logs,
+)
+
+from .stand_in_node import BLOCK_NUMBER, StandInNode
+
+EXCHANGE_ADDRESS = Web3.toChecksumAddress(
+    chain_to_addresses(ChainId.GANACHE).exchange
+)
+
+MAKER = Web3.toChecksumAddress("0x" + "11" * 20)
+
+SENDER = Web3.toChecksumAddress("0x" + "22" * 20)
+
+EVENT_ABIS = {
+    abi["name"]: abi for abi in Exchange.abi() if abi["type"] == "event"
+}
+
+
+def _log(event_name: str, args: dict, block_number: int) -> dict:
+    """Get an eth_getLogs result for an Exchange event."""
+    event_abi = EVENT_ABIS[event_name]
+    topics = ["0x" + bytes(event_abi_to_log_topic(event_abi)).hex()]
+    data_types = []
+    data_values = []
+    for param in event_abi["inputs"]:
+        if param["indexed"]:
+            topics.append(
+                "0x" + encode_abi([param["type"]], [args[param["name"]]]).hex()
+            )
+        else:
+            data_types.append(param["type"])
+            data_values.append(args[param["name"]])
+    return {
+        "address": EXCHANGE_ADDRESS,
+        "topics": topics,
+        "data": "0x" + encode_abi(data_types, data_values).hex(),
+        "blockNumber": hex(block_number),
+        "blockHash": f"0x{block_number:064x}",
+        "transactionHash": f"0x{block_number:064x}",
+        "transactionIndex": "0x0",
+        "logIndex": "0x0",
+        "removed": False,
+    }
+
+
+def _cancel_up_to(block_number: int) -> dict:
+    return _log(
+        "CancelUpTo",
+        {
+            "makerAddress": MAKER,
+            "orderSenderAddress": SENDER,
+            "orderEpoch": block_number,
+        },
+        block_number,
+    )
+
+
+@pytest.fixture
+def node():
+    """Run a stand-in node with CancelUpTo events in some blocks."""
+    with StandInNode() as stand_in:
+        stand_in.logs = [
+            _cancel_up_to(block_number) for block_number in range(0, 1000, 7)
+        ]
+        yield stand_in
+
+
+@pytest.fixture
+def exchange(node):  # pylint: disable=redefined-outer-name
+    """Get an Exchange wrapper talking to the stand-in node."""
+    return Exchange(Web3.HTTPProvider(node.endpoint_uri), EXCHANGE_ADDRESS)
+
+
+def test_scan_logs__decodes_events_in_order(
+    exchange, node  # pylint: disable=redefined-outer-name
+):
+    """Every event in the range is yielded, decoded, once and in order."""
+    fill = _log(
+        "Fill",
+        {
+            "makerAddress": MAKER,
+            "feeRecipientAddress": SENDER,
+            "makerAssetData": b"\x01" * 36,
+            "takerAssetData": b"\x02" * 36,
+            "makerFeeAssetData": b"",
+            "takerFeeAssetData": b"",
+            "orderHash": b"\x03" * 32,
+            "takerAddress": SENDER,
+            "senderAddress": SENDER,
+            "makerAssetFilledAmount": 10,
+            "takerAssetFilledAmount": 20,
+            "makerFeePaid": 0,
+            "takerFeePaid": 0,
+            "protocolFeePaid": 30,
+        },
+        500,
+    )
+    node.logs.insert(72, fill)
+
+    events = list(
+        scan_logs(
+            exchange,
+            ["Fill", "Cancel", "CancelUpTo"],
+            from_block=0,
+            to_block=999,
+            initial_range=100,
+        )
+    )
+    assert len(events) == len(node.logs)
+    assert [event["blockNumber"] for event in events] == sorted(
+        int(log["blockNumber"], 16) for log in node.logs
+    )
+    assert events[0]["event"] == "CancelUpTo"
+    assert events[0]["args"]["makerAddress"] == MAKER
+    (decoded_fill,) = [event for event in events if event["event"] == "Fill"]
+    assert decoded_fill["args"]["orderHash"] == b"\x03" * 32
+    assert decoded_fill["args"]["protocolFeePaid"] == 30
+    assert node.log_queries[0] == (0, 99)
+    assert node.log_queries[1] == (100, 299)
+
+
+def test_scan_logs__shrinks_range_on_too_many_results(
+    exchange, node  # pylint: disable=redefined-outer-name
+):
+    """A range with too many results is split until the node accepts it."""
+    node.max_logs = 10
+    events = list(
+        scan_logs(
+            exchange,
+            ["CancelUpTo"],
+            from_block=0,
+            to_block=999,
+            initial_range=1000,
+        )
+    )
+    assert len(events) == len(node.logs)
+    assert node.log_queries[0] == (0, 999)
+    assert node.log_queries[1] == (0, 499)
+
+
+def test_scan_logs__single_block_too_many_results(
+    exchange, node  # pylint: disable=redefined-outer-name
+):
+    """A node refusing even one block is an error."""
+    node.max_logs = 0
+    with pytest.raises(ValueError, match="more than 0 results"):
+        list(scan_logs(exchange, from_block=0, to_block=999))
+
+
+def test_scan_logs__unknown_event(
+    exchange,  # pylint: disable=redefined-outer-name
+):
+    """Scanning for an event which the contract doesn't have is an error."""
+    with pytest.raises(ValueError, match="Exchange has no events named Foo"):
+        next(scan_logs(exchange, ["Fill", "Foo"]))
+
+
+def test_scan_logs__no_event_names(
+    exchange,  # pylint: disable=redefined-outer-name
+):
+    """Scanning for an empty list of events is an error, not a wildcard."""
+    with pytest.raises(ValueError, match="at least one event"):
+        next(scan_logs(exchange, []))
+
+
+def test_scan_logs__defaults_to_latest_block(
+    exchange, node  # pylint: disable=redefined-outer-name
+):
+    """Without a last block, the scan stops at the latest block."""
+    events = list(scan_logs(exchange, ["CancelUpTo"], from_block=0))
+    assert [event["blockNumber"] for event in events] == list(
+        range(0, BLOCK_NUMBER + 1, 7)
+    )
+    assert node.methods["eth_blockNumber"] == 1
+
+
+def test_scan_logs__resumes_from_checkpoint(
+    exchange, tmp_path  # pylint: disable=redefined-outer-name
+):
+    """A scan stopped part way resumes at the last range not consumed."""
+    checkpoint = FileCheckpoint(str(tmp_path / "checkpoint.json"))
+    assert checkpoint.load() is None
+
+    scan = scan_logs(
+        exchange,
+        ["CancelUpTo"],
+        from_block=0,
+        to_block=999,
+        checkpoint=checkpoint,
+        initial_range=100,
+        max_range=100,
+    )
+    first = [next(scan) for _ in range(30)]
+    scan.close()
+    # 30 events take blocks 0 to 203, so the ranges up to block 199 are done
+    assert checkpoint.load() == 200
+
+    resumed = list(
+        scan_logs(
+            exchange,
+            ["CancelUpTo"],
+            from_block=0,
+            to_block=999,
+            checkpoint=FileCheckpoint(str(tmp_path / "checkpoint.json")),
+        )
+    )
+    assert resumed[0]["blockNumber"] == 203
+    assert first[-1]["blockNumber"] == 203
+    assert checkpoint.load() == 1000
+    assert [event["blockNumber"] for event in first[:-1] + resumed] == list(
+        range(0, 1000, 7)
+    )
+
+
+def test_checkpoint__in_memory():
+    """The base checkpoint remembers the block in memory."""
+    checkpoint = Checkpoint()
+    assert checkpoint.load() is None
+    checkpoint.save(42)
+    assert checkpoint.load() == 42
@@ -0,0 +1,169 @@
+"""Tests for :mod:`zero_ex.contract_wrappers.multicall`."""
+
+import pytest
+from web3 import Web3
+from web3.exceptions import ContractLogicError
+
+from zero_ex.contract_addresses import chain_to_addresses, ChainId
+from zero_ex.contract_wrappers.erc20_token import ERC20Token
+from zero_ex.contract_wrappers.multicall import Multicall
+
+from .stand_in_node import (
+    balance_of,
+    BLOCK_NUMBER,
+    GAS_PER_CALL,
+    MULTICALL_ADDRESS,
+    StandInNode,
+)
+
+OWNERS = [
+    Web3.toChecksumAddress("0x{:040x}".format(index)) for index in range(1, 21)
+]
+
+
+@pytest.fixture
+def node():
+    """Run a stand-in node for the duration of a test."""
+    with StandInNode() as stand_in:
+        yield stand_in
+
+
+@pytest.fixture
+def erc20_wrapper(node):  # pylint: disable=redefined-outer-name
+    """Get an ERC20Token wrapper talking to the stand-in node."""
+    return ERC20Token(
+        Web3.HTTPProvider(node.endpoint_uri),
+        chain_to_addresses(ChainId.GANACHE).ether_token,
+    )
+
+
+def test_multicall__one_call(
+    node, erc20_wrapper  # pylint: disable=redefined-outer-name
+):
+    """Test that deferred calls are aggregated into one eth_call."""
+    with Multicall(MULTICALL_ADDRESS) as calls:
+        futures = [
+            erc20_wrapper.balance_of.call.defer(owner) for owner in OWNERS
+        ]
+        assert len(calls) == len(OWNERS)
+
+    assert [future.result() for future in futures] == [
+        balance_of(owner) for owner in OWNERS
+    ]
+    assert node.aggregated == [(len(OWNERS), hex(BLOCK_NUMBER))]
+    assert node.batch_sizes == []
+
+
+def test_multicall__chunks(
+    node, erc20_wrapper  # pylint: disable=redefined-outer-name
+):
+    """Test that calls are aggregated in chunks of at most `max_size`."""
+    with Multicall(MULTICALL_ADDRESS, max_size=8):
+        futures = [
+            erc20_wrapper.balance_of.call.defer(owner) for owner in OWNERS
+        ]
+    assert [future.result() for future in futures] == [
+        balance_of(owner) for owner in OWNERS
+    ]
+    assert [size for (size, _) in node.aggregated] == [8, 8, 4]
+    # all at the same block
+    assert {block for (_, block) in node.aggregated} == {hex(BLOCK_NUMBER)}
+
+
+def test_multicall__chunks_split_to_fit_gas_limit(
+    node, erc20_wrapper  # pylint: disable=redefined-outer-name
+):
+    """Test that a chunk running out of gas is split until it fits."""
+    node.gas_limit = 6 * GAS_PER_CALL
+    with Multicall(MULTICALL_ADDRESS):
+        futures = [
+            erc20_wrapper.balance_of.call.defer(owner) for owner in OWNERS
+        ]
+    assert [future.result() for future in futures] == [
+        balance_of(owner) for owner in OWNERS
+    ]
+    assert [size for (size, _) in node.aggregated] == [
+        20,
+        10,
+        5,
+        5,
+        10,
+        5,
+        5,
+    ]
+
+
+def test_multicall__reverts_resolve_their_own_futures(
+    erc20_wrapper,  # pylint: disable=redefined-outer-name
+):
+    """Test that a call reverting only fails its own future."""
+    with Multicall(MULTICALL_ADDRESS):
+        total_supply = erc20_wrapper.total_supply.call.defer()
+        balance = erc20_wrapper.balance_of.call.defer(OWNERS[0])
+    with pytest.raises(ContractLogicError, match="unsupported"):
+        total_supply.result()
+    assert balance.result() == balance_of(OWNERS[0])
+
+
+def test_multicall__no_contract(
+    erc20_wrapper,  # pylint: disable=redefined-outer-name
+):
+    """Test that calls fail if there is no Multicall3 contract."""
+    with Multicall("0x" + "00" * 20):
+        balance = erc20_wrapper.balance_of.call.defer(OWNERS[0])
+    with pytest.raises(ValueError, match="No Multicall3 contract"):
+        balance.result()
+
+
+def test_multicall__block_error(
+    node, erc20_wrapper  # pylint: disable=redefined-outer-name
+):
+    """Test that an error getting the latest block fails every call."""
+    answer = node.answer
+
+    def answer_without_blocks(request):
+        if request["method"] == "eth_getBlockByNumber":
+            return {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": -32000, "message": "header not found"},
+            }
+        return answer(request)
+
+    node.answer = answer_without_blocks
+    with Multicall(MULTICALL_ADDRESS):
+        futures = [
+            erc20_wrapper.balance_of.call.defer(owner) for owner in OWNERS
+        ]
+    for future in futures:
+        with pytest.raises(ValueError, match="header not found"):
+            future.result()
+    assert node.aggregated == []
+
+
+def test_multicall__call_error_not_split(
+    node, erc20_wrapper  # pylint: disable=redefined-outer-name
+):
+    """Test that an error other than a chunk being too large isn't retried."""
+    answer = node.answer
+    calls = []
+
+    def answer_with_call_error(request):
+        if request["method"] == "eth_call":
+            calls.append(request)
+            return {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": -32000, "message": "header not found"},
+            }
+        return answer(request)
+
+    node.answer = answer_with_call_error
+    with Multicall(MULTICALL_ADDRESS):
+        futures = [
+            erc20_wrapper.balance_of.call.defer(owner) for owner in OWNERS
+        ]
+    for future in futures:
+        with pytest.raises(ValueError, match="header not found"):
+            future.result()
+    assert len(calls) == 1
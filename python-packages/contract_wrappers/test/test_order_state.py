@@ -0,0 +1,165 @@
+"""Tests for :mod:`zero_ex.contract_wrappers.order_state`."""
+
+import threading
+
+from eth_abi import decode_abi, encode_abi
+import pytest
+from web3.exceptions import ContractLogicError
+from web3.providers.base import BaseProvider
+
+from zero_ex.contract_addresses import chain_to_addresses, ChainId
+from zero_ex.contract_wrappers.dev_utils import DevUtils
+from zero_ex.contract_wrappers.exchange.types import Order, OrderStatus
+from zero_ex.contract_wrappers.order_state import get_orders_state
+
+_ORDER_TYPE = (
+    "(address,address,address,address,uint256,uint256,uint256,uint256,"
+    + "uint256,uint256,bytes,bytes,bytes,bytes)"
+)
+
+
+class _DevUtilsProvider(BaseProvider):
+    """Answer getOrderRelevantStates() calls, and remember their sizes.
+
+    Each order is reported fillable for its salt, with its salt as its hash,
+    and its signature is valid if it isn't empty.  Calls about more than
+    `max_orders`:code: orders fail with `error`:code:, by default as if they
+    had run out of gas.
+    """
+
+    def __init__(self, max_orders=None, error="out of gas"):
+        """Answer calls about at most `max_orders` orders."""
+        self.max_orders = max_orders
+        self.error = error
+        self.chunk_sizes = []
+        self.lock = threading.Lock()
+
+    def make_request(self, method, params):
+        """Answer the request."""
+        if method == "eth_chainId":
+            return {"jsonrpc": "2.0", "id": 1, "result": "0x539"}
+        if method == "eth_accounts":
+            return {"jsonrpc": "2.0", "id": 1, "result": []}
+        assert method == "eth_call"
+        (orders, signatures) = decode_abi(
+            [_ORDER_TYPE + "[]", "bytes[]"],
+            bytes.fromhex(params[0]["data"][10:]),
+        )
+        with self.lock:
+            self.chunk_sizes.append(len(orders))
+        if self.max_orders is not None and len(orders) > self.max_orders:
+            return {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "error": {"code": -32000, "message": self.error},
+            }
+        infos = [
+            (OrderStatus.FILLABLE.value, order[9].to_bytes(32, "big"), 0)
+            for order in orders
+        ]
+        result = encode_abi(
+            ["(uint8,bytes32,uint256)[]", "uint256[]", "bool[]"],
+            [
+                infos,
+                [order[9] for order in orders],
+                [signature != b"" for signature in signatures],
+            ],
+        )
+        return {"jsonrpc": "2.0", "id": 1, "result": "0x" + result.hex()}
+
+
+def _make_order(salt):
+    return Order(
+        makerAddress="0x5409ED021D9299bf6814279A6A1411A7e866A631",
+        takerAddress="0x0000000000000000000000000000000000000000",
+        feeRecipientAddress="0x0000000000000000000000000000000000000000",
+        senderAddress="0x0000000000000000000000000000000000000000",
+        makerAssetAmount=1000000000000000000,
+        takerAssetAmount=500000000000000000000,
+        makerFee=0,
+        takerFee=0,
+        expirationTimeSeconds=100000000000000,
+        salt=salt,
+        makerAssetData=bytes.fromhex("f47261b0" + "00" * 32),
+        takerAssetData=bytes.fromhex("f47261b0" + "11" * 32),
+        makerFeeAssetData=b"",
+        takerFeeAssetData=b"",
+    )
+
+
+ORDERS = [_make_order(salt) for salt in range(1, 26)]
+
+SIGNATURES = [b"" if salt % 5 == 0 else b"\x01" for salt in range(1, 26)]
+
+
+def _dev_utils(provider):
+    return DevUtils(provider, chain_to_addresses(ChainId.GANACHE).dev_utils)
+
+
+def _assert_aligned(orders_state):
+    assert orders_state.statuses == [OrderStatus.FILLABLE] * len(ORDERS)
+    assert orders_state.order_hashes == [
+        order["salt"].to_bytes(32, "big") for order in ORDERS
+    ]
+    assert orders_state.taker_asset_filled_amounts == [0] * len(ORDERS)
+    assert orders_state.fillable_taker_asset_amounts == [
+        order["salt"] for order in ORDERS
+    ]
+    assert orders_state.signature_validities == [
+        signature != b"" for signature in SIGNATURES
+    ]
+
+
+def test_get_orders_state__chunks():
+    """Test that chunks are fetched and put back in the order of the input."""
+    provider = _DevUtilsProvider()
+    orders_state = get_orders_state(
+        _dev_utils(provider), ORDERS, SIGNATURES, chunk_size=10
+    )
+    _assert_aligned(orders_state)
+    assert sorted(provider.chunk_sizes) == [5, 10, 10]
+
+
+def test_get_orders_state__one_chunk():
+    """Test that a list fitting in one chunk takes one call."""
+    provider = _DevUtilsProvider()
+    _assert_aligned(get_orders_state(_dev_utils(provider), ORDERS, SIGNATURES))
+    assert provider.chunk_sizes == [len(ORDERS)]
+
+
+def test_get_orders_state__chunks_split_when_too_large():
+    """Test that a chunk the node rejects is split until it fits."""
+    provider = _DevUtilsProvider(max_orders=4)
+    orders_state = get_orders_state(
+        _dev_utils(provider), ORDERS, SIGNATURES, chunk_size=10
+    )
+    _assert_aligned(orders_state)
+    accepted = [size for size in provider.chunk_sizes if size <= 4]
+    assert sum(accepted) == len(ORDERS)
+
+
+def test_get_orders_state__chunks_split_when_too_slow():
+    """Test that a chunk the node times out on is split until it fits."""
+    provider = _DevUtilsProvider(
+        max_orders=4, error="execution timeout exceeded"
+    )
+    _assert_aligned(get_orders_state(_dev_utils(provider), ORDERS, SIGNATURES))
+    accepted = [size for size in provider.chunk_sizes if size <= 4]
+    assert sum(accepted) == len(ORDERS)
+
+
+def test_get_orders_state__reverts_not_split():
+    """Test that a call which reverts is not split, but raises at once."""
+    provider = _DevUtilsProvider(max_orders=0, error="execution reverted")
+    with pytest.raises(ContractLogicError):
+        get_orders_state(_dev_utils(provider), ORDERS, SIGNATURES)
+    assert provider.chunk_sizes == [len(ORDERS)]
+
+
+def test_get_orders_state__invalid_arguments():
+    """Test that mismatched orders and signatures are rejected."""
+    dev_utils = _dev_utils(_DevUtilsProvider())
+    with pytest.raises(ValueError):
+        get_orders_state(dev_utils, ORDERS, SIGNATURES[1:])
+    with pytest.raises(ValueError):
+        get_orders_state(dev_utils, ORDERS, SIGNATURES, chunk_size=0)
@@ -10,7 +10,8 @@ import distutils.command.build_py
 from distutils.command.clean import clean
 import subprocess  # nosec
 from shutil import copytree, rmtree
-from os import environ, path
+from os import environ, listdir, path
+import json
 from sys import argv, exit  # pylint: disable=redefined-builtin
 
 from setuptools import find_packages, setup
@@ -23,19 +24,32 @@ class PreInstallCommand(distutils.command.build_py.build_py):
     description = "Pull in the schemas that live in the TypeScript package."
 
     def run(self):
-        """Copy files from TS area to local src."""
+        """Copy files from TS area to local src, and bundle them together."""
         pkgdir = path.dirname(path.realpath(argv[0]))
-        rmtree(
-            path.join(pkgdir, "src", "zero_ex", "json_schemas", "schemas"),
-            ignore_errors=True,
+        schemas_dir = path.join(
+            pkgdir, "src", "zero_ex", "json_schemas", "schemas"
         )
+        rmtree(schemas_dir, ignore_errors=True)
         copytree(
             path.join(
                 pkgdir, "..", "..", "packages", "json-schemas", "schemas"
             ),
-            path.join(pkgdir, "src", "zero_ex", "json_schemas", "schemas"),
+            schemas_dir,
         )
 
+        # a single file, keyed by schema id, that can be loaded in one go
+        bundle = {}
+        for file_name in sorted(listdir(schemas_dir)):
+            with open(
+                path.join(schemas_dir, file_name), encoding="utf-8"
+            ) as schema_file:
+                schema = json.load(schema_file)
+            bundle[schema["id"]] = schema
+        with open(
+            path.join(schemas_dir, "bundle.json"), "w", encoding="utf-8"
+        ) as bundle_file:
+            json.dump(bundle, bundle_file, separators=(",", ":"))
+
 
 class TestCommandExtension(TestCommand):
     """Run pytest tests."""
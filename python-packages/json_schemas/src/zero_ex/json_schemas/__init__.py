@@ -9,15 +9,59 @@ Install the package with pip::
 
 """
 
-from os import path
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import count, repeat
+from numbers import Number
+from os import cpu_count, listdir, path
 import json
-from typing import Mapping
+import re
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
-from pkg_resources import resource_string
 import jsonschema
+from jsonschema.exceptions import best_match
 from stringcase import snakecase
 
 
+_SCHEMAS_DIR = path.join(path.dirname(path.realpath(__file__)), "schemas")
+
+# Written by `setup.py pre_install`, alongside the individual schema files.
+_SCHEMA_BUNDLE_FILE = "bundle.json"
+
+
+def _read_schema_file(file_name: str) -> dict:
+    with open(path.join(_SCHEMAS_DIR, file_name), "rb") as schema_file:
+        return json.loads(schema_file.read())
+
+
+@lru_cache(maxsize=None)
+def _load_schema_bundle() -> Dict[str, dict]:
+    """Get every packaged schema, keyed by id.
+
+    All of the schemas are read at once from the bundle file.  If the bundle
+    hasn't been built, they are read from their individual files instead.
+    """
+    try:
+        return _read_schema_file(_SCHEMA_BUNDLE_FILE)
+    except FileNotFoundError:
+        schemas = (
+            _read_schema_file(file_name)
+            for file_name in sorted(listdir(_SCHEMAS_DIR))
+            if file_name.endswith(".json") and file_name != _SCHEMA_BUNDLE_FILE
+        )
+        return {schema["id"]: schema for schema in schemas}
+
+
 class _LocalRefResolver(jsonschema.RefResolver):
     """Resolve package-local JSON schema id's."""
 
@@ -26,21 +70,21 @@ class _LocalRefResolver(jsonschema.RefResolver):
         jsonschema.RefResolver.__init__(self, "", "")
 
     @staticmethod
-    def resolve_from_url(url: str) -> str:
+    def resolve_from_url(url: str) -> dict:
         """Resolve the given URL.
 
         :param url: a string representing the URL of the JSON schema to fetch.
-        :returns: a string representing the deserialized JSON schema
+        :returns: the deserialized JSON schema
         :raises jsonschema.ValidationError: when the resource associated with
                    `url` does not exist.
         """
         ref = url.replace("file://", "")
-        return json.loads(
-            resource_string(
-                "zero_ex.json_schemas",
-                f"schemas/{snakecase(ref.lstrip('/'))}.json",
-            )
-        )
+        try:
+            return _load_schema_bundle()[ref]
+        except KeyError:
+            # a few schema files aren't named after their id, so fall back to
+            # looking the schema up by file name
+            return _read_schema_file(f"{snakecase(ref.lstrip('/'))}.json")
 
 
 # Instantiate the `_LocalRefResolver()` only once so that `assert_valid()` can
@@ -49,6 +93,230 @@ class _LocalRefResolver(jsonschema.RefResolver):
 _LOCAL_RESOLVER = _LocalRefResolver()
 
 
+def _inline_refs(schema: Any) -> Any:
+    """Return a copy of `schema` with every `$ref` replaced by its target.
+
+    The 0x schemas reference each other only by absolute id and never
+    recursively, so the result is self-contained and a validator built from
+    it never has to consult the resolver while validating.
+    """
+    if isinstance(schema, list):
+        return [_inline_refs(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    inlined = {key: _inline_refs(value) for key, value in schema.items()}
+    if "$ref" not in inlined:
+        return inlined
+    _, target = _LOCAL_RESOLVER.resolve(inlined.pop("$ref"))
+    target = _inline_refs(target)
+    if not inlined:
+        return target
+    inlined["allOf"] = inlined.get("allOf", []) + [target]
+    return inlined
+
+
+@lru_cache(maxsize=None)
+def get_validator(schema_id: str) -> Any:
+    """Get a ready-to-use validator for the specified schema.
+
+    The schema is loaded, checked against its meta-schema and has its
+    `$ref`'s resolved only the first time a given `schema_id` is requested;
+    subsequent calls return the same validator instance, which makes
+    repeated validations much cheaper than calling
+    :code:`jsonschema.validate()` each time.
+
+    :param schema_id: id property of the JSON schema to validate against.
+    :returns: a :code:`jsonschema` validator instance, offering methods such
+        as :code:`is_valid()` and :code:`iter_errors()`.
+
+    >>> validator = get_validator("/addressSchema")
+    >>> validator.is_valid("0x5409ed021d9299bf6814279a6a1411a7e866a631")
+    True
+    >>> validator.is_valid("0x5409ed")
+    False
+    >>> get_validator("/addressSchema") is validator
+    True
+    """
+    _, schema = _LOCAL_RESOLVER.resolve(schema_id)
+    schema = _inline_refs(schema)
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+# The schemas that get a generated fast path in `assert_valid()`, because
+# they're the ones validated in bulk.
+_FAST_SCHEMA_IDS = (
+    "/orderSchema",
+    "/signedOrderSchema",
+    "/orderHashSchema",
+    "/addressSchema",
+    "/hexSchema",
+    "/wholeNumberSchema",
+)
+
+# Keywords with no bearing on validation.
+_ANNOTATION_KEYWORDS = {"id", "$schema", "title", "description"}
+
+# Python equivalents of the JSON types, as checked by jsonschema.
+_TYPE_EXPRESSIONS = {
+    "array": "isinstance({0}, list)",
+    "boolean": "isinstance({0}, bool)",
+    "integer": (
+        "(isinstance({0}, int) and not isinstance({0}, bool)"
+        + " or isinstance({0}, float) and {0}.is_integer())"
+    ),
+    "null": "{0} is None",
+    "number": "(isinstance({0}, Number) and not isinstance({0}, bool))",
+    "object": "isinstance({0}, dict)",
+    "string": "isinstance({0}, str)",
+}
+
+
+class _UnsupportedSchema(Exception):
+    """A schema uses keywords the expression builder can't translate."""
+
+
+class _SchemaExpressionBuilder:
+    """Translate a schema into one Python expression checking an instance.
+
+    Only the keywords used by the hot 0x schemas are supported, and
+    `build()`:code: raises :code:`_UnsupportedSchema` for anything else.
+    """
+
+    def __init__(self):
+        """Initialize a new instance."""
+        self.namespace: Dict[str, Any] = {"Number": Number}
+        self._names = count()
+
+    def build(self, schema: Any, instance: str) -> str:
+        """Get an expression which is true if `instance` matches `schema`."""
+        if schema is True or schema == {}:
+            return "True"
+        if not isinstance(schema, dict):
+            raise _UnsupportedSchema(schema)
+        unsupported = (
+            set(schema)
+            - _ANNOTATION_KEYWORDS
+            - {
+                "type",
+                "pattern",
+                "required",
+                "properties",
+                "allOf",
+                "anyOf",
+            }
+        )
+        if unsupported:
+            raise _UnsupportedSchema(unsupported)
+
+        conditions = []
+        if "type" in schema:
+            types = schema["type"]
+            if isinstance(types, str):
+                types = [types]
+            conditions.append(
+                "("
+                + " or ".join(
+                    _TYPE_EXPRESSIONS[type_].format(instance)
+                    for type_ in types
+                )
+                + ")"
+            )
+        if "pattern" in schema:
+            pattern = self._add_to_namespace(re.compile(schema["pattern"]))
+            conditions.append(
+                f"(not isinstance({instance}, str)"
+                + f" or {pattern}.search({instance}) is not None)"
+            )
+        object_conditions = [
+            f"{name!r} in {instance}" for name in schema.get("required", [])
+        ]
+        for name, subschema in schema.get("properties", {}).items():
+            object_conditions.append(
+                f"({name!r} not in {instance} or "
+                + self.build(subschema, f"{instance}[{name!r}]")
+                + ")"
+            )
+        if object_conditions:
+            conditions.append(
+                f"(not isinstance({instance}, dict) or "
+                + " and ".join(object_conditions)
+                + ")"
+            )
+        for subschema in schema.get("allOf", []):
+            conditions.append(self.build(subschema, instance))
+        if "anyOf" in schema:
+            conditions.append(
+                "("
+                + " or ".join(
+                    self.build(subschema, instance)
+                    for subschema in schema["anyOf"]
+                )
+                + ")"
+            )
+        return " and ".join(conditions) or "True"
+
+    def _add_to_namespace(self, value: Any) -> str:
+        name = f"_value_{next(self._names)}"
+        self.namespace[name] = value
+        return name
+
+
+@lru_cache(maxsize=None)
+def _get_fast_check(schema_id: str) -> Optional[Callable[[Any], bool]]:
+    """Get a generated function telling whether an instance is valid.
+
+    Returns None for the schemas which don't have such a function, either
+    because they aren't in `_FAST_SCHEMA_IDS`:code: or because they use
+    unsupported keywords.  The function gives the same answer as the
+    validator from `get_validator()`:code:, many times faster, but doesn't
+    explain why an instance is invalid.
+
+    >>> check = _get_fast_check("/wholeNumberSchema")
+    >>> check("1000"), check(1000), check("-1"), check(1.5)
+    (True, True, False, False)
+    """
+    if schema_id not in _FAST_SCHEMA_IDS:
+        return None
+    builder = _SchemaExpressionBuilder()
+    try:
+        expression = builder.build(get_validator(schema_id).schema, "instance")
+    except _UnsupportedSchema:
+        return None
+    # eval() is safe here, as the expression is built from the packaged
+    # schemas only: property names are embedded with repr(), and patterns are
+    # passed in the namespace
+    return eval(  # nosec # pylint: disable=eval-used
+        compile(f"lambda instance: {expression}", schema_id, "eval"),
+        builder.namespace,
+    )
+
+
+def warm_up() -> None:
+    """Prepare a validator for every packaged schema ahead of time.
+
+    Loading the schemas, resolving their `$ref`'s and checking them against
+    their meta-schemas otherwise happens the first time each schema is used.
+    Long-running processes can call this at startup to keep that work out of
+    their first validations.
+
+    Schemas which are themselves invalid are skipped, so that the error is
+    raised when, and only if, they are actually used.
+
+    >>> warm_up()
+    >>> get_validator.cache_info().currsize >= 40
+    True
+    """
+    for schema_id in _load_schema_bundle():
+        try:
+            get_validator(schema_id)
+        except jsonschema.SchemaError:
+            pass
+    for schema_id in _FAST_SCHEMA_IDS:
+        _get_fast_check(schema_id)
+
+
 def assert_valid(data: Mapping, schema_id: str) -> None:
     """Validate the given `data` against the specified `schema`.
 
@@ -93,8 +361,12 @@ def assert_valid(data: Mapping, schema_id: str) -> None:
     ...     "/orderSchema"
     ... )
     """
-    _, schema = _LOCAL_RESOLVER.resolve(schema_id)
-    jsonschema.validate(data, schema, resolver=_LOCAL_RESOLVER)
+    fast_check = _get_fast_check(schema_id)
+    if fast_check is not None and fast_check(data):
+        return
+    error = best_match(get_validator(schema_id).iter_errors(data))
+    if error is not None:
+        raise error
 
 
 def assert_valid_json(data: str, schema_id: str) -> None:
@@ -117,3 +389,89 @@ def assert_valid_json(data: str, schema_id: str) -> None:
     ... )
     """  # noqa: E501 (line too long)
     assert_valid(json.loads(data), schema_id)
+
+
+class ValidationFailure(NamedTuple):
+    """A document which failed validation in `validate_many()`:code:."""
+
+    position: int
+    """Index of the document in the validated sequence."""
+
+    message: str
+    """Description of the most relevant validation error."""
+
+    path: Tuple
+    """Keys and indices leading to the offending element of the document."""
+
+
+_MIN_DOCUMENTS_FOR_PROCESS_POOL = 5000
+
+
+def _validate_chunk(
+    schema_id: str, start: int, documents: List[Mapping]
+) -> List[ValidationFailure]:
+    """Validate `documents`:code:, numbering them from `start`:code:."""
+    validator = get_validator(schema_id)
+    fast_check = _get_fast_check(schema_id)
+    failures = []
+    for position, document in enumerate(documents, start):
+        if fast_check is not None and fast_check(document):
+            continue
+        error = best_match(validator.iter_errors(document))
+        if error is not None:
+            failures.append(
+                ValidationFailure(
+                    position, error.message, tuple(error.absolute_path)
+                )
+            )
+    return failures
+
+
+def validate_many(
+    documents: Iterable[Mapping], schema_id: str, workers: Optional[int] = 1
+) -> List[ValidationFailure]:
+    """Validate many documents against the specified schema, without raising.
+
+    All documents are checked with the same validator from
+    `get_validator()`:code:, and each failing document is reported with the
+    error `assert_valid()`:code: would have raised for it.
+
+    :param documents: Python dictionaries to be validated as JSON objects.
+    :param schema_id: id property of the JSON schema to validate against.
+    :param workers: The number of worker processes to split the documents
+        across, or None for one per CPU.  Batches too small to be worth the
+        cost of starting the pool (fewer than a few thousand documents) are
+        always validated in the calling process.
+    :returns: A :code:`ValidationFailure` for each invalid document, in input
+        order.  An empty list means every document is valid.
+
+    >>> validate_many(
+    ...     [
+    ...         {"v": 27, "r": "0x" + "ff"*32, "s": "0x" + "ff"*32},
+    ...         {"v": 27, "r": "0xff", "s": "0x" + "ff"*32},
+    ...         {"v": 27, "r": "0x" + "ff"*32, "s": "0x" + "ff"*32},
+    ...     ],
+    ...     "/ecSignatureSchema",
+    ... )
+    [ValidationFailure(position=1, message="'0xff' does not match '^0[xX][0-9A-Fa-f]{64}$'", path=('r',))]
+    """  # noqa: E501 (line too long)
+    documents = list(documents)
+    if workers is None:
+        workers = cpu_count() or 1
+
+    if workers <= 1 or len(documents) < _MIN_DOCUMENTS_FOR_PROCESS_POOL:
+        return _validate_chunk(schema_id, 0, documents)
+
+    # several chunks per worker, so that a slow chunk doesn't leave the other
+    # workers idle at the end
+    chunk_size = -(-len(documents) // (workers * 4))
+    starts = range(0, len(documents), chunk_size)
+    chunks = [documents[slice(start, start + chunk_size)] for start in starts]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return [
+            failure
+            for failures in executor.map(
+                _validate_chunk, repeat(schema_id), starts, chunks
+            )
+            for failure in failures
+        ]
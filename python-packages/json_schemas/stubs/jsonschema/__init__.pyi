@@ -1,5 +1,7 @@
 from typing import Any, Dict, Tuple
 
+from jsonschema import validators
+
 
 class RefResolver:
     def resolve(self, url: str) -> Tuple[str, Dict]:
@@ -8,4 +10,6 @@ class RefResolver:
 
 class ValidationError(Exception): pass
 
+class SchemaError(Exception): pass
+
 def validate(instance: Any, schema: Dict, cls=None, *args, **kwargs) -> None: pass
@@ -0,0 +1,4 @@
+from typing import Any, Iterable
+
+
+def best_match(errors: Iterable[Any], key: Any = ...) -> Any: ...
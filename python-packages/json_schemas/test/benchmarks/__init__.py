@@ -0,0 +1,6 @@
+"""Benchmarks of zero_ex.json_schemas.
+
+These are not collected as tests.  Run each one as a script, eg::
+
+    python -m test.benchmarks.bench_schema_validation
+"""
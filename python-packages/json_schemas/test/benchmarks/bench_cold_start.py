@@ -0,0 +1,80 @@
+"""Measure the cost of validating one order in a freshly started process.
+
+This is the situation of a short-lived command line tool.  Each measurement
+runs in a new interpreter, once with the schema bundle, and once reading the
+individual schema files.
+"""
+
+import json
+import subprocess  # nosec
+import sys
+from statistics import median
+from timeit import default_timer
+
+N_RUNS = 10
+
+_SCRIPT = """
+import json
+from timeit import default_timer
+start = default_timer()
+import zero_ex.json_schemas
+imported = default_timer()
+if {without_bundle}:
+    zero_ex.json_schemas._SCHEMA_BUNDLE_FILE = "no_such_file.json"
+zero_ex.json_schemas.assert_valid(
+    {{
+        "makerAddress": "0x5409ed021d9299bf6814279a6a1411a7e866a631",
+        "takerAddress": "0x0000000000000000000000000000000000000000",
+        "feeRecipientAddress": "0x0000000000000000000000000000000000000000",
+        "senderAddress": "0x0000000000000000000000000000000000000000",
+        "exchangeAddress": "0x4f833a24e1f95d70f028921e27040ca56e09ab0b",
+        "makerAssetData": "0xf47261b0",
+        "takerAssetData": "0xf47261b0",
+        "makerFeeAssetData": "0x",
+        "takerFeeAssetData": "0x",
+        "salt": "1",
+        "makerFee": "0",
+        "takerFee": "0",
+        "makerAssetAmount": "1000000000000000000",
+        "takerAssetAmount": "500000000000000000000",
+        "expirationTimeSeconds": "1700000000",
+        "chainId": 1337,
+    }},
+    "/orderSchema",
+)
+validated = default_timer()
+print(json.dumps([imported - start, validated - imported]))
+"""
+
+
+def report(label: str, seconds: float) -> None:
+    """Print the median duration of one step."""
+    print(f"{label:<48} {seconds * 1000:>9,.1f} ms")
+
+
+def main(n_runs: int = N_RUNS):
+    """Run the benchmarks and print the results."""
+    for label, without_bundle in (("bundle", False), ("schema files", True)):
+        imports, validations, processes = [], [], []
+        for _ in range(n_runs):
+            start = default_timer()
+            output = subprocess.check_output(  # nosec
+                [
+                    sys.executable,
+                    "-W",
+                    "ignore",
+                    "-c",
+                    _SCRIPT.format(without_bundle=without_bundle),
+                ]
+            )
+            processes.append(default_timer() - start)
+            import_time, validation_time = json.loads(output)
+            imports.append(import_time)
+            validations.append(validation_time)
+        report(f"import zero_ex.json_schemas ({label})", median(imports))
+        report(f"first assert_valid() ({label})", median(validations))
+        report(f"whole process ({label})", median(processes))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
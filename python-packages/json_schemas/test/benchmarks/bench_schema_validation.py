@@ -0,0 +1,107 @@
+"""Compare order validation throughput with and without cached validators."""
+
+import random
+import sys
+from timeit import default_timer
+
+import jsonschema
+
+from zero_ex.json_schemas import (
+    _LOCAL_RESOLVER,
+    assert_valid,
+    get_validator,
+    validate_many,
+)
+
+N_DOCUMENTS = 1000
+
+
+def make_random_order() -> dict:
+    """Get a JSON-compatible order populated with random values."""
+
+    def random_address():
+        return "0x" + random.getrandbits(160).to_bytes(20, "big").hex()
+
+    def random_asset_data():
+        return "0xf47261b0" + random.getrandbits(256).to_bytes(32, "big").hex()
+
+    return {
+        "makerAddress": random_address(),
+        "takerAddress": random_address(),
+        "feeRecipientAddress": random_address(),
+        "senderAddress": random_address(),
+        "exchangeAddress": random_address(),
+        "makerAssetData": random_asset_data(),
+        "takerAssetData": random_asset_data(),
+        "makerFeeAssetData": random_asset_data(),
+        "takerFeeAssetData": random_asset_data(),
+        "salt": str(random.getrandbits(256)),
+        "makerFee": str(random.getrandbits(64)),
+        "takerFee": str(random.getrandbits(64)),
+        "makerAssetAmount": str(random.getrandbits(128)),
+        "takerAssetAmount": str(random.getrandbits(128)),
+        "expirationTimeSeconds": str(random.getrandbits(32)),
+        "chainId": 1337,
+    }
+
+
+def make_random_signed_order() -> dict:
+    """Get a JSON-compatible signed order populated with random values."""
+    return {
+        **make_random_order(),
+        "signature": "0x" + random.getrandbits(520).to_bytes(65, "big").hex(),
+    }
+
+
+def report(label: str, n_documents: int, seconds: float) -> None:
+    """Print the throughput of one benchmark run."""
+    print(f"{label:<48} {n_documents / seconds:>12,.0f} documents/second")
+
+
+def main(n_documents: int = N_DOCUMENTS):
+    """Run the benchmarks and print the results."""
+    for schema_id, make_document in (
+        ("/orderSchema", make_random_order),
+        ("/signedOrderSchema", make_random_signed_order),
+    ):
+        documents = [make_document() for _ in range(n_documents)]
+        _, schema = _LOCAL_RESOLVER.resolve(schema_id)
+
+        start = default_timer()
+        for document in documents:
+            jsonschema.validate(document, schema, resolver=_LOCAL_RESOLVER)
+        report(
+            f"jsonschema.validate() {schema_id}",
+            n_documents,
+            default_timer() - start,
+        )
+
+        get_validator.cache_clear()
+        start = default_timer()
+        for document in documents:
+            assert_valid(document, schema_id)
+        report(
+            f"assert_valid() {schema_id}", n_documents, default_timer() - start
+        )
+
+        start = default_timer()
+        validator = get_validator(schema_id)
+        assert all(validator.is_valid(document) for document in documents)
+        report(
+            f"get_validator().is_valid() {schema_id}",
+            n_documents,
+            default_timer() - start,
+        )
+
+        for workers in (1, None):
+            start = default_timer()
+            assert validate_many(documents, schema_id, workers=workers) == []
+            report(
+                f"validate_many(workers={workers}) {schema_id}",
+                n_documents,
+                default_timer() - start,
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,152 @@
+"""Differential tests of the generated fast checks against jsonschema."""
+
+from decimal import Decimal
+import random
+
+import pytest
+
+from zero_ex.json_schemas import (
+    _FAST_SCHEMA_IDS,
+    _get_fast_check,
+    _SchemaExpressionBuilder,
+    _UnsupportedSchema,
+    get_validator,
+)
+
+N_CASES = 3000
+
+HEX_DIGITS = "0123456789abcdefABCDEF"
+
+
+def _random_hex(rng: random.Random, n_digits: int) -> str:
+    return "0x" + "".join(rng.choice(HEX_DIGITS) for _ in range(n_digits))
+
+
+def _random_string(rng: random.Random) -> str:
+    choice = rng.randrange(9)
+    if choice == 0:
+        return _random_hex(rng, rng.choice([0, 1, 2, 39, 40, 41, 63, 64, 65]))
+    if choice == 1:
+        return (
+            "0x"
+            + rng.getrandbits(8 * rng.randrange(40))
+            .to_bytes(40, "big")
+            .hex()[: rng.randrange(81)]
+        )
+    if choice == 2:
+        return str(rng.randrange(-(10 ** 30), 10 ** 30))
+    if choice == 3:
+        return rng.choice(["", "0x", "0X00", "1.5", "1e3", " 1", "١"])
+    if choice == 4:
+        return _random_string(rng) + rng.choice(["\n", " ", "g", "٢"])
+    if choice == 5:
+        return rng.choice(["0x", ""]) + _random_string(rng)
+    if choice == 6:
+        return _random_hex(rng, 40).lower()
+    if choice == 7:
+        return _random_hex(rng, 64)
+    return "".join(
+        chr(rng.randrange(32, 0x700)) for _ in range(rng.randrange(5))
+    )
+
+
+def _random_value(rng: random.Random, depth: int = 0):
+    choice = rng.randrange(12 if depth < 2 else 8)
+    if choice < 3:
+        return _random_string(rng)
+    if choice == 3:
+        return rng.randrange(-(10 ** 20), 10 ** 20)
+    if choice == 4:
+        return rng.choice(
+            [0.0, 1.0, 1.5, -2.0, 1e20, float("nan"), float("inf")]
+        )
+    if choice == 5:
+        return rng.choice([True, False, None])
+    if choice == 6:
+        return rng.choice([Decimal("1"), Decimal("1.5"), 1 + 2j])
+    if choice == 7:
+        return rng.randrange(2 ** 64)
+    if choice < 10:
+        return [_random_value(rng, depth + 1) for _ in range(rng.randrange(3))]
+    return {
+        _random_string(rng): _random_value(rng, depth + 1)
+        for _ in range(rng.randrange(3))
+    }
+
+
+def _valid_order(rng: random.Random) -> dict:
+    order = {
+        "makerAddress": _random_hex(rng, 40),
+        "takerAddress": _random_hex(rng, 40),
+        "feeRecipientAddress": _random_hex(rng, 40),
+        "senderAddress": _random_hex(rng, 40),
+        "exchangeAddress": _random_hex(rng, 40),
+        "makerAssetData": _random_hex(rng, 72).lower(),
+        "takerAssetData": _random_hex(rng, 72).lower(),
+        "makerFeeAssetData": "0x",
+        "takerFeeAssetData": "0x",
+        "salt": str(rng.getrandbits(256)),
+        "makerFee": rng.getrandbits(64),
+        "takerFee": "0",
+        "makerAssetAmount": str(rng.getrandbits(128)),
+        "takerAssetAmount": rng.getrandbits(128),
+        "expirationTimeSeconds": str(rng.getrandbits(32)),
+        "chainId": rng.choice([1, 1337, 1.5]),
+    }
+    if rng.randrange(2):
+        order["signature"] = _random_hex(rng, 132).lower()
+    return order
+
+
+def _random_document(rng: random.Random):
+    if rng.randrange(3) == 0:
+        return _random_value(rng)
+    document = _valid_order(rng)
+    for _ in range(rng.choice([0, 0, 1, 1, 2, 3])):
+        key = rng.choice(list(document) + ["signature", "extra"])
+        if key in document and rng.randrange(3) == 0:
+            del document[key]
+        else:
+            document[key] = _random_value(rng)
+    return document
+
+
+@pytest.mark.parametrize("schema_id", _FAST_SCHEMA_IDS)
+def test_fast_check_agrees_with_jsonschema(schema_id):
+    """Test the fast check against jsonschema with many random documents."""
+    fast_check = _get_fast_check(schema_id)
+    assert fast_check is not None
+    validator = get_validator(schema_id)
+
+    rng = random.Random(schema_id)
+    documents = [_random_document(rng) for _ in range(N_CASES)]
+    if schema_id not in ("/orderSchema", "/signedOrderSchema"):
+        documents = [
+            document[rng.choice(list(document))]
+            if isinstance(document, dict) and document
+            else document
+            for document in documents
+        ]
+
+    mismatches = [
+        document
+        for document in documents
+        if fast_check(document) != validator.is_valid(document)
+    ]
+    assert mismatches == []
+    n_valid = sum(map(validator.is_valid, documents))
+    assert 0 < n_valid < len(documents)
+
+
+def test_no_fast_check_for_other_schemas():
+    """Test that other schemas are left to jsonschema."""
+    assert _get_fast_check("/ecSignatureSchema") is None
+
+
+def test_unsupported_keywords_rejected():
+    """Test that the builder refuses keywords it can't translate."""
+    builder = _SchemaExpressionBuilder()
+    with pytest.raises(_UnsupportedSchema):
+        builder.build({"type": "string", "minLength": 1}, "instance")
+    with pytest.raises(_UnsupportedSchema):
+        builder.build({"allOf": [{"enum": [1, 2]}]}, "instance")
@@ -1,7 +1,24 @@
 """Tests of zero_ex.json_schemas"""
 
+import json
+from os import listdir, path
+import subprocess  # nosec
+import sys
 
-from zero_ex.json_schemas import _LOCAL_RESOLVER, assert_valid
+import jsonschema
+import pytest
+
+import zero_ex.json_schemas
+from zero_ex.json_schemas import (
+    _get_fast_check,
+    _load_schema_bundle,
+    _LOCAL_RESOLVER,
+    _SCHEMAS_DIR,
+    assert_valid,
+    get_validator,
+    validate_many,
+    ValidationFailure,
+)
 
 
 NULL_ADDRESS = "0x0000000000000000000000000000000000000000"
@@ -35,6 +52,8 @@ def test_assert_valid_caches_resources():
     on _LOCAL_RESOLVER
     """
     _LOCAL_RESOLVER._remote_cache.cache_clear()  # pylint: disable=W0212
+    get_validator.cache_clear()
+    _get_fast_check.cache_clear()
 
     assert_valid(EMPTY_ORDER, "/orderSchema")
     cache_info = (
@@ -42,3 +61,155 @@ def test_assert_valid_caches_resources():
     )
     assert cache_info.currsize == 4
     assert cache_info.hits > 0
+
+
+def test_get_validator_is_cached():
+    """Test that `get_validator()` builds each validator only once."""
+    get_validator.cache_clear()
+    validator = get_validator("/orderSchema")
+    assert get_validator("/orderSchema") is validator
+    assert get_validator("/signedOrderSchema") is not validator
+    assert get_validator.cache_info().currsize == 2
+
+
+def test_get_validator_resolves_refs_up_front():
+    """Test that validating never has to go back to the ref resolver."""
+    validator = get_validator("/signedOrderSchema")
+    _LOCAL_RESOLVER._remote_cache.cache_clear()  # pylint: disable=W0212
+
+    assert validator.is_valid({**EMPTY_ORDER, "signature": "0x00"})
+    cache_info = (
+        _LOCAL_RESOLVER._remote_cache.cache_info()  # pylint: disable=W0212
+    )
+    assert cache_info.hits == 0
+    assert cache_info.misses == 0
+
+
+@pytest.mark.parametrize(
+    "order",
+    [
+        {**EMPTY_ORDER, "makerAddress": "0x00"},
+        {**EMPTY_ORDER, "salt": "-1"},
+        {**EMPTY_ORDER, "makerAssetData": "not hex"},
+        {key: value for key, value in EMPTY_ORDER.items() if key != "salt"},
+    ],
+)
+def test_assert_valid_rejects_like_jsonschema(order):
+    """Test that `assert_valid()` raises the same error as before caching."""
+    _, schema = _LOCAL_RESOLVER.resolve("/orderSchema")
+    with pytest.raises(jsonschema.ValidationError) as expected:
+        jsonschema.validate(order, schema, resolver=_LOCAL_RESOLVER)
+    with pytest.raises(jsonschema.ValidationError) as actual:
+        assert_valid(order, "/orderSchema")
+    assert actual.value.message == expected.value.message
+
+
+BAD_ORDERS = {
+    1: {**EMPTY_ORDER, "makerAddress": "0x00"},
+    4: {**EMPTY_ORDER, "salt": "-1"},
+    5: {key: value for key, value in EMPTY_ORDER.items() if key != "salt"},
+}
+
+
+def _orders_with_some_bad(count):
+    return [BAD_ORDERS.get(index, EMPTY_ORDER) for index in range(count)]
+
+
+def test_validate_many_reports_failures_without_raising():
+    """Test that `validate_many()` reports each bad document by position."""
+    failures = validate_many(
+        iter(_orders_with_some_bad(8)), "/orderSchema", workers=1
+    )
+    assert [failure.position for failure in failures] == [1, 4, 5]
+    assert failures[0].path == ("makerAddress",)
+    assert failures[2].path == ()
+    assert "'salt' is a required property" in failures[2].message
+    for failure in failures:
+        with pytest.raises(jsonschema.ValidationError) as error:
+            assert_valid(BAD_ORDERS[failure.position], "/orderSchema")
+        assert failure.message == error.value.message
+
+
+def test_validate_many_all_valid():
+    """Test that `validate_many()` returns nothing when all is well."""
+    assert validate_many([EMPTY_ORDER] * 3, "/orderSchema") == []
+    assert validate_many([], "/orderSchema") == []
+
+
+def test_validate_many_across_worker_processes(monkeypatch):
+    """Test that the process pool gives the same results, in order."""
+    monkeypatch.setattr(
+        zero_ex.json_schemas, "_MIN_DOCUMENTS_FOR_PROCESS_POOL", 0
+    )
+    orders = _orders_with_some_bad(8) * 3
+    failures = validate_many(orders, "/orderSchema", workers=2)
+    assert failures == validate_many(orders, "/orderSchema", workers=1)
+    assert [failure.position for failure in failures] == [
+        1,
+        4,
+        5,
+        9,
+        12,
+        13,
+        17,
+        20,
+        21,
+    ]
+    assert isinstance(failures[0], ValidationFailure)
+
+
+def test_schema_bundle_matches_schema_files():
+    """Test that the bundle holds exactly the individual schema files."""
+    schemas = {}
+    for file_name in listdir(_SCHEMAS_DIR):
+        if file_name != "bundle.json":
+            with open(path.join(_SCHEMAS_DIR, file_name)) as schema_file:
+                schema = json.load(schema_file)
+            schemas[schema["id"]] = schema
+    assert _load_schema_bundle() == schemas
+
+
+def test_schemas_load_without_bundle(monkeypatch):
+    """Test that schemas are read from their files if there's no bundle."""
+    bundle = _load_schema_bundle()
+    _load_schema_bundle.cache_clear()
+    read_schema_file = (
+        zero_ex.json_schemas._read_schema_file  # pylint: disable=W0212
+    )
+    files_read = []
+
+    def read_schema_file_without_bundle(file_name):
+        files_read.append(file_name)
+        if file_name == "bundle.json":
+            raise FileNotFoundError(file_name)
+        return read_schema_file(file_name)
+
+    monkeypatch.setattr(
+        zero_ex.json_schemas,
+        "_read_schema_file",
+        read_schema_file_without_bundle,
+    )
+    try:
+        assert _load_schema_bundle() == bundle
+        assert files_read.count("bundle.json") == 1
+    finally:
+        _load_schema_bundle.cache_clear()
+
+
+def test_resolve_by_file_name():
+    """Test that schemas can still be resolved by the name of their file."""
+    assert _LOCAL_RESOLVER.resolve_from_url(
+        "/orderCancelSchema"
+    ) == _LOCAL_RESOLVER.resolve_from_url("/orderCancellationRequestsSchema")
+
+
+def test_import_does_not_load_pkg_resources():
+    """Test that importing the package avoids slow-to-import pkg_resources."""
+    subprocess.check_call(  # nosec
+        [
+            sys.executable,
+            "-c",
+            "import sys, zero_ex.json_schemas; "
+            + "assert 'pkg_resources' not in sys.modules",
+        ]
+    )
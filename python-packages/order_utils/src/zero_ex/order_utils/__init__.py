@@ -19,13 +19,34 @@ just this purpose.  To start it::
 
 from enum import auto, Enum
 import json
-from typing import cast, Tuple, Union
+import re
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Dict,
+    Iterable,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Union,
+)
+from weakref import WeakKeyDictionary
 
 from pkg_resources import resource_string
 from mypy_extensions import TypedDict
 
+from eth_keys import keys
+from eth_keys.exceptions import BadSignature
 from eth_typing import HexStr
-from eth_utils import keccak, remove_0x_prefix, to_bytes, to_checksum_address
+from eth_utils import (
+    keccak,
+    remove_0x_prefix,
+    to_bytes,
+    to_checksum_address,
+    ValidationError,
+)
 from web3 import Web3
 import web3.exceptions
 from web3.providers.base import BaseProvider
@@ -40,8 +61,8 @@ from zero_ex.dev_utils.type_assertions import (
     assert_is_address,
     assert_is_hex_string,
     assert_is_provider,
+    assert_is_string,
 )
-from zero_ex.json_schemas import assert_valid
 
 
 class _Constants:
@@ -51,6 +72,8 @@ class _Constants:
 
     eip191_header = b"\x19\x01"
 
+    eth_sign_message_header = b"\x19Ethereum Signed Message:\n32"
+
     eip712_domain_separator_schema_hash = keccak(
         b"EIP712Domain("
         + b"string name,"
@@ -95,17 +118,139 @@ class _Constants:
         WALLET = auto()
         VALIDATOR = auto()
         PRE_SIGNED = auto()
+        EIP1271_WALLET = auto()
         N_SIGNATURE_TYPES = auto()
 
 
+_ORDER_ADDRESS_FIELDS = (
+    "makerAddress",
+    "takerAddress",
+    "feeRecipientAddress",
+    "senderAddress",
+)
+
+_ORDER_UINT256_FIELDS = (
+    "makerAssetAmount",
+    "takerAssetAmount",
+    "makerFee",
+    "takerFee",
+    "expirationTimeSeconds",
+    "salt",
+)
+
+_ORDER_BYTES_FIELDS = (
+    "makerAssetData",
+    "takerAssetData",
+    "makerFeeAssetData",
+    "takerFeeAssetData",
+)
+
+_ADDRESS_PATTERN = re.compile(r"^0x[0-9a-fA-F]{40}$")
+
+_HEX_PATTERN = re.compile(r"^0x(([0-9a-f][0-9a-f])+)?$")
+
+_WHOLE_NUMBER_PATTERN = re.compile(r"^[0-9]+$")
+
+_UINT256_LIMIT = 2 ** 256
+
+VALIDATION_MODES = ("full", "structural", "none")
+"""Accepted values for the `validate`:code: parameter of the hashing functions.
+
+- ``"full"`` validates each order against the order JSON schema.
+- ``"structural"`` checks field presence, address lengths, and integer ranges
+  directly on the `Order`:code:, without converting it or invoking the JSON
+  schema validator.  Enough to guarantee that hashing succeeds, and much
+  faster than ``"full"``.
+- ``"none"`` skips validation entirely, for pipelines whose orders are known
+  to be well formed.
+"""
+
+
+def _assert_valid_order_structure(order: Order) -> None:
+    """Check that `order`:code: has all fields, each well formed for hashing.
+
+    Raises a ValueError (or a TypeError, for a field of the wrong type) at
+    the first field that fails.
+
+    >>> try: _assert_valid_order_structure(
+    ...     {'makerAddress': '0x0000000000000000000000000000000000000000'}
+    ... )
+    ... except ValueError as value_error: print(str(value_error))
+    ...
+    Expected order to have field 'takerAddress', but it doesn't.
+    """
+    fields = cast(Dict[str, Any], order)
+
+    for field in (
+        _ORDER_ADDRESS_FIELDS + _ORDER_UINT256_FIELDS + _ORDER_BYTES_FIELDS
+    ):
+        if field not in fields:
+            raise ValueError(
+                f"Expected order to have field '{field}', but it doesn't."
+            )
+
+    for field in _ORDER_ADDRESS_FIELDS:
+        assert_is_string(fields[field], field)
+        if not _ADDRESS_PATTERN.match(fields[field]):
+            raise ValueError(
+                f"Expected order field '{field}' to be a 20-byte hex"
+                + " address, but it's not."
+            )
+
+    for field in _ORDER_UINT256_FIELDS:
+        value = fields[field]
+        if isinstance(value, str) and _WHOLE_NUMBER_PATTERN.match(value):
+            value = int(value)
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise TypeError(
+                f"Expected order field '{field}' to be a whole number, as an"
+                + f" int or a str of decimal digits, not {repr(value)}."
+            )
+        if not 0 <= value < _UINT256_LIMIT:
+            raise ValueError(
+                f"Expected order field '{field}' to fit in a uint256, but"
+                + f" {value} doesn't."
+            )
+
+    for field in _ORDER_BYTES_FIELDS:
+        value = fields[field]
+        if isinstance(value, (bytes, bytearray)):
+            continue
+        assert_is_string(value, field)
+        if not _HEX_PATTERN.match(value):
+            raise ValueError(
+                f"Expected order field '{field}' to be bytes or a lowercase,"
+                + " 0x-prefixed hex string, but it's not."
+            )
+
+
+def _validate_order(
+    order: Order, exchange_address: str, chain_id: int, validate: str
+) -> None:
+    """Validate `order`:code: as prescribed by the `validate`:code: mode."""
+    if validate == "full":
+        # order_to_jsdict() validates its result against /orderSchema
+        order_to_jsdict(order, chain_id, exchange_address)
+    elif validate == "structural":
+        _assert_valid_order_structure(order)
+    elif validate != "none":
+        raise ValueError(
+            f"Expected parameter 'validate' to be one of {VALIDATION_MODES},"
+            + f" not {repr(validate)}."
+        )
+
+
 def generate_order_hash_hex(
-    order: Order, exchange_address: str, chain_id: int
+    order: Order, exchange_address: str, chain_id: int, validate: str = "full"
 ) -> str:
     """Calculate the hash of the given order as a hexadecimal string.
 
     :param order: The order to be hashed.  Must conform to `the 0x order JSON schema <https://github.com/0xProject/0x-monorepo/blob/development/packages/json-schemas/schemas/order_schema.json>`_.
     :param exchange_address: The address to which the 0x Exchange smart
         contract has been deployed.
+    :param chain_id: The ID of the chain on which the Exchange is deployed.
+    :param validate: How thoroughly to check `order`:code: before hashing it;
+        one of the `VALIDATION_MODES`:py:data:.
     :returns: A string, of ASCII hex digits, representing the order hash.
 
     Inputs and expected result below were copied from
@@ -134,69 +279,327 @@ def generate_order_hash_hex(
     'cb36e4fedb36508fb707e2c05e21bffc7a72766ccae93f8ff096693fff7f1714'
     """  # noqa: E501 (line too long)
     assert_is_address(exchange_address, "exchange_address")
-    assert_valid(
-        order_to_jsdict(order, chain_id, exchange_address), "/orderSchema"
-    )
+    _validate_order(order, exchange_address, chain_id, validate)
+
+    return OrderHasher(exchange_address, chain_id).order_hash(order).hex()
+
+
+def generate_order_hashes(
+    orders: Iterable[Order],
+    exchange_address: str,
+    chain_id: int,
+    validate: str = "full",
+) -> List[str]:
+    """Calculate the hashes of many orders sharing a single exchange & chain.
+
+    Equivalent to calling `generate_order_hash_hex()`:code: on each order in
+    turn, but the EIP-712 domain separator is computed only once, and the
+    struct encoding reuses one buffer across all of the orders.
+
+    :param orders: The orders to be hashed.  Each must conform to `the 0x
+        order JSON schema <https://github.com/0xProject/0x-monorepo/blob/development/packages/json-schemas/schemas/order_schema.json>`_.
+    :param exchange_address: The address to which the 0x Exchange smart
+        contract has been deployed.
+    :param chain_id: The ID of the chain on which the Exchange is deployed.
+    :param validate: How thoroughly to check each order before hashing it;
+        one of the `VALIDATION_MODES`:py:data:.
+    :returns: A list of strings, of ASCII hex digits, representing the order
+        hashes, in the same order as `orders`:code:.
+
+    >>> generate_order_hashes(
+    ...     [
+    ...         Order(
+    ...             makerAddress="0x0000000000000000000000000000000000000000",
+    ...             takerAddress="0x0000000000000000000000000000000000000000",
+    ...             feeRecipientAddress="0x0000000000000000000000000000000000000000",
+    ...             senderAddress="0x0000000000000000000000000000000000000000",
+    ...             makerAssetAmount="0",
+    ...             takerAssetAmount="0",
+    ...             makerFee="0",
+    ...             takerFee="0",
+    ...             expirationTimeSeconds="0",
+    ...             salt="0",
+    ...             makerAssetData=((0).to_bytes(1, byteorder='big') * 20),
+    ...             takerAssetData=((0).to_bytes(1, byteorder='big') * 20),
+    ...             makerFeeAssetData=((0).to_bytes(1, byteorder='big') * 20),
+    ...             takerFeeAssetData=((0).to_bytes(1, byteorder='big') * 20),
+    ...         ),
+    ...     ],
+    ...     exchange_address="0x1dc4c1cefef38a777b15aa20260a54e584b16c48",
+    ...     chain_id=1337
+    ... )
+    ['cb36e4fedb36508fb707e2c05e21bffc7a72766ccae93f8ff096693fff7f1714']
+    """  # noqa: E501 (line too long)
+    if validate not in VALIDATION_MODES:
+        raise ValueError(
+            f"Expected parameter 'validate' to be one of {VALIDATION_MODES},"
+            + f" not {repr(validate)}."
+        )
 
-    def pad_20_bytes_to_32(twenty_bytes: bytes):
-        return bytes(12) + twenty_bytes
+    hasher = OrderHasher(exchange_address, chain_id)
+    order_hashes = []
+    for order in orders:
+        _validate_order(order, exchange_address, chain_id, validate)
+        order_hashes.append(hasher.order_hash(order).hex())
+    return order_hashes
 
-    def int_to_32_big_endian_bytes(i: int):
-        return i.to_bytes(32, byteorder="big")
 
-    eip712_domain_struct_hash = keccak(
-        _Constants.eip712_domain_struct_header
-        + int_to_32_big_endian_bytes(int(chain_id))
-        + pad_20_bytes_to_32(to_bytes(hexstr=exchange_address))
+def _ensure_bytes(str_or_bytes: Union[str, bytes]) -> bytes:
+    return (
+        to_bytes(hexstr=cast(HexStr, str_or_bytes))
+        if isinstance(str_or_bytes, str)
+        else str_or_bytes
     )
 
-    def ensure_bytes(str_or_bytes: Union[str, bytes]) -> bytes:
-        return (
-            to_bytes(hexstr=cast(bytes, str_or_bytes))
-            if isinstance(str_or_bytes, str)
-            else str_or_bytes
+
+class OrderHasher:
+    """Calculate order hashes for one particular EIP-712 domain.
+
+    The domain (the Exchange contract address and the chain ID) is fixed at
+    construction, so its struct hash is computed only once, rather than once
+    per order as in `generate_order_hash_hex()`:code:.  The order struct is
+    encoded into a buffer that is allocated once and then overwritten for
+    each order hashed, so an instance must not be shared between threads.
+
+    Unlike `generate_order_hash_hex()`:code:, `order_hash()`:code: does not
+    validate the order; that's equivalent to hashing with `validate="none"`.
+
+    >>> hasher = OrderHasher(
+    ...     exchange_address="0x1dc4c1cefef38a777b15aa20260a54e584b16c48",
+    ...     chain_id=1337,
+    ... )
+    >>> hasher.order_hash(
+    ...     Order(
+    ...         makerAddress="0x0000000000000000000000000000000000000000",
+    ...         takerAddress="0x0000000000000000000000000000000000000000",
+    ...         feeRecipientAddress="0x0000000000000000000000000000000000000000",
+    ...         senderAddress="0x0000000000000000000000000000000000000000",
+    ...         makerAssetAmount="0",
+    ...         takerAssetAmount="0",
+    ...         makerFee="0",
+    ...         takerFee="0",
+    ...         expirationTimeSeconds="0",
+    ...         salt="0",
+    ...         makerAssetData=((0).to_bytes(1, byteorder='big') * 20),
+    ...         takerAssetData=((0).to_bytes(1, byteorder='big') * 20),
+    ...         makerFeeAssetData=((0).to_bytes(1, byteorder='big') * 20),
+    ...         takerFeeAssetData=((0).to_bytes(1, byteorder='big') * 20),
+    ...     )
+    ... ).hex()
+    'cb36e4fedb36508fb707e2c05e21bffc7a72766ccae93f8ff096693fff7f1714'
+    """  # noqa: E501 (line too long)
+
+    def __init__(self, exchange_address: str, chain_id: int):
+        """Compute the domain separator for the given Exchange and chain.
+
+        :param exchange_address: The address to which the 0x Exchange smart
+            contract has been deployed.
+        :param chain_id: The ID of the chain on which the Exchange is
+            deployed.
+        """
+        assert_is_address(exchange_address, "exchange_address")
+
+        self.exchange_address = exchange_address
+        self.chain_id = chain_id
+
+        eip712_domain_struct_hash = keccak(
+            _Constants.eip712_domain_struct_header
+            + int(chain_id).to_bytes(32, byteorder="big")
+            + bytes(12)
+            + to_bytes(hexstr=cast(HexStr, exchange_address))
+        )
+
+        # header + domain hash + order struct hash, the last of which gets
+        # overwritten for each order
+        self._message_buffer = bytearray(
+            _Constants.eip191_header + eip712_domain_struct_hash + bytes(32)
         )
 
-    eip712_order_struct_hash = keccak(
-        _Constants.eip712_order_schema_hash
-        + pad_20_bytes_to_32(to_bytes(hexstr=order["makerAddress"]))
-        + pad_20_bytes_to_32(to_bytes(hexstr=order["takerAddress"]))
-        + pad_20_bytes_to_32(to_bytes(hexstr=order["feeRecipientAddress"]))
-        + pad_20_bytes_to_32(to_bytes(hexstr=order["senderAddress"]))
-        + int_to_32_big_endian_bytes(int(order["makerAssetAmount"]))
-        + int_to_32_big_endian_bytes(int(order["takerAssetAmount"]))
-        + int_to_32_big_endian_bytes(int(order["makerFee"]))
-        + int_to_32_big_endian_bytes(int(order["takerFee"]))
-        + int_to_32_big_endian_bytes(int(order["expirationTimeSeconds"]))
-        + int_to_32_big_endian_bytes(int(order["salt"]))
-        + keccak(ensure_bytes(order["makerAssetData"]))
-        + keccak(ensure_bytes(order["takerAssetData"]))
-        + keccak(ensure_bytes(order["makerFeeAssetData"]))
-        + keccak(ensure_bytes(order["takerFeeAssetData"]))
+        # schema hash followed by one 32-byte word per order field.  the
+        # slices below locate each field's word within the buffer; addresses
+        # occupy the low-order 20 bytes of theirs.
+        fields = (
+            _ORDER_ADDRESS_FIELDS + _ORDER_UINT256_FIELDS + _ORDER_BYTES_FIELDS
+        )
+        self._struct_buffer = bytearray(
+            _Constants.eip712_order_schema_hash + bytes(32 * len(fields))
+        )
+        words = {
+            field: slice(32 * (index + 1), 32 * (index + 2))
+            for index, field in enumerate(fields)
+        }
+        self._address_words = [
+            (field, slice(words[field].start + 12, words[field].stop))
+            for field in _ORDER_ADDRESS_FIELDS
+        ]
+        self._uint256_words = [
+            (field, words[field]) for field in _ORDER_UINT256_FIELDS
+        ]
+        self._bytes_words = [
+            (field, words[field]) for field in _ORDER_BYTES_FIELDS
+        ]
+
+    def order_hash(self, order: Order) -> bytes:
+        """Calculate the hash of the given order.
+
+        :param order: The order to be hashed.
+        :returns: The 32-byte order hash.
+        """
+        fields = cast(Dict[str, Any], order)
+        buffer = self._struct_buffer
+
+        for field, word in self._address_words:
+            address = bytes.fromhex(remove_0x_prefix(fields[field]))
+            if len(address) != 20:
+                raise ValueError(
+                    f"Expected order field '{field}' to be a 20-byte"
+                    + " address, but it's not."
+                )
+            buffer[word] = address
+
+        for field, word in self._uint256_words:
+            buffer[word] = int(fields[field]).to_bytes(32, byteorder="big")
+
+        for field, word in self._bytes_words:
+            buffer[word] = keccak(_ensure_bytes(fields[field]))
+
+        self._message_buffer[34:66] = keccak(bytes(buffer))
+        return keccak(bytes(self._message_buffer))
+
+    def order_hash_hex(self, order: Order) -> str:
+        """Calculate the hash of the given order as a hexadecimal string.
+
+        :param order: The order to be hashed.
+        :returns: A string, of ASCII hex digits, representing the order hash.
+        """
+        return self.order_hash(order).hex()
+
+
+def _recover_signer_address_locally(
+    hash_bytes: bytes, signature_bytes: bytes
+) -> Optional[str]:
+    """Recover the signer of an EIP712 or EthSign signature, if possible.
+
+    :param hash_bytes: The 32-byte hash that was signed.
+    :param signature_bytes: The signature, as V, R, S and signature type.
+    :returns: The checksummed signer address; or the null address if the
+        signature is well formed but the EC parameters don't recover to any
+        key, which is how the `ecrecover`:code: precompile treats them; or
+        None if the signature can't be verified without the chain.
+    """
+    if len(hash_bytes) != 32 or len(signature_bytes) != 66:
+        return None
+
+    signature_type = signature_bytes[65]
+    if signature_type == _Constants.SignatureType.EIP712.value:
+        message_hash = hash_bytes
+    elif signature_type == _Constants.SignatureType.ETH_SIGN.value:
+        message_hash = keccak(_Constants.eth_sign_message_header + hash_bytes)
+    else:
+        return None
+
+    v = signature_bytes[0]  # pylint: disable=invalid-name
+    if v not in (27, 28):
+        return _Constants.null_address
+    try:
+        return (
+            keys.Signature(
+                vrs=(
+                    v - 27,
+                    int.from_bytes(signature_bytes[1:33], byteorder="big"),
+                    int.from_bytes(signature_bytes[33:65], byteorder="big"),
+                )
+            )
+            .recover_public_key_from_msg_hash(message_hash)
+            .to_checksum_address()
+        )
+    except (BadSignature, ValidationError):
+        return _Constants.null_address
+
+
+def _is_valid_signature_locally(
+    hash_bytes: bytes, signature_bytes: bytes, signer_address: str
+) -> Optional[bool]:
+    """Check a signature without the chain; None if that's not possible."""
+    # the null address is what ecrecover yields for an invalid signature, so
+    # leave it to the contract to decide what to make of it.
+    if int(signer_address, 16) == 0:
+        return None
+    recovered_address = _recover_signer_address_locally(
+        hash_bytes, signature_bytes
     )
+    if recovered_address is None:
+        return None
+    return recovered_address.lower() == signer_address.lower()
+
+
+def recover_signer_address(data: str, signature: str) -> str:
+    """Recover the address that produced the given signature, offline.
+
+    Only signatures of type EIP712 or EthSign can be recovered this way, since
+    the validity of the other types depends on on-chain state.  Recovery is
+    done with `eth_keys`:code:, which is much faster if the optional
+    `coincurve`:code: package is installed.
+
+    :param data: The hex encoded 32-byte hash signed by the supplied
+        signature.
+    :param signature: The hex encoded signature, consisting of V, R, S and a
+        trailing signature type byte.
+    :returns: The checksummed address of the signer.  Like the
+        `ecrecover`:code: precompile, returns the null address if the
+        signature's EC parameters are invalid.
+    :raises ValueError: if the signature is not a 66-byte signature of type
+        EIP712 or EthSign, or if the data is not 32 bytes long.
+
+    >>> recover_signer_address(
+    ...     '0x6927e990021d23b1eb7b8789f6a6feaf98fe104bb0cf8259421b79f9a34222b0',
+    ...     '0x1B61a3ed31b43c8780e905a260a35faefcc527be7516aa11c0256729b5b351bc3340349190569279751135161d22529dc25add4f6069af05be04cacbda2ace225403',
+    ... )
+    '0x5409ED021D9299bf6814279A6A1411A7e866A631'
+    """  # noqa: E501 (line too long)
+    assert_is_hex_string(data, "data")
+    assert_is_hex_string(signature, "signature")
 
-    return keccak(
-        _Constants.eip191_header
-        + eip712_domain_struct_hash
-        + eip712_order_struct_hash
-    ).hex()
+    signer_address = _recover_signer_address_locally(
+        bytes.fromhex(remove_0x_prefix(HexStr(data))),
+        bytes.fromhex(remove_0x_prefix(HexStr(signature))),
+    )
+    if signer_address is None:
+        raise ValueError(
+            "Expected a 66-byte EIP712 or EthSign signature over a 32-byte"
+            + " hash, which can be recovered without the chain, but got"
+            + " something else."
+        )
+    return signer_address
 
 
 def is_valid_signature(
-    provider: BaseProvider, data: str, signature: str, signer_address: str
+    provider: Optional[BaseProvider],
+    data: str,
+    signature: str,
+    signer_address: str,
 ) -> bool:
     """Check the validity of the supplied signature.
 
     Check if the supplied `signature`:code: corresponds to signing `data`:code:
     with the private key corresponding to `signer_address`:code:.
 
+    EIP712 and EthSign signatures are checked locally, by recovering the
+    signer's address, without any network access.  All other signature types
+    (Wallet, Validator, PreSigned, EIP1271Wallet, and malformed signatures)
+    are checked by calling the Exchange contract's `isValidHashSignature()`
+    method through `provider`:code:.
+
     :param provider: A Web3 provider able to access the 0x Exchange contract.
+        May be None, in which case only signatures that can be checked
+        locally are accepted.
     :param data: The hex encoded data signed by the supplied signature.
     :param signature: The hex encoded signature.
     :param signer_address: The hex encoded address that signed the data to
         produce the supplied signature.
-    :returns: Tuple consisting of a boolean and a string.  Boolean is true if
-        valid, false otherwise.  If false, the string describes the reason.
+    :returns: True if valid, False otherwise.
+    :raises ValueError: if `provider`:code: is None and the signature can only
+        be checked on-chain.
 
     >>> is_valid_signature(
     ...     Web3.HTTPProvider("http://127.0.0.1:8545"),
@@ -205,12 +608,35 @@ def is_valid_signature(
     ...     '0x5409ed021d9299bf6814279a6a1411a7e866a631',
     ... )
     True
+    >>> is_valid_signature(
+    ...     None,
+    ...     '0x6927e990021d23b1eb7b8789f6a6feaf98fe104bb0cf8259421b79f9a34222b0',
+    ...     '0x1B61a3ed31b43c8780e905a260a35faefcc527be7516aa11c0256729b5b351bc3340349190569279751135161d22529dc25add4f6069af05be04cacbda2ace225403',
+    ...     '0x0000000000000000000000000000000000000001',
+    ... )
+    False
     """  # noqa: E501 (line too long)
-    assert_is_provider(provider, "provider")
+    if provider is not None:
+        assert_is_provider(provider, "provider")
     assert_is_hex_string(data, "data")
     assert_is_hex_string(signature, "signature")
     assert_is_address(signer_address, "signer_address")
 
+    hash_bytes = bytes.fromhex(remove_0x_prefix(HexStr(data)))
+    signature_bytes = bytes.fromhex(remove_0x_prefix(HexStr(signature)))
+
+    is_valid = _is_valid_signature_locally(
+        hash_bytes, signature_bytes, signer_address
+    )
+    if is_valid is not None:
+        return is_valid
+
+    if provider is None:
+        raise ValueError(
+            "A provider is required to check a signature that can't be"
+            + " verified locally, but parameter 'provider' is None."
+        )
+
     return Exchange(
         provider,
         chain_to_addresses(
@@ -219,9 +645,7 @@ def is_valid_signature(
             )
         ).exchange,
     ).is_valid_hash_signature.call(
-        bytes.fromhex(remove_0x_prefix(HexStr(data))),
-        to_checksum_address(signer_address),
-        bytes.fromhex(remove_0x_prefix(HexStr(signature))),
+        hash_bytes, to_checksum_address(signer_address), signature_bytes
     )
 
 
@@ -285,6 +709,13 @@ def _convert_ec_signature_to_vrs_hex(signature: ECSignature) -> str:
     )
 
 
+# The parser (R, S, V or V, R, S) that last produced a valid signature from
+# each provider's eth_sign, so that sign_hash() can try it first next time.
+_SIGNATURE_PARSER_BY_PROVIDER: MutableMapping[
+    BaseProvider, Callable[[str], ECSignature]
+] = WeakKeyDictionary()
+
+
 def sign_hash(
     web3_or_provider: Union[Web3, BaseProvider],
     signer_address: str,
@@ -326,56 +757,60 @@ def sign_hash(
         signer_address, hexstr=hash_hex.replace("0x", "")
     ).hex()
 
-    valid_v_param_values = [27, 28]
+    return _convert_eth_sign_result(
+        web3_instance.provider, signer_address, hash_hex, signature
+    )
+
+
+def _convert_eth_sign_result(
+    provider: BaseProvider, signer_address: str, hash_hex: str, signature: str
+) -> str:
+    """Convert an eth_sign result into a 0x EthSign signature.
 
+    :param provider: The provider that produced `signature`:code:.
+    :param signer_address: The address of the signing account.
+    :param hash_hex: The hash that was signed.
+    :param signature: The hex encoded result of eth_sign.
+    :returns: The signature, as V, R, S and the EthSign signature type.
+    """
     # HACK: There is no consensus on whether the signatureHex string should be
     # formatted as v + r + s OR r + s + v, and different clients (even
     # different versions of the same client) return the signature params in
     # different orders. In order to support all client implementations, we
     # parse the signature in both ways, and evaluate if either one is a valid
     # signature.  r + s + v is the most prevalent format from eth_sign, so we
-    # attempt this first.
+    # attempt this first, unless this provider has already been seen to use
+    # the other.  Validity is decided by recovering the signer locally; the
+    # chain is consulted only when that's inconclusive.
+
+    parsers: List[Callable[[str], ECSignature]] = [
+        _parse_signature_hex_as_rsv,
+        _parse_signature_hex_as_vrs,
+    ]
+    known_parser = _SIGNATURE_PARSER_BY_PROVIDER.get(provider)
+    if known_parser is not None:
+        parsers.remove(known_parser)
+        parsers.insert(0, known_parser)
+
+    for parse in parsers:
+        ec_signature = parse(signature)
+        if ec_signature["v"] not in (27, 28):
+            continue
 
-    ec_signature = _parse_signature_hex_as_rsv(signature)
-    if ec_signature["v"] in valid_v_param_values:
         signature_as_vrst_hex = (
             _convert_ec_signature_to_vrs_hex(ec_signature)
-            + _Constants.SignatureType.ETH_SIGN.value.to_bytes(
-                1, byteorder="big"
-            ).hex()
-        )
-
-        valid = is_valid_signature(
-            web3_instance.provider,
-            hash_hex,
-            signature_as_vrst_hex,
-            signer_address,
-        )
-
-        if valid is True:
-            return signature_as_vrst_hex
-
-    ec_signature = _parse_signature_hex_as_vrs(signature)
-    if ec_signature["v"] in valid_v_param_values:
-        signature_as_vrst_hex = (
-            _convert_ec_signature_to_vrs_hex(ec_signature)
-            + _Constants.SignatureType.ETH_SIGN.value.to_bytes(
-                1, byteorder="big"
-            ).hex()
-        )
-        valid = is_valid_signature(
-            web3_instance.provider,
-            hash_hex,
-            signature_as_vrst_hex,
-            signer_address,
+            + f"{_Constants.SignatureType.ETH_SIGN.value:02x}"
         )
 
-        if valid is True:
+        if is_valid_signature(
+            provider, hash_hex, signature_as_vrst_hex, signer_address
+        ):
+            _SIGNATURE_PARSER_BY_PROVIDER[provider] = parse
             return signature_as_vrst_hex
 
     raise RuntimeError(
         "Signature returned from web3 provider is in an unknown format. "
-        + "Signature was: {signature}"
+        + f"Signature was: {signature}"
     )
 
 
@@ -0,0 +1,349 @@
+"""Sign and verify signatures in bulk.
+
+:func:`sign_orders` hashes and signs many orders at once, either with a local
+private key or by the node, and :func:`verify_signatures` checks many
+signatures across a pool of worker processes.  Each is equivalent to doing
+its work one item at a time with the functions in :mod:`zero_ex.order_utils`,
+only faster.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import json
+from os import cpu_count
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union
+
+from eth_keys import datatypes
+from eth_typing import HexStr
+from eth_utils import remove_0x_prefix, to_checksum_address
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+from zero_ex.contract_wrappers.exchange.types import Order
+from zero_ex.contract_wrappers.order_conversions import order_to_jsdict
+from zero_ex.dev_utils.type_assertions import assert_is_address
+from zero_ex.order_utils import (
+    _Constants,
+    _convert_eth_sign_result,
+    _is_valid_signature_locally,
+    is_valid_signature,
+    OrderHasher,
+)
+
+
+def _split_into_chunks(items: Sequence, chunk_size: int) -> List[Sequence]:
+    """Split `items`:code: into consecutive chunks of `chunk_size`:code:.
+
+    >>> _split_into_chunks([1, 2, 3, 4, 5], 2)
+    [[1, 2], [3, 4], [5]]
+    """
+    starts = range(0, len(items), chunk_size)
+    ends = list(starts[1:]) + [len(items)]
+    return [items[start:end] for start, end in zip(starts, ends)]
+
+
+_SIGNATURE_NEEDS_CHAIN = 2
+
+_MIN_SIGNATURES_FOR_PROCESS_POOL = 2000
+
+
+def _verify_signatures_locally(
+    items: Sequence[Tuple[str, str, str]]
+) -> bytearray:
+    """Check each (data, signature, signer) triple without the chain.
+
+    :returns: One byte per item: 1 if valid, 0 if invalid, or
+        `_SIGNATURE_NEEDS_CHAIN`:code: if it can't be checked locally.
+    """
+    results = bytearray(len(items))
+    for index, (data, signature, signer_address) in enumerate(items):
+        is_valid = _is_valid_signature_locally(
+            bytes.fromhex(remove_0x_prefix(HexStr(data))),
+            bytes.fromhex(remove_0x_prefix(HexStr(signature))),
+            signer_address,
+        )
+        results[index] = (
+            _SIGNATURE_NEEDS_CHAIN if is_valid is None else int(is_valid)
+        )
+    return results
+
+
+def verify_signatures(
+    items: Iterable[Tuple[str, str, str]],
+    workers: Optional[int] = None,
+    provider: Optional[BaseProvider] = None,
+) -> bytearray:
+    """Check the validity of many signatures, using multiple processes.
+
+    Each item is checked as by `is_valid_signature()`:code:.  The items are
+    split into chunks, which are verified in parallel by a pool of worker
+    processes.  Batches too small to be worth the cost of starting the pool
+    (fewer than a couple thousand items), or a `workers`:code: value of 1,
+    are verified in the calling process instead.
+
+    Signatures that can't be checked locally are checked afterwards, one at a
+    time, in the calling process, through `provider`:code:.
+
+    :param items: Triples of hex encoded data (the signed hash), hex encoded
+        signature, and signer address.
+    :param workers: The number of worker processes.  Defaults to the number
+        of CPUs.
+    :param provider: A Web3 provider able to access the 0x Exchange contract,
+        for signatures that can only be checked on-chain.
+    :returns: One byte per item, in input order: 1 if the signature is valid,
+        and 0 if it isn't.
+    :raises ValueError: if `provider`:code: is None and some signature can
+        only be checked on-chain.
+
+    >>> list(verify_signatures([
+    ...     (
+    ...         '0x6927e990021d23b1eb7b8789f6a6feaf98fe104bb0cf8259421b79f9a34222b0',
+    ...         '0x1B61a3ed31b43c8780e905a260a35faefcc527be7516aa11c0256729b5b351bc3340349190569279751135161d22529dc25add4f6069af05be04cacbda2ace225403',
+    ...         '0x5409ed021d9299bf6814279a6a1411a7e866a631',
+    ...     ),
+    ...     (
+    ...         '0x6927e990021d23b1eb7b8789f6a6feaf98fe104bb0cf8259421b79f9a34222b0',
+    ...         '0x1B61a3ed31b43c8780e905a260a35faefcc527be7516aa11c0256729b5b351bc3340349190569279751135161d22529dc25add4f6069af05be04cacbda2ace225403',
+    ...         '0x0000000000000000000000000000000000000001',
+    ...     ),
+    ... ]))
+    [1, 0]
+    """  # noqa: E501 (line too long)
+    items = list(items)
+    if workers is None:
+        workers = cpu_count() or 1
+
+    if workers <= 1 or len(items) < _MIN_SIGNATURES_FOR_PROCESS_POOL:
+        results = _verify_signatures_locally(items)
+    else:
+        # several chunks per worker, so that a slow chunk doesn't leave the
+        # other workers idle at the end
+        chunk_size = -(-len(items) // (workers * 4))
+        chunks = _split_into_chunks(items, chunk_size)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = bytearray().join(
+                executor.map(_verify_signatures_locally, chunks)
+            )
+
+    index = results.find(_SIGNATURE_NEEDS_CHAIN)
+    while index != -1:
+        results[index] = is_valid_signature(provider, *items[index])
+        index = results.find(_SIGNATURE_NEEDS_CHAIN, index + 1)
+
+    return results
+
+
+_MAX_ETH_SIGN_BATCH_SIZE = 500
+
+
+class _BatchHTTPProvider(Web3.HTTPProvider):
+    """An `HTTPProvider`:code: sending a whole JSON-RPC batch as one request.
+
+    Its `make_request()`:code: takes the list of requests making up the batch
+    in place of a request's parameters, and returns the list of responses.
+    """
+
+    def encode_rpc_request(self, method: str, params: Any) -> bytes:
+        """Encode the requests of the batch `params`:code:."""
+        return json.dumps(params).encode("utf-8")
+
+    def decode_rpc_response(self, raw_response: bytes) -> Any:
+        """Decode the responses to a batch, or the node's error."""
+        return json.loads(raw_response)
+
+
+def _eth_sign_hashes(
+    web3_instance: Web3, signer_address: str, hashes: List[bytes]
+) -> List[str]:
+    """Have the provider eth_sign each hash, batching requests if possible.
+
+    Over an `HTTPProvider`:code:, the eth_sign requests are sent as JSON-RPC
+    batches of up to `_MAX_ETH_SIGN_BATCH_SIZE`:code: requests each.  Other
+    providers are asked for one signature at a time.
+
+    :returns: The hex encoded eth_sign results, in the order of `hashes`:code:.
+    """
+    provider = web3_instance.provider
+    if not isinstance(provider, Web3.HTTPProvider):
+        return [
+            web3_instance.eth.sign(  # type: ignore # pylint: disable=no-member
+                signer_address, hexstr=HexStr(hash_bytes.hex())
+            ).hex()
+            for hash_bytes in hashes
+        ]
+
+    batch_provider = _BatchHTTPProvider(
+        provider.endpoint_uri, provider.get_request_kwargs()
+    )
+    signatures: List[str] = []
+    for batch in _split_into_chunks(hashes, _MAX_ETH_SIGN_BATCH_SIZE):
+        responses = batch_provider.make_request(
+            "eth_sign",
+            [
+                {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "method": "eth_sign",
+                    "params": [signer_address, "0x" + hash_bytes.hex()],
+                }
+                for request_id, hash_bytes in enumerate(batch)
+            ],
+        )
+        if not isinstance(responses, list):
+            # the node rejected the batch as a whole
+            raise RuntimeError(
+                "eth_sign JSON-RPC batch failed: "
+                + str(responses.get("error", responses))
+            )
+        results_by_id = {result.get("id"): result for result in responses}
+        for request_id in range(len(batch)):
+            result = results_by_id.get(request_id, {})
+            if "result" not in result:
+                raise RuntimeError(
+                    "eth_sign failed within a JSON-RPC batch: "
+                    + str(result.get("error", "no response"))
+                )
+            signatures.append(result["result"])
+    return signatures
+
+
+def _sign_hashes_by_node(
+    web3_instance: Web3, signer_address: str, hashes: List[bytes]
+) -> List[str]:
+    """Sign each order hash via eth_sign, as EthSign signatures."""
+    return [
+        _convert_eth_sign_result(
+            web3_instance.provider,
+            signer_address,
+            "0x" + hash_bytes.hex(),
+            eth_sign_result,
+        )
+        for hash_bytes, eth_sign_result in zip(
+            hashes, _eth_sign_hashes(web3_instance, signer_address, hashes)
+        )
+    ]
+
+
+def _sign_hashes_with_key(
+    private_key: datatypes.PrivateKey,
+    orders: List[Order],
+    hashes: List[bytes],
+) -> List[str]:
+    """Sign each order hash with `private_key`:code:, as EIP712 signatures.
+
+    :raises ValueError: if the key's address isn't the
+        `makerAddress`:code: of every order.
+    """
+    key_address = private_key.public_key.to_checksum_address()
+    for index, order in enumerate(orders):
+        if to_checksum_address(order["makerAddress"]) != key_address:
+            raise ValueError(
+                f"Order {index}, with makerAddress "
+                + f"{order['makerAddress']}, can't be signed with the "
+                + f"private key of {key_address}"
+            )
+
+    signature_type = f"{_Constants.SignatureType.EIP712.value:02x}"
+    signatures = []
+    for hash_bytes in hashes:
+        ec_signature = private_key.sign_msg_hash(hash_bytes)
+        signatures.append(
+            "0x"
+            + (ec_signature.v + 27).to_bytes(1, byteorder="big").hex()
+            + ec_signature.r.to_bytes(32, byteorder="big").hex()
+            + ec_signature.s.to_bytes(32, byteorder="big").hex()
+            + signature_type
+        )
+    return signatures
+
+
+def sign_orders(
+    orders: Iterable[Order],
+    signer: Union[datatypes.PrivateKey, bytes, str, Web3, BaseProvider],
+    exchange_address: str,
+    chain_id: int,
+    signer_address: Optional[str] = None,
+) -> List[dict]:
+    """Hash and sign many orders, ready to be posted to a relayer.
+
+    With a local private key, each order hash is signed directly, producing
+    signatures of type EIP712, and no network access is needed.  With a Web3
+    client or provider, the hashes are signed by the node via eth_sign, as
+    with `sign_hash()`:code:, sending the requests in JSON-RPC batches if the
+    provider is an `HTTPProvider`:code:.
+
+    Each order is validated against the order JSON schema exactly once, in
+    the course of being converted to a JSON-compatible dict.
+
+    :param orders: The orders to be signed.
+    :param signer: Either a private key, as an `eth_keys.keys.PrivateKey`:code:
+        object or as raw bytes or a hex string; or an instance of
+        `web3.Web3`:code: or `web3.providers.base.BaseProvider`:code: whose
+        node holds the signing account.
+    :param exchange_address: The address to which the 0x Exchange smart
+        contract has been deployed.
+    :param chain_id: The ID of the chain on which the Exchange is deployed.
+    :param signer_address: The address of the signing account.  Required when
+        signing through a provider; ignored when signing with a private key.
+    :raises ValueError: if signing with a private key whose address isn't the
+        `makerAddress`:code: of every order.
+    :returns: One dict per order, in input order, as returned by
+        `zero_ex.contract_wrappers.order_conversions.order_to_jsdict()`:code:,
+        including the signature.  Suitable for passing as the
+        `signed_order_schema`:code: to `RelayerApi.post_order()`:code:.
+
+    >>> signed_orders = sign_orders(
+    ...     [
+    ...         Order(
+    ...             makerAddress="0x1a642f0e3c3af545e7acbd38b07251b3990914f1",
+    ...             takerAddress="0x0000000000000000000000000000000000000000",
+    ...             feeRecipientAddress="0x0000000000000000000000000000000000000000",
+    ...             senderAddress="0x0000000000000000000000000000000000000000",
+    ...             makerAssetAmount=1,
+    ...             takerAssetAmount=1,
+    ...             makerFee=0,
+    ...             takerFee=0,
+    ...             expirationTimeSeconds=1,
+    ...             salt=1,
+    ...             makerAssetData=b"",
+    ...             takerAssetData=b"",
+    ...             makerFeeAssetData=b"",
+    ...             takerFeeAssetData=b"",
+    ...         )
+    ...     ],
+    ...     signer="0x" + "01" * 32,
+    ...     exchange_address="0x1dc4c1cefef38a777b15aa20260a54e584b16c48",
+    ...     chain_id=1337,
+    ... )
+    >>> signed_orders[0]["signature"][-2:]
+    '02'
+    """  # noqa: E501 (line too long)
+    orders = list(orders)
+    jsdicts = [
+        order_to_jsdict(order, chain_id, exchange_address) for order in orders
+    ]
+    hasher = OrderHasher(exchange_address, chain_id)
+    hashes = [hasher.order_hash(order) for order in orders]
+
+    if isinstance(signer, (Web3, BaseProvider)):
+        assert_is_address(signer_address, "signer_address")
+        signatures = _sign_hashes_by_node(
+            signer if isinstance(signer, Web3) else Web3(signer),
+            to_checksum_address(str(signer_address)),
+            hashes,
+        )
+    else:
+        signatures = _sign_hashes_with_key(
+            signer
+            if isinstance(signer, datatypes.PrivateKey)
+            else datatypes.PrivateKey(
+                bytes.fromhex(remove_0x_prefix(HexStr(signer)))
+                if isinstance(signer, str)
+                else signer
+            ),
+            orders,
+            hashes,
+        )
+
+    for jsdict, signature in zip(jsdicts, signatures):
+        jsdict["signature"] = signature
+    return jsdicts
@@ -0,0 +1,10 @@
+from eth_keys import datatypes
+
+
+class KeyAPI:
+    PublicKey = datatypes.PublicKey
+    PrivateKey = datatypes.PrivateKey
+    Signature = datatypes.Signature
+
+
+keys: KeyAPI
@@ -0,0 +1,52 @@
+from typing import Optional, Tuple
+
+
+class PublicKey:
+    def __init__(self, public_key_bytes: bytes) -> None: ...
+
+    def to_bytes(self) -> bytes: ...
+
+    def to_address(self) -> str: ...
+
+    def to_checksum_address(self) -> str: ...
+
+    def to_canonical_address(self) -> bytes: ...
+
+    def verify_msg(self, message: bytes, signature: Signature) -> bool: ...
+
+    def verify_msg_hash(
+        self, message_hash: bytes, signature: Signature
+    ) -> bool: ...
+
+
+class PrivateKey:
+    public_key: PublicKey
+
+    def __init__(self, private_key_bytes: bytes) -> None: ...
+
+    def to_bytes(self) -> bytes: ...
+
+    def sign_msg(self, message: bytes) -> Signature: ...
+
+    def sign_msg_hash(self, message_hash: bytes) -> Signature: ...
+
+
+class Signature:
+    v: int
+    r: int
+    s: int
+    vrs: Tuple[int, int, int]
+
+    def __init__(
+        self,
+        signature_bytes: Optional[bytes] = None,
+        vrs: Optional[Tuple[int, int, int]] = None,
+    ) -> None: ...
+
+    def to_bytes(self) -> bytes: ...
+
+    def recover_public_key_from_msg(self, message: bytes) -> PublicKey: ...
+
+    def recover_public_key_from_msg_hash(
+        self, message_hash: bytes
+    ) -> PublicKey: ...
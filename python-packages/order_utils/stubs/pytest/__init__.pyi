@@ -0,0 +1,10 @@
+from typing import Any, Callable
+
+
+class _Mark:
+    @staticmethod
+    def parametrize(argnames: str, argvalues: Any, **kwargs: Any) -> Callable:
+        ...
+
+
+mark: _Mark
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from web3.contract import Contract
 from web3.providers.base import BaseProvider
@@ -6,7 +6,21 @@ from web3.providers.base import BaseProvider
 
 class Web3:
     class HTTPProvider(BaseProvider):
-        ...
+        endpoint_uri: str
+
+        def __init__(
+            self,
+            endpoint_uri: Optional[str] = None,
+            request_kwargs: Optional[Dict[str, Any]] = None,
+        ) -> None: ...
+
+        def get_request_kwargs(self) -> Dict[str, Any]: ...
+
+        def make_request(self, method: str, params: Any) -> Any: ...
+
+        def encode_rpc_request(self, method: str, params: Any) -> bytes: ...
+
+        def decode_rpc_response(self, raw_response: bytes) -> Any: ...
 
     def __init__(self, provider: BaseProvider) -> None: ...
 
@@ -0,0 +1,6 @@
+"""Benchmarks of zero_ex.order_utils.
+
+These are not collected as tests.  Run each one as a script, eg::
+
+    python -m test.benchmarks.bench_order_hashing
+"""
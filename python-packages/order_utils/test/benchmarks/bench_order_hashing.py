@@ -0,0 +1,98 @@
+"""Compare order hashing throughput of the per-order and batch interfaces."""
+
+import random
+from timeit import default_timer
+
+from zero_ex.contract_wrappers.exchange.types import Order
+from zero_ex.order_utils import (
+    generate_order_hash_hex,
+    generate_order_hashes,
+    OrderHasher,
+)
+
+EXCHANGE_ADDRESS = "0x1dc4c1cefef38a777b15aa20260a54e584b16c48"
+CHAIN_ID = 1337
+N_ORDERS = 1000
+
+
+def make_random_order() -> Order:
+    """Get an order populated with random values."""
+
+    def random_address():
+        return "0x" + random.getrandbits(160).to_bytes(20, "big").hex()
+
+    def random_asset_data():
+        return bytes.fromhex("f47261b0") + random.getrandbits(256).to_bytes(
+            32, "big"
+        )
+
+    return Order(
+        makerAddress=random_address(),
+        takerAddress=random_address(),
+        feeRecipientAddress=random_address(),
+        senderAddress=random_address(),
+        makerAssetData=random_asset_data(),
+        takerAssetData=random_asset_data(),
+        makerFeeAssetData=random_asset_data(),
+        takerFeeAssetData=random_asset_data(),
+        salt=random.getrandbits(256),
+        makerFee=random.getrandbits(64),
+        takerFee=random.getrandbits(64),
+        makerAssetAmount=random.getrandbits(128),
+        takerAssetAmount=random.getrandbits(128),
+        expirationTimeSeconds=random.getrandbits(32),
+    )
+
+
+def report(label: str, n_orders: int, seconds: float) -> None:
+    """Print the throughput of one benchmark run."""
+    print(f"{label:<48} {n_orders / seconds:>12,.0f} orders/second")
+
+
+def main():
+    """Run the benchmarks and print the results."""
+    orders = [make_random_order() for _ in range(N_ORDERS)]
+
+    start = default_timer()
+    per_order_hashes = [
+        generate_order_hash_hex(order, EXCHANGE_ADDRESS, CHAIN_ID)
+        for order in orders
+    ]
+    report("generate_order_hash_hex()", N_ORDERS, default_timer() - start)
+
+    start = default_timer()
+    for order in orders:
+        generate_order_hash_hex(
+            order, EXCHANGE_ADDRESS, CHAIN_ID, validate="structural"
+        )
+    report(
+        'generate_order_hash_hex(validate="structural")',
+        N_ORDERS,
+        default_timer() - start,
+    )
+
+    start = default_timer()
+    batch_hashes = generate_order_hashes(orders, EXCHANGE_ADDRESS, CHAIN_ID)
+    report("generate_order_hashes()", N_ORDERS, default_timer() - start)
+
+    for validate in ("structural", "none"):
+        start = default_timer()
+        assert batch_hashes == generate_order_hashes(
+            orders, EXCHANGE_ADDRESS, CHAIN_ID, validate=validate
+        )
+        report(
+            f'generate_order_hashes(validate="{validate}")',
+            N_ORDERS,
+            default_timer() - start,
+        )
+
+    start = default_timer()
+    hasher = OrderHasher(EXCHANGE_ADDRESS, CHAIN_ID)
+    unvalidated_hashes = [hasher.order_hash_hex(order) for order in orders]
+    report("OrderHasher.order_hash_hex()", N_ORDERS, default_timer() - start)
+
+    assert per_order_hashes == batch_hashes == unvalidated_hashes
+
+
+if __name__ == "__main__":
+    main()
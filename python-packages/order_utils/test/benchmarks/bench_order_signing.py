@@ -0,0 +1,105 @@
+"""Compare end-to-end order signing, one order at a time versus in bulk.
+
+Takes an optional command line argument giving the number of orders, which
+defaults to 10,000.  The provider used below signs locally, standing in for a
+node, so the figures exclude network latency, which only widens the gap.
+"""
+
+from sys import argv
+from timeit import default_timer
+
+from eth_keys import keys
+from web3.providers.base import BaseProvider
+
+from zero_ex.contract_wrappers.exchange.types import Order
+from zero_ex.contract_wrappers.order_conversions import order_to_jsdict
+from zero_ex.order_utils import generate_order_hash_hex, sign_hash
+from zero_ex.order_utils.bulk_signature_utils import sign_orders
+
+EXCHANGE_ADDRESS = "0x1dc4c1cefef38a777b15aa20260a54e584b16c48"
+CHAIN_ID = 1337
+PRIVATE_KEY = keys.PrivateKey(b"\x08" * 32)
+MAKER_ADDRESS = PRIVATE_KEY.public_key.to_checksum_address()
+
+
+class LocalSigningProvider(BaseProvider):  # pylint: disable=abstract-method
+    """Provider answering eth_sign requests from a local key."""
+
+    def make_request(self, method, params):
+        """Sign the given message."""
+        message = bytes.fromhex(params[1][2:])
+        return {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": "0x"
+            + PRIVATE_KEY.sign_msg(
+                b"\x19Ethereum Signed Message:\n32" + message
+            )
+            .to_bytes()
+            .hex(),
+        }
+
+
+def make_orders(n_orders: int):
+    """Get distinct orders from our maker."""
+    return [
+        Order(
+            makerAddress=MAKER_ADDRESS,
+            takerAddress="0x0000000000000000000000000000000000000000",
+            feeRecipientAddress="0x0000000000000000000000000000000000000000",
+            senderAddress="0x0000000000000000000000000000000000000000",
+            makerAssetAmount=10 ** 18,
+            takerAssetAmount=10 ** 18 + salt,
+            makerFee=0,
+            takerFee=0,
+            expirationTimeSeconds=1600000000,
+            salt=salt,
+            makerAssetData=b"\x0a" * 36,
+            takerAssetData=b"\x0b" * 36,
+            makerFeeAssetData=b"",
+            takerFeeAssetData=b"",
+        )
+        for salt in range(n_orders)
+    ]
+
+
+def report(label: str, n_orders: int, seconds: float) -> None:
+    """Print the throughput of one benchmark run."""
+    print(f"{label:<48} {n_orders / seconds:>12,.0f} orders/second")
+
+
+def main():
+    """Run the benchmarks and print the results."""
+    n_orders = int(argv[1]) if len(argv) > 1 else 10_000
+    orders = make_orders(n_orders)
+    provider = LocalSigningProvider()
+
+    start = default_timer()
+    for order in orders:
+        order_to_jsdict(
+            order,
+            CHAIN_ID,
+            EXCHANGE_ADDRESS,
+            signature=sign_hash(
+                provider,
+                MAKER_ADDRESS,
+                generate_order_hash_hex(order, EXCHANGE_ADDRESS, CHAIN_ID),
+            ),
+        )
+    report(
+        "generate_order_hash_hex() + sign_hash()",
+        n_orders,
+        default_timer() - start,
+    )
+
+    start = default_timer()
+    sign_orders(orders, provider, EXCHANGE_ADDRESS, CHAIN_ID, MAKER_ADDRESS)
+    report("sign_orders(), via provider", n_orders, default_timer() - start)
+
+    start = default_timer()
+    sign_orders(orders, PRIVATE_KEY, EXCHANGE_ADDRESS, CHAIN_ID)
+    report("sign_orders(), with local key", n_orders, default_timer() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Compare signature verification throughput, one at a time versus in bulk.
+
+Takes an optional command line argument giving the number of signatures,
+which defaults to 100,000.  Recovery is far faster with the optional
+`coincurve` package installed; without it, use a smaller number.
+"""
+
+from os import cpu_count
+from sys import argv
+from timeit import default_timer
+
+from eth_keys import keys
+
+from zero_ex.order_utils import is_valid_signature
+from zero_ex.order_utils.bulk_signature_utils import verify_signatures
+
+
+def make_signed_items(n_items: int):
+    """Get (hash, signature, signer) triples of EthSign signatures."""
+    private_key = keys.PrivateKey(b"\x03" * 32)
+    signer_address = private_key.public_key.to_checksum_address()
+    items = []
+    for index in range(n_items):
+        hash_bytes = index.to_bytes(32, "big")
+        signature = private_key.sign_msg(
+            b"\x19Ethereum Signed Message:\n32" + hash_bytes
+        )
+        items.append(
+            (
+                "0x" + hash_bytes.hex(),
+                "0x"
+                + (signature.v + 27).to_bytes(1, "big").hex()
+                + signature.r.to_bytes(32, "big").hex()
+                + signature.s.to_bytes(32, "big").hex()
+                + "03",
+                signer_address,
+            )
+        )
+    return items
+
+
+def report(label: str, n_items: int, seconds: float) -> None:
+    """Print the throughput of one benchmark run."""
+    print(f"{label:<40} {n_items / seconds:>12,.0f} signatures/second")
+
+
+def main():
+    """Run the benchmarks and print the results."""
+    n_items = int(argv[1]) if len(argv) > 1 else 100_000
+    items = make_signed_items(n_items)
+
+    start = default_timer()
+    one_at_a_time = [is_valid_signature(None, *item) for item in items]
+    report("is_valid_signature()", n_items, default_timer() - start)
+    assert all(one_at_a_time)
+
+    for workers in sorted({1, cpu_count() or 1}):
+        start = default_timer()
+        results = verify_signatures(items, workers=workers)
+        report(
+            f"verify_signatures(workers={workers})",
+            n_items,
+            default_timer() - start,
+        )
+        assert results == bytearray([1] * n_items)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,16 @@
 """Test zero_ex.order_utils.get_order_hash_hex()."""
 
-from zero_ex.order_utils import generate_order_hash_hex
+from typing import Any, Dict, cast
+
+import pytest
+
+from zero_ex.contract_wrappers.exchange.types import Order
+from zero_ex.order_utils import (
+    generate_order_hash_hex,
+    generate_order_hashes,
+    OrderHasher,
+    VALIDATION_MODES,
+)
 
 
 def test_get_order_hash_hex__empty_order():
@@ -31,3 +41,118 @@ def test_get_order_hash_hex__empty_order():
         50,
     )
     assert actual_hash_hex == expected_hash_hex
+
+
+def _make_test_order(salt: int) -> Order:
+    """Get an order whose every field depends on `salt`.
+
+    An amount is given as a decimal string, as in orders decoded from JSON,
+    which the `Order` type doesn't allow for.
+    """
+    order: Dict[str, Any] = {
+        "makerAddress": "0x" + (salt % 256).to_bytes(1, "big").hex() * 20,
+        "takerAddress": "0x"
+        + ((salt + 1) % 256).to_bytes(1, "big").hex() * 20,
+        "feeRecipientAddress": "0x" + "00" * 20,
+        "senderAddress": "0x" + "ff" * 20,
+        "makerAssetData": salt.to_bytes(36, "big"),
+        "takerAssetData": "0x" + (salt * 3).to_bytes(36, "big").hex(),
+        "makerFeeAssetData": b"",
+        "takerFeeAssetData": "0x",
+        "salt": salt,
+        "makerFee": salt * 5,
+        "takerFee": salt * 7,
+        "makerAssetAmount": 10 ** 18 + salt,
+        "takerAssetAmount": str(2 ** 255 + salt),
+        "expirationTimeSeconds": 1600000000 + salt,
+    }
+    return cast(Order, order)
+
+
+def test_generate_order_hashes__matches_generate_order_hash_hex():
+    """Test that batch hashing agrees with hashing one order at a time."""
+    exchange_address = "0x1dc4c1cefef38a777b15aa20260a54e584b16c48"
+    orders = [_make_test_order(salt) for salt in range(1, 20)]
+
+    assert generate_order_hashes(orders, exchange_address, 1337) == [
+        generate_order_hash_hex(order, exchange_address, 1337)
+        for order in orders
+    ]
+
+
+def test_order_hasher__reuse_across_orders():
+    """Test that one hasher gives the same results when reused."""
+    hasher = OrderHasher("0x1dc4c1cefef38a777b15aa20260a54e584b16c48", 50)
+    orders = [_make_test_order(salt) for salt in range(1, 5)]
+
+    first_pass = [hasher.order_hash_hex(order) for order in orders]
+    second_pass = [hasher.order_hash_hex(order) for order in reversed(orders)]
+
+    assert len(set(first_pass)) == len(orders)
+    assert first_pass == list(reversed(second_pass))
+
+
+@pytest.mark.parametrize("validate", VALIDATION_MODES)
+def test_generate_order_hash_hex__validation_modes_agree(validate):
+    """Test that the validation mode doesn't affect the resulting hash."""
+    order = _make_test_order(42)
+    exchange_address = "0x1dc4c1cefef38a777b15aa20260a54e584b16c48"
+
+    assert generate_order_hash_hex(
+        order, exchange_address, 1337, validate=validate
+    ) == generate_order_hash_hex(order, exchange_address, 1337)
+
+
+@pytest.mark.parametrize(
+    "field, value, exception",
+    [
+        ("makerAddress", "0x" + "00" * 19, ValueError),
+        ("takerAddress", "0x" + "zz" * 20, ValueError),
+        ("senderAddress", 0, TypeError),
+        ("salt", -1, ValueError),
+        ("makerFee", 2 ** 256, ValueError),
+        ("takerFee", "1.5", TypeError),
+        ("expirationTimeSeconds", True, TypeError),
+        ("makerAssetData", "0xABCD", ValueError),
+        ("takerFeeAssetData", "0x0", ValueError),
+    ],
+)
+def test_generate_order_hash_hex__structural_validation_rejects(
+    field, value, exception
+):
+    """Test that structural validation rejects malformed fields."""
+    order = _make_test_order(42)
+    order[field] = value  # type: ignore
+
+    with pytest.raises(exception):
+        generate_order_hash_hex(
+            order,
+            "0x1dc4c1cefef38a777b15aa20260a54e584b16c48",
+            1337,
+            validate="structural",
+        )
+
+
+def test_generate_order_hash_hex__structural_validation_missing_field():
+    """Test that structural validation rejects an order missing a field."""
+    order = _make_test_order(42)
+    del order["salt"]  # type: ignore
+
+    with pytest.raises(ValueError):
+        generate_order_hash_hex(
+            order,
+            "0x1dc4c1cefef38a777b15aa20260a54e584b16c48",
+            1337,
+            validate="structural",
+        )
+
+
+def test_generate_order_hashes__unknown_validation_mode():
+    """Test that an unrecognized validation mode raises a ValueError."""
+    with pytest.raises(ValueError):
+        generate_order_hashes(
+            [_make_test_order(42)],
+            "0x1dc4c1cefef38a777b15aa20260a54e584b16c48",
+            1337,
+            validate="partial",
+        )
@@ -1,13 +1,33 @@
 """Tests of zero_ex.order_utils.signature_utils."""
 
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import json
+from threading import Thread
+
+from eth_keys import datatypes, keys
 import pytest
 from web3 import Web3
+from web3.providers.base import BaseProvider
 
+import zero_ex.order_utils
 from zero_ex.contract_wrappers.exchange.exceptions import (
     SignatureError,
     SignatureErrorCodes,
 )
-from zero_ex.order_utils import is_valid_signature, sign_hash_to_bytes
+from zero_ex.contract_wrappers.exchange.types import Order
+from zero_ex.contract_wrappers.order_conversions import order_to_jsdict
+from zero_ex.order_utils import (
+    generate_order_hashes,
+    is_valid_signature,
+    recover_signer_address,
+    sign_hash,
+    sign_hash_to_bytes,
+)
+from zero_ex.order_utils import bulk_signature_utils
+from zero_ex.order_utils.bulk_signature_utils import (
+    sign_orders,
+    verify_signatures,
+)
 
 
 def test_is_valid_signature__provider_wrong_type():
@@ -167,3 +187,329 @@ def test_sign_hash_to_bytes_and_validate__golden_path():
     )
 
     assert is_valid is True
+
+
+def _sign_eip712(hash_hex: str, private_key: bytes) -> str:
+    """Produce an EIP712-type 0x signature of the given hash."""
+    signature = keys.PrivateKey(private_key).sign_msg_hash(
+        bytes.fromhex(hash_hex[2:])
+    )
+    return (
+        "0x"
+        + (signature.v + 27).to_bytes(1, "big").hex()
+        + signature.r.to_bytes(32, "big").hex()
+        + signature.s.to_bytes(32, "big").hex()
+        + "02"
+    )
+
+
+def test_is_valid_signature__eth_sign_without_provider():
+    """Test that an EthSign signature is checked without a provider."""
+    assert (
+        is_valid_signature(
+            None,
+            "0x6927e990021d23b1eb7b8789f6a6feaf98fe104bb0cf8259421b79f9a34222"
+            + "b0",
+            "0x1B61a3ed31b43c8780e905a260a35faefcc527be7516aa11c0256729b5b351b"
+            + "c3340349190569279751135161d22529dc25add4f6069af05be04cacbda2ace"
+            + "225403",
+            "0x5409ed021d9299bf6814279a6a1411a7e866a631",
+        )
+        is True
+    )
+
+
+def test_is_valid_signature__eip712_without_provider():
+    """Test that an EIP712 signature is checked without a provider."""
+    private_key = b"\x01" * 32
+    signer_address = keys.PrivateKey(private_key).public_key.to_address()
+    hash_hex = "0x" + "ab" * 32
+    signature = _sign_eip712(hash_hex, private_key)
+
+    assert recover_signer_address(hash_hex, signature).lower() == (
+        signer_address
+    )
+    assert is_valid_signature(None, hash_hex, signature, signer_address)
+    assert not is_valid_signature(
+        None, "0x" + "cd" * 32, signature, signer_address
+    )
+    assert not is_valid_signature(
+        None, hash_hex, signature, "0x5409ed021d9299bf6814279a6a1411a7e866a631"
+    )
+
+
+def test_is_valid_signature__bad_v_without_provider():
+    """Test that a signature with an out-of-range V is simply invalid."""
+    assert (
+        is_valid_signature(
+            None,
+            "0x6927e990021d23b1eb7b8789f6a6feaf98fe104bb0cf8259421b79f9a34222"
+            + "b0",
+            "0x1D61a3ed31b43c8780e905a260a35faefcc527be7516aa11c0256729b5b351b"
+            + "c3340349190569279751135161d22529dc25add4f6069af05be04cacbda2ace"
+            + "225403",
+            "0x5409ed021d9299bf6814279a6a1411a7e866a631",
+        )
+        is False
+    )
+
+
+def test_is_valid_signature__wallet_type_requires_provider():
+    """Test that a signature needing the chain can't be checked offline."""
+    with pytest.raises(ValueError):
+        is_valid_signature(
+            None,
+            "0x6927e990021d23b1eb7b8789f6a6feaf98fe104bb0cf8259421b79f9a34222"
+            + "b0",
+            "0x04",
+            "0x5409ed021d9299bf6814279a6a1411a7e866a631",
+        )
+
+
+def test_recover_signer_address__unsupported_sig_type():
+    """Test that recovery of a Validator-type signature is refused."""
+    with pytest.raises(ValueError):
+        recover_signer_address(
+            "0x6927e990021d23b1eb7b8789f6a6feaf98fe104bb0cf8259421b79f9a34222"
+            + "b0",
+            "0x1B61a3ed31b43c8780e905a260a35faefcc527be7516aa11c0256729b5b351b"
+            + "c3340349190569279751135161d22529dc25add4f6069af05be04cacbda2ace"
+            + "225405",
+        )
+
+
+def test_verify_signatures__process_pool_preserves_order(monkeypatch):
+    """Test that results from the worker processes come back in order."""
+    monkeypatch.setattr(
+        bulk_signature_utils, "_MIN_SIGNATURES_FOR_PROCESS_POOL", 0
+    )
+    private_key = b"\x02" * 32
+    signer_address = keys.PrivateKey(private_key).public_key.to_address()
+    items = []
+    for index in range(10):
+        hash_hex = "0x" + index.to_bytes(32, "big").hex()
+        items.append(
+            (
+                hash_hex,
+                _sign_eip712(hash_hex, private_key),
+                signer_address if index % 3 else "0x" + "11" * 20,
+            )
+        )
+
+    assert verify_signatures(items, workers=2) == bytearray(
+        [0, 1, 1, 0, 1, 1, 0, 1, 1, 0]
+    )
+    assert verify_signatures(items, workers=1) == verify_signatures(
+        items, workers=2
+    )
+
+
+def test_verify_signatures__wallet_type_requires_provider():
+    """Test that a signature needing the chain can't be checked offline."""
+    with pytest.raises(ValueError):
+        verify_signatures(
+            [
+                (
+                    "0x6927e990021d23b1eb7b8789f6a6feaf98fe104bb0cf8259421b79f"
+                    + "9a34222b0",
+                    "0x04",
+                    "0x5409ed021d9299bf6814279a6a1411a7e866a631",
+                )
+            ]
+        )
+
+
+class _LocalSigningProvider(BaseProvider):  # pylint: disable=abstract-method
+    """Provider answering eth_sign from a local key, recording requests."""
+
+    def __init__(self, private_key: datatypes.PrivateKey, vrs_order: bool):
+        """Sign with `private_key`, returning V, R, S if `vrs_order`."""
+        self.private_key = private_key
+        self.vrs_order = vrs_order
+        self.methods_requested: list = []
+
+    def make_request(self, method, params):
+        """Answer eth_sign requests; refuse everything else."""
+        self.methods_requested.append(method)
+        if method != "eth_sign":
+            raise RuntimeError(f"unexpected request for {method}")
+        message = bytes.fromhex(params[1][2:])
+        signature = self.private_key.sign_msg(
+            b"\x19Ethereum Signed Message:\n"
+            + str(len(message)).encode()
+            + message
+        )
+        v_hex = (signature.v + 27).to_bytes(1, "big").hex()
+        rs_hex = signature.to_bytes()[:64].hex()
+        return {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": "0x"
+            + (v_hex + rs_hex if self.vrs_order else rs_hex + v_hex),
+        }
+
+
+@pytest.mark.parametrize("vrs_order", [True, False])
+def test_sign_hash__no_requests_beyond_eth_sign(vrs_order):
+    """Test that sign_hash() validates the signature it gets locally."""
+    private_key = keys.PrivateKey(b"\x04" * 32)
+    signer_address = private_key.public_key.to_checksum_address()
+    provider = _LocalSigningProvider(private_key, vrs_order)
+
+    for index in range(3):
+        hash_hex = "0x" + index.to_bytes(32, "big").hex()
+        signature = sign_hash(provider, signer_address, hash_hex)
+        assert is_valid_signature(None, hash_hex, signature, signer_address)
+
+    assert provider.methods_requested == ["eth_sign"] * 3
+    # pylint: disable=protected-access
+    assert zero_ex.order_utils._SIGNATURE_PARSER_BY_PROVIDER[provider] is (
+        zero_ex.order_utils._parse_signature_hex_as_vrs
+        if vrs_order
+        else zero_ex.order_utils._parse_signature_hex_as_rsv
+    )
+
+
+def _make_test_orders(maker_address: str, n_orders: int) -> list:
+    """Get some distinct orders from the given maker."""
+    return [
+        Order(
+            makerAddress=maker_address,
+            takerAddress="0x0000000000000000000000000000000000000000",
+            feeRecipientAddress="0x0000000000000000000000000000000000000000",
+            senderAddress="0x0000000000000000000000000000000000000000",
+            makerAssetAmount=1000 + index,
+            takerAssetAmount=2000,
+            makerFee=0,
+            takerFee=0,
+            expirationTimeSeconds=1600000000,
+            salt=index,
+            makerAssetData=b"\x01" * 36,
+            takerAssetData=b"\x02" * 36,
+            makerFeeAssetData=b"",
+            takerFeeAssetData=b"",
+        )
+        for index in range(n_orders)
+    ]
+
+
+def test_sign_orders__local_key():
+    """Test signing orders with a local private key."""
+    private_key = keys.PrivateKey(b"\x05" * 32)
+    maker_address = private_key.public_key.to_checksum_address()
+    exchange_address = "0x1dc4c1cefef38a777b15aa20260a54e584b16c48"
+    orders = _make_test_orders(maker_address, 5)
+
+    signed_orders = sign_orders(orders, private_key, exchange_address, 1337)
+
+    for order, order_hash, signed_order in zip(
+        orders,
+        generate_order_hashes(orders, exchange_address, 1337),
+        signed_orders,
+    ):
+        signature = signed_order.pop("signature")
+        assert signed_order == order_to_jsdict(order, 1337, exchange_address)
+        assert signature.endswith("02")
+        assert is_valid_signature(
+            None, "0x" + order_hash, signature, maker_address
+        )
+
+
+def test_sign_orders__local_key_not_the_maker():
+    """Test that a private key must be the key of every order's maker."""
+    private_key = keys.PrivateKey(b"\x05" * 32)
+    orders = _make_test_orders(
+        private_key.public_key.to_checksum_address(), 2
+    ) + _make_test_orders(
+        keys.PrivateKey(b"\x06" * 32).public_key.to_checksum_address(), 1
+    )
+
+    with pytest.raises(ValueError, match="Order 2"):
+        sign_orders(
+            orders,
+            private_key,
+            "0x1dc4c1cefef38a777b15aa20260a54e584b16c48",
+            1337,
+        )
+
+
+def test_sign_orders__provider():
+    """Test signing orders via a provider's eth_sign."""
+    private_key = keys.PrivateKey(b"\x06" * 32)
+    maker_address = private_key.public_key.to_checksum_address()
+    exchange_address = "0x1dc4c1cefef38a777b15aa20260a54e584b16c48"
+    orders = _make_test_orders(maker_address, 3)
+    provider = _LocalSigningProvider(private_key, vrs_order=False)
+
+    signed_orders = sign_orders(
+        orders, provider, exchange_address, 1337, maker_address
+    )
+
+    assert provider.methods_requested == ["eth_sign"] * 3
+    for order_hash, signed_order in zip(
+        generate_order_hashes(orders, exchange_address, 1337), signed_orders
+    ):
+        assert signed_order["signature"].endswith("03")
+        assert is_valid_signature(
+            None, "0x" + order_hash, signed_order["signature"], maker_address
+        )
+
+
+def test_sign_orders__http_provider_batches_requests():
+    """Test that eth_sign requests go out in one JSON-RPC batch."""
+    private_key = keys.PrivateKey(b"\x07" * 32)
+    maker_address = private_key.public_key.to_checksum_address()
+    request_bodies = []
+
+    class Handler(BaseHTTPRequestHandler):
+        """Answer JSON-RPC batches of eth_sign requests."""
+
+        def do_POST(self):  # pylint: disable=invalid-name
+            """Sign every message in the batch."""
+            batch = json.loads(
+                self.rfile.read(int(self.headers["Content-Length"]))
+            )
+            request_bodies.append(batch)
+            body = json.dumps(
+                [
+                    {
+                        "jsonrpc": "2.0",
+                        "id": request["id"],
+                        "result": "0x"
+                        + private_key.sign_msg(
+                            b"\x19Ethereum Signed Message:\n32"
+                            + bytes.fromhex(request["params"][1][2:])
+                        )
+                        .to_bytes()
+                        .hex(),
+                    }
+                    for request in reversed(batch)
+                ]
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):  # pylint: disable=arguments-differ
+            """Keep quiet."""
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        signed_orders = sign_orders(
+            _make_test_orders(maker_address, 4),
+            Web3.HTTPProvider(f"http://127.0.0.1:{server.server_port}"),
+            "0x1dc4c1cefef38a777b15aa20260a54e584b16c48",
+            1337,
+            maker_address,
+        )
+    finally:
+        server.shutdown()
+
+    assert len(request_bodies) == 1
+    assert [request["method"] for request in request_bodies[0]] == [
+        "eth_sign"
+    ] * 4
+    assert len({order["signature"] for order in signed_orders}) == 4
@@ -30,7 +30,13 @@ VERSION = "4.0.0"
 with open("README.md", "r") as file_handle:
     README_MD = file_handle.read()
 
-REQUIRES = ["urllib3 >= 1.15", "six >= 1.10", "certifi", "python-dateutil"]
+REQUIRES = [
+    "urllib3 >= 1.15",
+    "six >= 1.10",
+    "certifi",
+    "python-dateutil",
+    "aiohttp",
+]
 
 
 class CleanCommandExtension(clean):
@@ -226,6 +232,7 @@ setup(
             "pydocstyle",
             "pylint",
             "pytest",
+            "pytest-asyncio",
             "sphinx",
         ]
     },
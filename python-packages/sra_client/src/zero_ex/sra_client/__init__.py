@@ -224,6 +224,13 @@ of the one we just posted:
                         'takerFee': '0',
                         'takerFeeAssetData': '0xf47261b0000000000000000000000000...'}}...]}
 
+To go through all of the orders, however many pages of them there are, iterate
+over them instead. Each page is requested while the one before it is being
+gone through:
+
+>>> [order.meta_data['orderHash'] for order in relayer.iter_orders()]
+['0x...']
+
 Get Asset Pairs
 ---------------
 
@@ -431,10 +438,13 @@ __version__ = "1.0.0"
 
 # import apis into sdk package
 from .api.relayer_api import RelayerApi
+from .api.async_relayer_api import AsyncRelayerApi
 
 # import ApiClient
 from .api_client import ApiClient
+from .async_api_client import AsyncApiClient
 from .configuration import Configuration
+from .orders_channel import OrderbookMirror, OrderbookSide
 
 # import models into sdk package
 from .models.order_schema import OrderSchema
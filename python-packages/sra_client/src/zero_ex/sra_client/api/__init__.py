@@ -4,3 +4,4 @@ from __future__ import absolute_import
 
 # import apis into api package
 from zero_ex.sra_client.api.relayer_api import RelayerApi
+from zero_ex.sra_client.api.async_relayer_api import AsyncRelayerApi
@@ -0,0 +1,127 @@
+# coding: utf-8
+
+"""An asyncio counterpart of :class:`zero_ex.sra_client.RelayerApi`."""
+
+from zero_ex.sra_client.api.relayer_api import RelayerApi
+from zero_ex.sra_client.async_api_client import AsyncApiClient
+from zero_ex.sra_client.configuration import Configuration
+from zero_ex.sra_client.pagination import aiter_records
+
+
+class AsyncRelayerApi(RelayerApi):
+    """API for SRA compliant 0x relayers, for use with asyncio.
+
+    It has the same methods, taking the same parameters, as
+    :class:`RelayerApi`, but they are coroutines, returning what the methods
+    of :class:`RelayerApi` would.  Rather than handing each request to a
+    thread, requests are made over a pool of keep-alive connections, so many
+    of them can be awaited concurrently, from many relayers sharing one
+    :class:`aiohttp.ClientSession` if need be::
+
+        async with aiohttp.ClientSession() as session:
+            orderbooks = await asyncio.gather(
+                *[
+                    AsyncRelayerApi(url, session=session).get_orderbook(
+                        base_asset_data, quote_asset_data
+                    )
+                    for url in relayer_urls
+                ]
+            )
+
+    The `*_with_http_info` methods return awaitables too, and
+    :meth:`iter_orders` and :meth:`iter_asset_pairs` return asynchronous
+    generators, to use with `async for`.
+
+    Use it as an asynchronous context manager, or await :meth:`close`, to
+    close its connections when done with it.
+
+    :param url: the URL of the relayer's API.
+    :param connection_limit: the largest number of connections to open to
+        the relayer at once.
+    :param session: an :class:`aiohttp.ClientSession` to share with other
+        users, such as instances for other relayers, in which case
+        `connection_limit` is that of the session.  Closing this instance
+        leaves the session open.
+    :param raw_responses: as for :class:`RelayerApi`.
+    :param json_codec: as for :class:`RelayerApi`.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        connection_limit: int = 100,
+        session=None,
+        raw_responses: bool = False,
+        json_codec=None,
+    ):
+        """Configure a client for the relayer at `url`."""
+        # pylint: disable=super-init-not-called
+        config = Configuration()
+        config.host = url
+        config.connection_pool_maxsize = connection_limit
+        config.raw_responses = raw_responses
+        if json_codec is not None:
+            config.json_codec = json_codec
+        self.api_client = AsyncApiClient(config, session=session)
+
+    async def close(self):
+        """Close the connections to the relayer."""
+        await self.api_client.close()
+
+    async def __aenter__(self):
+        """Use the instance for the duration of an `async with` block."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Close the connections to the relayer."""
+        await self.close()
+
+    async def get_asset_pairs(self, **kwargs):
+        """Like :meth:`RelayerApi.get_asset_pairs`, without blocking."""
+        return await super().get_asset_pairs(**kwargs)
+
+    async def get_fee_recipients(self, **kwargs):
+        """Like :meth:`RelayerApi.get_fee_recipients`, without blocking."""
+        return await super().get_fee_recipients(**kwargs)
+
+    async def get_order(self, order_hash, **kwargs):
+        """Like :meth:`RelayerApi.get_order`, without blocking."""
+        return await super().get_order(order_hash, **kwargs)
+
+    async def get_order_config(self, **kwargs):
+        """Like :meth:`RelayerApi.get_order_config`, without blocking."""
+        return await super().get_order_config(**kwargs)
+
+    async def get_orderbook(self, base_asset_data, quote_asset_data, **kwargs):
+        """Like :meth:`RelayerApi.get_orderbook`, without blocking."""
+        return await super().get_orderbook(
+            base_asset_data, quote_asset_data, **kwargs
+        )
+
+    async def get_orders(self, **kwargs):
+        """Like :meth:`RelayerApi.get_orders`, without blocking."""
+        return await super().get_orders(**kwargs)
+
+    def iter_asset_pairs(self, per_page=100, **kwargs):
+        """Like :meth:`RelayerApi.iter_asset_pairs`, as an async generator."""
+        return aiter_records(
+            self.api_client,
+            self.get_asset_pairs_with_http_info,
+            "object",
+            per_page,
+            **kwargs
+        )
+
+    def iter_orders(self, per_page=100, **kwargs):
+        """Like :meth:`RelayerApi.iter_orders`, as an async generator."""
+        return aiter_records(
+            self.api_client,
+            self.get_orders_with_http_info,
+            "RelayerApiOrderSchema",
+            per_page,
+            **kwargs
+        )
+
+    async def post_order(self, **kwargs):
+        """Like :meth:`RelayerApi.post_order`, without blocking."""
+        return await super().post_order(**kwargs)
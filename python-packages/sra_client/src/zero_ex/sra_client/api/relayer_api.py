@@ -13,19 +13,32 @@ from zero_ex.sra_client.configuration import Configuration
 from zero_ex.sra_client.models.relayer_api_order_config_payload_schema import (
     RelayerApiOrderConfigPayloadSchema,
 )
+from zero_ex.sra_client.pagination import iter_records
 
 
 class RelayerApi(object):
-    """API for SRA compliant 0x relayers."""
+    """API for SRA compliant 0x relayers.
+
+    :param url: the URL of the relayer's API.
+    :param raw_responses: whether to return responses as the plain dicts
+        and lists decoded from their JSON, which is quicker, rather than as
+        the models documented for each method.
+    :param json_codec: the codec to encode and decode JSON with, such as a
+        :class:`zero_ex.sra_client.json_codec.JsonCodec`.  Defaults to
+        orjson's if it's installed, else the standard library's.
+    """
 
     # NOTE: This class is auto generated by OpenAPI Generator
     # Ref: https://openapi-generator.tech
 
     # Do not edit the class manually.
 
-    def __init__(self, url: str):
+    def __init__(self, url: str, raw_responses: bool = False, json_codec=None):
         config = Configuration()
         config.host = url
+        config.raw_responses = raw_responses
+        if json_codec is not None:
+            config.json_codec = json_codec
         self.api_client = ApiClient(config)
 
     def get_asset_pairs(self, **kwargs):
@@ -1063,3 +1076,48 @@ class RelayerApi(object):
             _request_timeout=local_var_params.get("_request_timeout"),
             collection_formats=collection_formats,
         )
+
+    def iter_asset_pairs(self, per_page=100, **kwargs):
+        """Iterate over all of the relayer's asset pairs.
+
+        Rather than a page of them, like :meth:`get_asset_pairs`, get a
+        generator yielding each of the asset pairs in turn.  Pages are
+        requested as needed, each one while the caller consumes the one
+        before it, so at most about two pages are held in memory.
+
+        :param str asset_data_a: The assetData value for the first asset in the pair.
+        :param str asset_data_b: The assetData value for the second asset in the pair.
+        :param int per_page: The number of records to request per page.
+
+        :return: a generator of the asset pairs, each a dict like the
+            records of a :class:`RelayerApiAssetDataPairsResponseSchema`.
+        """
+        return iter_records(
+            self.api_client,
+            self.get_asset_pairs_with_http_info,
+            "object",
+            per_page,
+            **kwargs
+        )
+
+    def iter_orders(self, per_page=100, **kwargs):
+        """Iterate over all of the orders matching the given filters.
+
+        Rather than a page of them, like :meth:`get_orders`, get a
+        generator yielding each of the orders in turn.  Pages are requested
+        as needed, each one while the caller consumes the one before it, so
+        at most about two pages are held in memory however big the
+        orderbook is.  Takes the same filters as :meth:`get_orders`.
+
+        :param int per_page: The number of records to request per page.
+
+        :return: a generator of :class:`RelayerApiOrderSchema`, or of
+            dicts with `raw_responses`.
+        """
+        return iter_records(
+            self.api_client,
+            self.get_orders_with_http_info,
+            "RelayerApiOrderSchema",
+            per_page,
+            **kwargs
+        )
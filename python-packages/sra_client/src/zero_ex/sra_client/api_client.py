@@ -3,7 +3,6 @@
 from __future__ import absolute_import
 
 import datetime
-import json
 import mimetypes
 from multiprocessing.pool import ThreadPool
 import os
@@ -74,6 +73,8 @@ class ApiClient(object):
         self.cookie = cookie
         # Set default User-Agent.
         self.user_agent = "OpenAPI-Generator/1.0.0/python"
+        # Functions deserializing data into each response type, by type.
+        self._deserialization_plans = {}
 
     def __del__(self):
         if self._pool:
@@ -120,6 +121,51 @@ class ApiClient(object):
         _request_timeout=None,
     ):
 
+        request = self._prepare_request(
+            resource_path,
+            method,
+            path_params,
+            query_params,
+            header_params,
+            body,
+            post_params,
+            files,
+            auth_settings,
+            collection_formats,
+        )
+
+        # perform request and return response
+        response_data = self.request(
+            _preload_content=_preload_content,
+            _request_timeout=_request_timeout,
+            **request
+        )
+
+        return self._process_response(
+            response_data,
+            response_type,
+            _return_http_data_only,
+            _preload_content,
+        )
+
+    def _prepare_request(
+        self,
+        resource_path,
+        method,
+        path_params,
+        query_params,
+        header_params,
+        body,
+        post_params,
+        files,
+        auth_settings,
+        collection_formats,
+    ):
+        """Serialize the parameters of a request.
+
+        :return: the keyword arguments to :meth:`request`, other than
+            `_preload_content` and `_request_timeout`.
+        """
         config = self.configuration
 
         # header parameters
@@ -165,24 +211,35 @@ class ApiClient(object):
         self.update_params_for_auth(header_params, query_params, auth_settings)
 
         # body
-        if body:
+        if body and not isinstance(body, dict):
+            # a dict is encoded as it is, with any models in it encoded by
+            # the JSON codec as they come up
             body = self.sanitize_for_serialization(body)
 
         # request url
         url = self.configuration.host + resource_path
 
-        # perform request and return response
-        response_data = self.request(
-            method,
-            url,
+        return dict(
+            method=method,
+            url=url,
             query_params=query_params,
             headers=header_params,
             post_params=post_params,
             body=body,
-            _preload_content=_preload_content,
-            _request_timeout=_request_timeout,
         )
 
+    def _process_response(
+        self,
+        response_data,
+        response_type,
+        _return_http_data_only,
+        _preload_content,
+    ):
+        """Deserialize the response to a request made by :meth:`__call_api`.
+
+        :return: the deserialized data, or if `_return_http_data_only` is
+            not set, a tuple of it, the HTTP status and the HTTP headers.
+        """
         self.last_response = response_data
 
         return_data = response_data
@@ -265,10 +322,39 @@ class ApiClient(object):
 
         # fetch data from response object
         try:
-            data = json.loads(response.data)
+            data = self.decode_json(response)
         except ValueError:
             data = response.data
 
+        return self.deserialize_data(data, response_type)
+
+    def decode_json(self, response):
+        """Decode the JSON body of a response with the configured codec.
+
+        The body is decoded straight from the bytes received, if they are
+        at hand.
+
+        :param response: RESTResponse object, or a response not preloaded.
+        :raises ValueError: if the body isn't valid JSON.
+        """
+        return self.configuration.json_codec.loads(
+            getattr(response, "raw_data", response.data)
+        )
+
+    def deserialize_data(self, data, response_type):
+        """Deserialize data already parsed from JSON into an object.
+
+        If `configuration.raw_responses` is set, the data is returned as it
+        is.
+
+        :param data: dict, list or str.
+        :param response_type: class literal for
+            deserialized object, or string of class name.
+
+        :return: deserialized object.
+        """
+        if self.configuration.raw_responses:
+            return data
         return self.__deserialize(data, response_type)
 
     def __deserialize(self, data, klass):
@@ -279,22 +365,53 @@ class ApiClient(object):
 
         :return: object.
         """
-        if data is None:
-            return None
+        return self._get_deserialization_plan(klass)(data)
+
+    def _get_deserialization_plan(self, klass):
+        """Get a function deserializing data into `klass`.
+
+        The function is made the first time it is needed, with the type
+        names already parsed and looked up, and the functions for the types
+        of list items, dict values and model attributes already at hand,
+        and is kept for every later response of the same type.
+
+        :param klass: class literal, or string of class name.
+
+        :return: a function taking dict, list or str, and returning object.
+        """
+        plan = self._deserialization_plans.get(klass)
+        if plan is None:
+            plan = self.__make_deserialization_plan(klass)
+        return plan
+
+    def __make_deserialization_plan(self, klass):
+        plans = self._deserialization_plans
+        key = klass
 
         if type(klass) == str:
             if klass.startswith("list["):
                 sub_kls = re.match(r"list\[(.*)\]", klass).group(1)
-                return [
-                    self.__deserialize(sub_data, sub_kls) for sub_data in data
-                ]
+                item_plan = self._get_deserialization_plan(sub_kls)
+
+                def deserialize_list(data):
+                    if data is None:
+                        return None
+                    return [item_plan(sub_data) for sub_data in data]
+
+                plans[key] = deserialize_list
+                return deserialize_list
 
             if klass.startswith("dict("):
                 sub_kls = re.match(r"dict\(([^,]*), (.*)\)", klass).group(2)
-                return {
-                    k: self.__deserialize(v, sub_kls)
-                    for k, v in six.iteritems(data)
-                }
+                value_plan = self._get_deserialization_plan(sub_kls)
+
+                def deserialize_dict(data):
+                    if data is None:
+                        return None
+                    return {k: value_plan(v) for k, v in six.iteritems(data)}
+
+                plans[key] = deserialize_dict
+                return deserialize_dict
 
             # convert str to class
             if klass in self.NATIVE_TYPES_MAPPING:
@@ -303,15 +420,87 @@ class ApiClient(object):
                 klass = getattr(zero_ex.sra_client.models, klass)
 
         if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
-        elif klass == object:
-            return self.__deserialize_object(data)
-        elif klass == datetime.date:
-            return self.__deserialize_date(data)
-        elif klass == datetime.datetime:
-            return self.__deserialize_datatime(data)
+            convert = self.__deserialize_primitive
+
+            def deserialize_primitive(data):
+                if data is None:
+                    return None
+                return convert(data, klass)
+
+            plan = deserialize_primitive
+        elif klass in (datetime.date, datetime.datetime):
+            convert = (
+                self.__deserialize_date
+                if klass == datetime.date
+                else self.__deserialize_datatime
+            )
+
+            def deserialize_date(data):
+                if data is None:
+                    return None
+                return convert(data)
+
+            plan = deserialize_date
+        elif klass == object or not (
+            klass.openapi_types or hasattr(klass, "get_real_child_model")
+        ):
+
+            def deserialize_object(data):
+                return data
+
+            plan = deserialize_object
         else:
-            return self.__deserialize_model(data, klass)
+            return self.__make_model_plan(klass, key)
+
+        plans[key] = plan
+        return plan
+
+    def __make_model_plan(self, klass, key):
+        """Get a function deserializing a dict into model `klass`.
+
+        The functions for the model's attributes are looked up only once
+        the model's own function is registered, under `key` as well as
+        `klass`, since a model's attributes may be of the model's own type.
+        A model with a discriminator is deserialized again as the child
+        model its `get_real_child_model` names.
+        """
+        attributes = []
+
+        def make_instance(data):
+            if data is None:
+                return None
+            kwargs = {}
+            if isinstance(data, (list, dict)):
+                for attr, json_key, attr_plan in attributes:
+                    if json_key in data:
+                        kwargs[attr] = attr_plan(data[json_key])
+            return klass(**kwargs)
+
+        def make_child_instance(data):
+            instance = make_instance(data)
+            if instance is not None:
+                klass_name = instance.get_real_child_model(data)
+                if klass_name:
+                    return self._get_deserialization_plan(klass_name)(data)
+            return instance
+
+        plan = (
+            make_child_instance
+            if hasattr(klass, "get_real_child_model")
+            else make_instance
+        )
+
+        self._deserialization_plans[klass] = plan
+        self._deserialization_plans[key] = plan
+        for attr, attr_type in six.iteritems(klass.openapi_types or {}):
+            attributes.append(
+                (
+                    attr,
+                    klass.attribute_map[attr],
+                    self._get_deserialization_plan(attr_type),
+                )
+            )
+        return plan
 
     def call_api(
         self,
@@ -649,13 +838,6 @@ class ApiClient(object):
         except TypeError:
             return data
 
-    def __deserialize_object(self, value):
-        """Return an original value.
-
-        :return: object.
-        """
-        return value
-
     def __deserialize_date(self, string):
         """Deserializes string to date.
 
@@ -695,35 +877,3 @@ class ApiClient(object):
                     "Failed to parse `{0}` as datetime object".format(string)
                 ),
             )
-
-    def __deserialize_model(self, data, klass):
-        """Deserializes list or dict to model.
-
-        :param data: dict, list.
-        :param klass: class literal.
-        :return: model object.
-        """
-
-        if not klass.openapi_types and not hasattr(
-            klass, "get_real_child_model"
-        ):
-            return data
-
-        kwargs = {}
-        if klass.openapi_types is not None:
-            for attr, attr_type in six.iteritems(klass.openapi_types):
-                if (
-                    data is not None
-                    and klass.attribute_map[attr] in data
-                    and isinstance(data, (list, dict))
-                ):
-                    value = data[klass.attribute_map[attr]]
-                    kwargs[attr] = self.__deserialize(value, attr_type)
-
-        instance = klass(**kwargs)
-
-        if hasattr(instance, "get_real_child_model"):
-            klass_name = instance.get_real_child_model(data)
-            if klass_name:
-                instance = self.__deserialize(data, klass_name)
-        return instance
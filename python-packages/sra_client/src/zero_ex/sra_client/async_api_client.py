@@ -0,0 +1,124 @@
+# coding: utf-8
+
+"""An asyncio counterpart of :class:`zero_ex.sra_client.ApiClient`."""
+
+from zero_ex.sra_client.api_client import ApiClient
+from zero_ex.sra_client.async_rest import AsyncRESTClientObject
+
+
+class AsyncApiClient(ApiClient):
+    """API client whose :meth:`call_api` returns a coroutine.
+
+    Requests are made with aiohttp, over a pool of keep-alive connections,
+    rather than in a thread pool, so any number of them can be awaited
+    concurrently.  The parameters are those of :class:`ApiClient`, except
+    that there is no thread pool to size.
+
+    :param session: an :class:`aiohttp.ClientSession` to share with other
+        clients.  By default, the client opens one of its own, with up to
+        `configuration.connection_pool_maxsize` connections, which
+        :meth:`close` closes.
+    """
+
+    def __init__(
+        self,
+        configuration=None,
+        header_name=None,
+        header_value=None,
+        cookie=None,
+        session=None,
+    ):
+        """Initialize the client, without connecting yet."""
+        super().__init__(configuration, header_name, header_value, cookie)
+        self.rest_client = AsyncRESTClientObject(self.configuration, session)
+
+    async def close(self):
+        """Close the client's connections."""
+        await self.rest_client.close()
+
+    def call_api(
+        self,
+        resource_path,
+        method,
+        path_params=None,
+        query_params=None,
+        header_params=None,
+        body=None,
+        post_params=None,
+        files=None,
+        response_type=None,
+        auth_settings=None,
+        async_req=None,
+        _return_http_data_only=None,
+        collection_formats=None,
+        _preload_content=True,
+        _request_timeout=None,
+    ):
+        """Get a coroutine making the HTTP request.
+
+        Takes the same parameters as :meth:`ApiClient.call_api`, except that
+        `async_req` is ignored.
+
+        :return: a coroutine, which returns what :meth:`ApiClient.call_api`
+            would have.
+        """
+        return self._call_api(
+            resource_path,
+            method,
+            path_params,
+            query_params,
+            header_params,
+            body,
+            post_params,
+            files,
+            response_type,
+            auth_settings,
+            _return_http_data_only,
+            collection_formats,
+            _preload_content,
+            _request_timeout,
+        )
+
+    async def _call_api(
+        self,
+        resource_path,
+        method,
+        path_params,
+        query_params,
+        header_params,
+        body,
+        post_params,
+        files,
+        response_type,
+        auth_settings,
+        _return_http_data_only,
+        collection_formats,
+        _preload_content,
+        _request_timeout,
+    ):
+        request = self._prepare_request(
+            resource_path,
+            method,
+            path_params,
+            query_params,
+            header_params,
+            body,
+            post_params,
+            files,
+            auth_settings,
+            collection_formats,
+        )
+
+        # perform request and return response
+        response_data = await self.rest_client.request(
+            _preload_content=_preload_content,
+            _request_timeout=_request_timeout,
+            **request
+        )
+
+        return self._process_response(
+            response_data,
+            response_type,
+            _return_http_data_only,
+            _preload_content,
+        )
@@ -0,0 +1,208 @@
+# coding: utf-8
+
+"""An asyncio counterpart of :mod:`zero_ex.sra_client.rest`, using aiohttp."""
+
+import io
+import logging
+import re
+import ssl
+
+import aiohttp
+import certifi
+from six.moves.urllib.parse import urlencode
+
+from zero_ex.sra_client.rest import ApiException
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRESTResponse(io.IOBase):
+    """A response read in full by :class:`AsyncRESTClientObject`."""
+
+    def __init__(self, resp, raw_data):
+        """Wrap `resp`, whose body was `raw_data`, in bytes."""
+        self.aiohttp_response = resp
+        self.status = resp.status
+        self.reason = resp.reason
+        self.raw_data = raw_data
+        self._data = None
+
+    @property
+    def data(self):
+        """The body of the response, decoded to a string when first read."""
+        if self._data is None:
+            self._data = self.raw_data.decode("utf8")
+        return self._data
+
+    def getheaders(self):
+        """Return a dictionary of the response headers."""
+        return self.aiohttp_response.headers
+
+    def getheader(self, name, default=None):
+        """Return a given response header."""
+        return self.aiohttp_response.headers.get(name, default)
+
+
+class AsyncRESTClientObject(object):
+    """Make HTTP requests through a pool of keep-alive connections.
+
+    :param configuration: .Configuration object for this client.
+    :param session: an :class:`aiohttp.ClientSession` to make the requests
+        with, shared with its other users, who are responsible for closing
+        it.  By default, a session of this client's own is opened on the
+        first request, with up to `connection_pool_maxsize` connections.
+    """
+
+    def __init__(self, configuration, session=None):
+        """Initialize the client, without connecting yet."""
+        self.configuration = configuration
+        self._session = session
+        self._owns_session = session is None
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            configuration = self.configuration
+            ssl_context = ssl.create_default_context(
+                cafile=configuration.ssl_ca_cert or certifi.where()
+            )
+            if configuration.cert_file:
+                ssl_context.load_cert_chain(
+                    configuration.cert_file, keyfile=configuration.key_file
+                )
+            if not configuration.verify_ssl:
+                ssl_context.check_hostname = False
+                ssl_context.verify_mode = ssl.CERT_NONE
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=configuration.connection_pool_maxsize,
+                    ssl=ssl_context,
+                )
+            )
+            self._owns_session = True
+        return self._session
+
+    async def close(self):
+        """Close the connections, unless the session was passed in."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def request(
+        self,
+        method,
+        url,
+        query_params=None,
+        headers=None,
+        body=None,
+        post_params=None,
+        _preload_content=True,
+        _request_timeout=None,
+    ):
+        """Perform requests.
+
+        Takes the same parameters as
+        :meth:`zero_ex.sra_client.rest.RESTClientObject.request`.  The
+        response is always read in full.
+        """
+        method = method.upper()
+        assert method in [
+            "GET",
+            "HEAD",
+            "DELETE",
+            "POST",
+            "PUT",
+            "PATCH",
+            "OPTIONS",
+        ]
+
+        if post_params and body:
+            raise ValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or {}
+        headers = headers or {}
+
+        timeout = None
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                timeout = aiohttp.ClientTimeout(total=_request_timeout)
+            elif (
+                isinstance(_request_timeout, tuple)
+                and len(_request_timeout) == 2
+            ):
+                timeout = aiohttp.ClientTimeout(
+                    connect=_request_timeout[0],
+                    sock_read=_request_timeout[1],
+                )
+
+        if "Content-Type" not in headers:
+            headers["Content-Type"] = "application/json"
+
+        args = {"method": method, "url": url, "headers": headers}
+        if timeout is not None:
+            args["timeout"] = timeout
+        if self.configuration.proxy:
+            args["proxy"] = self.configuration.proxy
+
+        # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
+        if method in ["POST", "PUT", "PATCH", "OPTIONS", "DELETE"]:
+            if query_params:
+                args["url"] += "?" + urlencode(query_params)
+            if re.search("json", headers["Content-Type"], re.IGNORECASE):
+                if body is not None:
+                    args["data"] = self.configuration.json_codec.dumps(body)
+            elif (
+                headers["Content-Type"] == "application/x-www-form-urlencoded"
+            ):
+                args["data"] = aiohttp.FormData(post_params)
+            elif headers["Content-Type"] == "multipart/form-data":
+                # must del headers['Content-Type'], or the correct
+                # Content-Type which generated by aiohttp will be
+                # overwritten.
+                del headers["Content-Type"]
+                data = aiohttp.FormData()
+                for param in post_params:
+                    (key, value) = param
+                    if isinstance(value, tuple) and len(value) == 3:
+                        data.add_field(
+                            key,
+                            value[1],
+                            filename=value[0],
+                            content_type=value[2],
+                        )
+                    else:
+                        data.add_field(key, value)
+                args["data"] = data
+            # Pass a `string` parameter directly in the body to support
+            # other content types than Json when `body` argument is provided
+            # in serialized form
+            elif isinstance(body, str):
+                args["data"] = body
+            else:
+                # Cannot generate the request from given parameters
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+        # For `GET`, `HEAD`
+        elif query_params:
+            args["params"] = query_params
+
+        try:
+            async with self._get_session().request(**args) as resp:
+                data = await resp.read()
+        except aiohttp.ClientSSLError as e:
+            msg = "{0}\n{1}".format(type(e).__name__, str(e))
+            raise ApiException(status=0, reason=msg)
+        r = AsyncRESTResponse(resp, data)
+
+        # log response body
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("response body: %s", r.data)
+
+        if not 200 <= r.status <= 299:
+            raise ApiException(http_resp=r)
+
+        return r
@@ -12,6 +12,8 @@ import urllib3
 import six
 from six.moves import http_client as httplib
 
+from zero_ex.sra_client.json_codec import default_codec
+
 
 class TypeWithDefault(type):
     def __init__(cls, name, bases, dct):
@@ -91,6 +93,14 @@ class Configuration(six.with_metaclass(TypeWithDefault, object)):
         # Safe chars for path_param
         self.safe_chars_for_path_param = ""
 
+        # Set this to True to get responses as the plain dicts and lists
+        # decoded from their JSON, rather than as models.
+        self.raw_responses = False
+
+        # The codec to encode request bodies to, and decode responses from,
+        # JSON: orjson's if installed.  See zero_ex.sra_client.json_codec.
+        self.json_codec = default_codec()
+
     @property
     def logger_file(self):
         """The logger file.
@@ -0,0 +1,146 @@
+# coding: utf-8
+
+"""Encode request bodies to, and decode responses from, JSON.
+
+The client encodes and decodes with the codec in its configuration's
+`json_codec`, by default the one :func:`default_codec` picks: an
+:class:`OrjsonCodec` if orjson is installed, else a :class:`JsonCodec`.
+To use the standard library regardless::
+
+    config = Configuration()
+    config.json_codec = JsonCodec()
+
+Any object with `dumps(obj)` and `loads(data)` methods like theirs will do.
+"""
+
+import datetime
+import json
+
+_DIGITS_AND_SEPARATORS = bytes.maketrans(
+    b"0123456789[:,- \t\n\r", b"0" * 10 + b"|" * 8
+)
+"""Map each digit to 0, and what may come before a number in JSON to |."""
+
+_LARGE_INTEGER = b"|" + b"0" * 19
+"""What an integer of 19 digits or more becomes, mapped as above."""
+
+
+def _may_have_large_integers(data):
+    """Tell whether the JSON `data` may have integers beyond 64 bits in it.
+
+    An integer of 19 digits or more comes after the start of the document,
+    or after a "[", ":" or ",", and maybe spaces and a "-".  Digits inside
+    strings, as in token amounts or hashes, come after a quote or other
+    characters, so they aren't mistaken for one, unless a string happens
+    to have one of those followed by 19 digits.  Mapping the characters
+    with `bytes.translate` and searching for the result is much quicker
+    than a regular expression.
+
+    >>> _may_have_large_integers(b'{"total": 18446744073709551616}')
+    True
+    >>> _may_have_large_integers(b'{"amount": "18446744073709551616"}')
+    False
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8", "replace")
+    mapped = data.translate(_DIGITS_AND_SEPARATORS)
+    return mapped.startswith(_LARGE_INTEGER[1:]) or _LARGE_INTEGER in mapped
+
+
+def json_default(obj):
+    """Get something JSON can encode in place of `obj`.
+
+    Models are encoded as a dict of their attributes which are set, by
+    their JSON keys, and dates in ISO 8601 format, as
+    :meth:`ApiClient.sanitize_for_serialization` would.  This lets a codec
+    encode a body of dicts and lists, with models in it here and there,
+    without first copying it all.
+
+    >>> json_default(datetime.date(2020, 1, 2))
+    '2020-01-02'
+    """
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    if hasattr(obj, "openapi_types"):
+        return {
+            obj.attribute_map[attr]: getattr(obj, attr)
+            for attr in obj.openapi_types
+            if getattr(obj, attr) is not None
+        }
+    raise TypeError(
+        "Object of type %s is not JSON serializable" % type(obj).__name__
+    )
+
+
+class JsonCodec(object):
+    """Encode and decode JSON with the standard library."""
+
+    def dumps(self, obj):  # pylint: disable=no-self-use
+        """Encode `obj`, a request body, to JSON.
+
+        >>> JsonCodec().dumps({"page": 1})
+        '{"page": 1}'
+        """
+        return json.dumps(obj, default=json_default)
+
+    def loads(self, data):  # pylint: disable=no-self-use
+        """Decode a response body, in bytes or a string, from JSON.
+
+        >>> JsonCodec().loads(b'{"total": 0}')
+        {'total': 0}
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """Encode and decode JSON with orjson, which encodes several times faster.
+
+    orjson doesn't handle integers beyond 64 bits: it can't encode them,
+    and decodes them as floats, losing precision.  Bodies and responses
+    which may have such integers in them are encoded and decoded with the
+    standard library instead, as are responses orjson finds invalid, since
+    the standard library also accepts NaN and Infinity.  So the results are
+    the same as a :class:`JsonCodec`'s, except that orjson encodes NaN and
+    Infinity as null.
+
+    :raises ImportError: if orjson isn't installed.
+    """
+
+    def __init__(self):
+        """Check that orjson is installed."""
+        import orjson  # pylint: disable=import-outside-toplevel
+
+        self._orjson = orjson
+
+    def dumps(self, obj):
+        """Encode `obj`, a request body, to JSON in bytes."""
+        try:
+            return self._orjson.dumps(obj, default=json_default)
+        except TypeError:
+            # orjson doesn't encode integers beyond 64 bits
+            return super().dumps(obj)
+
+    def loads(self, data):
+        """Decode a response body, in bytes or a string, from JSON.
+
+        >>> OrjsonCodec().loads(b'{"total": 18446744073709551616}')
+        {'total': 18446744073709551616}
+        """
+        if _may_have_large_integers(data):
+            return super().loads(data)
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            return super().loads(data)
+
+
+def default_codec():
+    """Get the quickest codec available.
+
+    :returns: an :class:`OrjsonCodec` if orjson is installed, else a
+        :class:`JsonCodec`.
+    """
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return JsonCodec()
@@ -0,0 +1,467 @@
+# coding: utf-8
+
+"""Keep a local copy of a relayer's orderbook, from its orders channel.
+
+Rather than polling :meth:`RelayerApi.get_orderbook`, an
+:class:`OrderbookMirror` subscribes to the relayer's websocket orders
+channel, for the orders of one asset pair in both directions, and applies
+each update to an in-memory copy of the orderbook, seeded from one
+`get_orderbook` snapshot::
+
+    async with AsyncRelayerApi(relayer_url) as relayer:
+        async with OrderbookMirror(
+            relayer, websocket_url, base_asset_data, quote_asset_data
+        ) as mirror:
+            while True:
+                print(mirror.best_bid, mirror.best_ask)
+                await asyncio.sleep(1)
+
+If the connection drops, the mirror connects again, subscribes again, and
+replaces its copy with a new snapshot, to make up for the updates it
+missed.  Until then, it keeps serving the copy it had.
+"""
+
+import asyncio
+from bisect import bisect_left, insort
+from fractions import Fraction
+import json
+import logging
+import uuid
+
+import aiohttp
+
+from zero_ex.sra_client.models import (
+    RelayerApiOrdersChannelSubscribePayloadSchema,
+    RelayerApiOrdersChannelSubscribeSchema,
+)
+from zero_ex.sra_client.rest import ApiException
+
+logger = logging.getLogger(__name__)
+
+REMOVED_STATES = frozenset(
+    [
+        "FULLY_FILLED",
+        "CANCELLED",
+        "EXPIRED",
+        "UNFUNDED",
+        "INVALID",
+        "STOPPED_WATCHING",
+    ]
+)
+"""The states, in an order's `metaData`, of orders no longer fillable."""
+
+
+def _is_removed(meta_data) -> bool:
+    """Tell whether an update's metadata says its order is gone.
+
+    >>> _is_removed({"remainingFillableTakerAssetAmount": "0"})
+    True
+    >>> _is_removed({"state": "CANCELLED"})
+    True
+    >>> _is_removed({"remainingFillableTakerAssetAmount": "2"})
+    False
+    """
+    meta_data = meta_data or {}
+    return (
+        meta_data.get("remainingFillableTakerAssetAmount") in ("0", 0)
+        or meta_data.get("state") in REMOVED_STATES
+    )
+
+
+def _is_retryable(error) -> bool:
+    """Tell whether connecting again might get round `error`."""
+    if isinstance(error, ApiException):
+        return error.status in (0, 429) or error.status >= 500
+    return isinstance(
+        error, (aiohttp.ClientError, asyncio.TimeoutError, OSError)
+    )
+
+
+class OrderbookSide(object):
+    """The orders on one side of an orderbook, best price first.
+
+    :param is_bid: whether the orders are bids, which buy the base asset,
+        rather than asks, which sell it.
+    """
+
+    def __init__(self, is_bid: bool):
+        """Initialize an empty side."""
+        self.is_bid = is_bid
+        self._keys = []
+        self._orders = {}
+
+    def sort_key(self, order) -> tuple:
+        """Get the key to sort `order` by, the best price first.
+
+        The price is the amount of the quote asset per unit of the base
+        asset, and ties are broken by order hash.
+        """
+        maker_amount = int(order.order["makerAssetAmount"])
+        taker_amount = int(order.order["takerAssetAmount"])
+        if self.is_bid:
+            # pays maker_amount of the quote asset for taker_amount of the
+            # base asset, the more the better
+            price = -Fraction(maker_amount, taker_amount)
+        else:
+            price = Fraction(taker_amount, maker_amount)
+        return (price, order.meta_data["orderHash"])
+
+    def put(self, order):
+        """Add `order`, or replace the order with the same hash.
+
+        An order for nothing, or for nothing in return, has no price, and
+        is left out.
+        """
+        order_hash = order.meta_data["orderHash"]
+        self.remove(order_hash)
+        if (
+            int(order.order["makerAssetAmount"]) <= 0
+            or int(order.order["takerAssetAmount"]) <= 0
+        ):
+            return
+        key = self.sort_key(order)
+        insort(self._keys, key)
+        self._orders[order_hash] = (key, order)
+
+    def remove(self, order_hash: str):
+        """Remove the order with hash `order_hash`, if there is one."""
+        entry = self._orders.pop(order_hash, None)
+        if entry is not None:
+            del self._keys[bisect_left(self._keys, entry[0])]
+
+    def get(self, order_hash: str):
+        """Get the order with hash `order_hash`, or None."""
+        entry = self._orders.get(order_hash)
+        return None if entry is None else entry[1]
+
+    @property
+    def best(self):
+        """Get the order with the best price, or None if there are none."""
+        if not self._keys:
+            return None
+        return self._orders[self._keys[0][1]][1]
+
+    def __len__(self) -> int:
+        """Get the number of orders."""
+        return len(self._keys)
+
+    def __iter__(self):
+        """Iterate over the orders, best price first."""
+        return (self._orders[order_hash][1] for (_, order_hash) in self._keys)
+
+
+class OrderbookMirror(object):
+    """A copy of the orderbook for an asset pair, kept up to date.
+
+    Use it as an asynchronous context manager, which starts following the
+    orders channel and waits for the first snapshot to be in, or call
+    :meth:`start`, :meth:`wait_synced` and :meth:`close` yourself.
+
+    The bids are orders of the quote asset for the base asset, and the asks
+    orders of the base asset for the quote asset, as in
+    :meth:`RelayerApi.get_orderbook`.  Each of the orders is a
+    :class:`RelayerApiOrderSchema`.
+
+    :param relayer: the relayer to get snapshots of the orderbook from, an
+        :class:`AsyncRelayerApi` returning models rather than raw responses.
+    :param websocket_url: the URL of the relayer's websocket API.
+    :param base_asset_data: the asset data of the base asset of the pair.
+    :param quote_asset_data: the asset data of the quote asset.
+    :param session: an :class:`aiohttp.ClientSession` to connect to the
+        websocket with.  By default, the mirror opens one of its own.
+    :param per_page: the number of orders per side to request per page of
+        the snapshot.
+    :param heartbeat: seconds between pings to the relayer, to notice a
+        connection that has silently dropped.
+    :param reconnect_delay: seconds to wait before connecting again after
+        the connection drops.  It doubles with every attempt which fails in
+        a row, up to `max_reconnect_delay`.
+    :param max_reconnect_delay: the longest wait before connecting again.
+    """
+
+    def __init__(
+        self,
+        relayer,
+        websocket_url: str,
+        base_asset_data: str,
+        quote_asset_data: str,
+        session=None,
+        per_page: int = 100,
+        heartbeat: float = 30.0,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ):
+        """Initialize an empty copy, without connecting yet."""
+        if relayer.api_client.configuration.raw_responses:
+            raise ValueError(
+                "OrderbookMirror needs a relayer without raw_responses"
+            )
+        self.relayer = relayer
+        self.websocket_url = websocket_url
+        self.base_asset_data = base_asset_data.lower()
+        self.quote_asset_data = quote_asset_data.lower()
+        self.per_page = per_page
+        self.heartbeat = heartbeat
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.bids = OrderbookSide(is_bid=True)
+        self.asks = OrderbookSide(is_bid=False)
+        self.n_snapshots = 0
+        """The number of snapshots taken, one per connection."""
+        self._session = session
+        self._owns_session = session is None
+        self._request_ids = set()
+        self._synced = None
+        self._task = None
+
+    @property
+    def best_bid(self):
+        """Get the bid with the highest price, or None."""
+        return self.bids.best
+
+    @property
+    def best_ask(self):
+        """Get the ask with the lowest price, or None."""
+        return self.asks.best
+
+    @property
+    def synced(self) -> bool:
+        """Tell whether the copy is following the relayer's updates.
+
+        It isn't before the first snapshot is in, nor while connecting
+        again.
+        """
+        return self._synced is not None and self._synced.is_set()
+
+    def get_order(self, order_hash: str):
+        """Get the order with hash `order_hash`, on either side, or None."""
+        order = self.bids.get(order_hash)
+        return order if order is not None else self.asks.get(order_hash)
+
+    def start(self):
+        """Start following the orders channel, in a task of the running loop.
+
+        :return: the task, which only ends when cancelled, or on an error
+            which connecting again won't get round.
+        """
+        if self._synced is None:
+            self._synced = asyncio.Event()
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self.run())
+        return self._task
+
+    async def wait_synced(self):
+        """Wait until the copy is following the relayer's updates.
+
+        :raises: whatever stopped the mirror, if it stops first.
+        """
+        task = self.start()
+        synced = asyncio.ensure_future(self._synced.wait())
+        try:
+            await asyncio.wait(
+                [synced, task], return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            synced.cancel()
+        if not self.synced:
+            task.result()
+
+    async def close(self):
+        """Stop following the orders channel, and close the connection.
+
+        An error which already stopped the mirror isn't raised again.  It's
+        raised by :meth:`wait_synced`, and by the task :meth:`start`
+        returned.
+        """
+        if self._task is not None:
+            if not self._task.done():
+                self._task.cancel()
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+            self._task = None
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        """Start following the orders channel, and wait for the snapshot."""
+        try:
+            await self.wait_synced()
+        except BaseException:
+            await self.close()
+            raise
+        return self
+
+    async def __aexit__(self, *args):
+        """Stop following the orders channel."""
+        await self.close()
+
+    async def run(self):
+        """Follow the orders channel, connecting again whenever it drops."""
+        if self._synced is None:
+            self._synced = asyncio.Event()
+        delay = self.reconnect_delay
+        while True:
+            try:
+                await self._follow()
+            except Exception as error:  # pylint: disable=broad-except
+                if not _is_retryable(error):
+                    raise
+                logger.warning(
+                    "Lost the orders channel (%r), connecting again in %gs",
+                    error,
+                    delay,
+                )
+            else:
+                logger.warning(
+                    "The relayer closed the orders channel, connecting again"
+                    " in %gs",
+                    delay,
+                )
+            if self.synced:
+                delay = self.reconnect_delay
+            self._synced.clear()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+            self._owns_session = True
+        return self._session
+
+    def _subscriptions(self):
+        """Get subscriptions to the orders of the pair, either way round."""
+        api_client = self.relayer.api_client
+        self._request_ids = set()
+        messages = []
+        for (maker_asset_data, taker_asset_data) in [
+            (self.base_asset_data, self.quote_asset_data),
+            (self.quote_asset_data, self.base_asset_data),
+        ]:
+            request_id = str(uuid.uuid4())
+            self._request_ids.add(request_id)
+            messages.append(
+                api_client.sanitize_for_serialization(
+                    RelayerApiOrdersChannelSubscribeSchema(
+                        type="subscribe",
+                        channel="orders",
+                        request_id=request_id,
+                        payload=RelayerApiOrdersChannelSubscribePayloadSchema(
+                            maker_asset_data=maker_asset_data,
+                            taker_asset_data=taker_asset_data,
+                        ),
+                    )
+                )
+            )
+        return messages
+
+    async def _follow(self):
+        """Subscribe, take a snapshot, then apply updates until disconnected.
+
+        Updates arriving while the snapshot is being taken are queued, and
+        applied on top of it.
+        """
+        async with self._get_session().ws_connect(
+            self.websocket_url, heartbeat=self.heartbeat
+        ) as websocket:
+            for message in self._subscriptions():
+                await websocket.send_str(json.dumps(message))
+            updates = asyncio.Queue()
+            reader = asyncio.ensure_future(self._read(websocket, updates))
+            try:
+                (bids, asks) = await self._get_snapshot()
+                self.n_snapshots += 1
+                self.bids, self.asks = bids, asks
+                while not updates.empty():
+                    orders = updates.get_nowait()
+                    if orders is None:
+                        return
+                    self._apply(orders)
+                self._synced.set()
+                while True:
+                    orders = await updates.get()
+                    if orders is None:
+                        return
+                    self._apply(orders)
+            finally:
+                reader.cancel()
+
+    async def _read(self, websocket, updates):
+        """Queue the orders of each update, then None once disconnected."""
+        try:
+            async for message in websocket:
+                if message.type == aiohttp.WSMsgType.TEXT:
+                    orders = self._parse_update(message.data)
+                    if orders is not None:
+                        updates.put_nowait(orders)
+                elif message.type == aiohttp.WSMsgType.ERROR:
+                    logger.warning(
+                        "Orders channel error: %r", websocket.exception()
+                    )
+                    break
+        finally:
+            updates.put_nowait(None)
+
+    def _parse_update(self, text):
+        """Get the orders of an update to our subscriptions, or None."""
+        try:
+            message = self.relayer.api_client.configuration.json_codec.loads(
+                text
+            )
+        except ValueError:
+            logger.warning("Ignoring a malformed message: %r", text)
+            return None
+        if (
+            not isinstance(message, dict)
+            or message.get("type") != "update"
+            or message.get("channel") != "orders"
+            or message.get("requestId") not in self._request_ids
+        ):
+            return None
+        return self.relayer.api_client.deserialize_data(
+            message.get("payload") or [], "list[RelayerApiOrderSchema]"
+        )
+
+    async def _get_snapshot(self):
+        """Get both sides of the orderbook, one page after another."""
+        bids = OrderbookSide(is_bid=True)
+        asks = OrderbookSide(is_bid=False)
+        page = 1
+        while True:
+            orderbook = await self.relayer.get_orderbook(
+                self.base_asset_data,
+                self.quote_asset_data,
+                page=page,
+                per_page=self.per_page,
+            )
+            for order in orderbook.bids.records:
+                bids.put(order)
+            for order in orderbook.asks.records:
+                asks.put(order)
+            if (
+                len(orderbook.bids.records) < self.per_page
+                and len(orderbook.asks.records) < self.per_page
+            ):
+                return (bids, asks)
+            page += 1
+
+    def _apply(self, orders):
+        """Add, replace or remove each of `orders` on its side of the book."""
+        for order in orders:
+            assets = (
+                order.order["makerAssetData"].lower(),
+                order.order["takerAssetData"].lower(),
+            )
+            if assets == (self.base_asset_data, self.quote_asset_data):
+                side = self.asks
+            elif assets == (self.quote_asset_data, self.base_asset_data):
+                side = self.bids
+            else:
+                continue
+            if _is_removed(order.meta_data):
+                side.remove(order.meta_data["orderHash"])
+            else:
+                side.put(order)
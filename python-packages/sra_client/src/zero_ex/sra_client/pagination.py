@@ -0,0 +1,109 @@
+# coding: utf-8
+
+"""Iterate over all the records of a paginated relayer endpoint.
+
+The records are yielded one at a time, and while the caller consumes one
+page of them, the next page is already being requested, so at most about
+two pages are held in memory however many records there are.  Pages are
+requested until as many records as the relayer's `total` have been
+yielded, or a page comes back empty.
+"""
+
+import asyncio
+
+
+def _page_params(page, per_page):
+    return {
+        "page": page,
+        "per_page": per_page,
+        "_return_http_data_only": True,
+        "_preload_content": False,
+    }
+
+
+def _read_page(api_client, response, record_type, n_yielded, per_page):
+    """Get the records of a page, and whether there are more after them.
+
+    :param api_client: the client which requested the page.
+    :param response: the response to the request, not yet deserialized.
+    :param record_type: the class name of the records.
+    :param n_yielded: the number of records in the pages before this one.
+    :param per_page: the number of records requested per page.
+    """
+    data = api_client.decode_json(response)
+    records = api_client.deserialize_data(
+        data.get("records") or [], "list[%s]" % record_type
+    )
+    total = data.get("total")
+    if total is None:
+        more = len(records) >= per_page
+    else:
+        more = bool(records) and n_yielded + len(records) < int(total)
+    return (records, more)
+
+
+def iter_records(api_client, get_page, record_type, per_page, **kwargs):
+    """Yield the records of every page, requesting each page in advance.
+
+    :param api_client: the :class:`ApiClient` whose thread pool requests
+        the pages.
+    :param get_page: the `*_with_http_info` method of the endpoint.
+    :param record_type: the class name of the records.
+    :param per_page: the number of records to request per page.
+    :param kwargs: the other parameters of the endpoint.
+
+    If the caller stops early, the request for the next page, already
+    under way in the thread pool, can't be cancelled.  It is left to finish,
+    and its response is discarded.
+    """
+    page = 1
+    n_yielded = 0
+    pending = get_page(
+        async_req=True, **_page_params(page, per_page), **kwargs
+    )
+    while pending is not None:
+        (records, more) = _read_page(
+            api_client, pending.get(), record_type, n_yielded, per_page
+        )
+        n_yielded += len(records)
+        page += 1
+        pending = (
+            get_page(async_req=True, **_page_params(page, per_page), **kwargs)
+            if more
+            else None
+        )
+        yield from records
+
+
+async def aiter_records(api_client, get_page, record_type, per_page, **kwargs):
+    """Like :func:`iter_records`, for an :class:`AsyncApiClient`.
+
+    The `*_with_http_info` method returns a coroutine, each of which is
+    run as a task, so the next page arrives while the current one is
+    consumed.  If the caller stops early, the request for the next page is
+    cancelled.
+    """
+    page = 1
+    n_yielded = 0
+    pending = asyncio.ensure_future(
+        get_page(**_page_params(page, per_page), **kwargs)
+    )
+    try:
+        while pending is not None:
+            (records, more) = _read_page(
+                api_client, await pending, record_type, n_yielded, per_page
+            )
+            n_yielded += len(records)
+            page += 1
+            pending = (
+                asyncio.ensure_future(
+                    get_page(**_page_params(page, per_page), **kwargs)
+                )
+                if more
+                else None
+            )
+            for record in records:
+                yield record
+    finally:
+        if pending is not None:
+            pending.cancel()
@@ -4,7 +4,6 @@
 from __future__ import absolute_import
 
 import io
-import json
 import logging
 import re
 import ssl
@@ -29,7 +28,23 @@ class RESTResponse(io.IOBase):
         self.urllib3_response = resp
         self.status = resp.status
         self.reason = resp.reason
-        self.data = resp.data
+        self.raw_data = resp.data
+        self._data = None
+
+    @property
+    def data(self):
+        """The body of the response, decoded to a string when first read."""
+        if self._data is None:
+            self._data = self.raw_data
+            # In the python 3, the response.data is bytes.
+            # we need to decode it to string.
+            if six.PY3 and isinstance(self._data, bytes):
+                self._data = self._data.decode("utf8")
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
 
     def getheaders(self):
         """Returns a dictionary of the response headers."""
@@ -48,6 +63,8 @@ class RESTClientObject(object):
         # maxsize is the number of requests to host that are allowed in parallel  # noqa: E501
         # Custom SSL certificates and client certificates: http://urllib3.readthedocs.io/en/latest/advanced-usage.html  # noqa: E501
 
+        self.configuration = configuration
+
         # cert_reqs
         if configuration.verify_ssl:
             cert_reqs = ssl.CERT_REQUIRED
@@ -169,7 +186,9 @@ class RESTClientObject(object):
                 if re.search("json", headers["Content-Type"], re.IGNORECASE):
                     request_body = None
                     if body is not None:
-                        request_body = json.dumps(body)
+                        request_body = self.configuration.json_codec.dumps(
+                            body
+                        )
                     r = self.pool_manager.request(
                         method,
                         url,
@@ -241,13 +260,9 @@ class RESTClientObject(object):
         if _preload_content:
             r = RESTResponse(r)
 
-            # In the python 3, the response.data is bytes.
-            # we need to decode it to string.
-            if six.PY3:
-                r.data = r.data.decode("utf8")
-
             # log response body
-            logger.debug("response body: %s", r.data)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("response body: %s", r.data)
 
         if not 200 <= r.status <= 299:
             raise ApiException(http_resp=r)
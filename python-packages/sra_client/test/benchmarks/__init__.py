@@ -0,0 +1,6 @@
+"""Benchmarks of zero_ex.sra_client.
+
+These are not collected as tests.  Run each one as a script, eg::
+
+    python -m test.benchmarks.bench_async_relayer_api
+"""
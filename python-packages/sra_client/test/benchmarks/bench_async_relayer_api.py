@@ -0,0 +1,71 @@
+"""Measure concurrent relayer requests per second, threaded and asyncio.
+
+The requests go over HTTP to a local stand-in for a relayer, started by the
+benchmark, which waits a while before answering each request, as a remote
+relayer would.  :class:`RelayerApi` with `async_req=True`:code:, which hands
+each request to its client's thread pool, is compared with
+:class:`AsyncRelayerApi`, all of whose requests are awaited at once.
+"""
+
+import asyncio
+import sys
+from timeit import default_timer
+
+from zero_ex.sra_client import ApiClient, AsyncRelayerApi, RelayerApi
+
+from ..stand_in_relayer import StandInRelayer
+
+N_REQUESTS = 1000
+
+LATENCY = 0.05
+
+POOL_THREADS = (None, 64)
+"""The sizes of thread pool to try.  The default is the number of CPUs."""
+
+
+def report(label: str, n_requests: int, seconds: float) -> None:
+    """Print the rate of requests."""
+    print(f"{label:<50} {n_requests / seconds:>9,.0f} requests/second")
+
+
+async def _get_orders_async(url: str, n_requests: int) -> list:
+    async with AsyncRelayerApi(url) as relayer:
+        return await asyncio.gather(
+            *[relayer.get_orders(per_page=20) for _ in range(n_requests)]
+        )
+
+
+def main(n_requests: int = N_REQUESTS) -> None:
+    """Report the rate of `get_orders()`:code: requests each way."""
+    with StandInRelayer(n_orders=100, latency=LATENCY) as stand_in:
+        print(f"latency {LATENCY * 1000:g} ms:")
+        for pool_threads in POOL_THREADS:
+            relayer = RelayerApi(stand_in.url)
+            configuration = relayer.api_client.configuration
+            if pool_threads is not None:
+                configuration.connection_pool_maxsize = pool_threads
+            relayer.api_client = ApiClient(
+                configuration, pool_threads=pool_threads
+            )
+            start = default_timer()
+            threads = [
+                relayer.get_orders(per_page=20, async_req=True)
+                for _ in range(n_requests)
+            ]
+            threaded = [thread.get() for thread in threads]
+            report(
+                "  RelayerApi, async_req=True, "
+                + f"{pool_threads or 'default'} threads",
+                n_requests,
+                default_timer() - start,
+            )
+            relayer.api_client.pool.close()
+
+        start = default_timer()
+        awaited = asyncio.run(_get_orders_async(stand_in.url, n_requests))
+        report("  AsyncRelayerApi", n_requests, default_timer() - start)
+        assert awaited == threaded
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,76 @@
+"""Measure deserializing a large page of orders.
+
+A :class:`RelayerApiOrdersResponseSchema` page of orders, as a relayer
+would send it, is deserialized into models, as usual, and, with
+`raw_responses`:code: set in the client's configuration, into the plain
+dicts and lists decoded from the JSON.
+"""
+
+import json
+import sys
+from timeit import timeit
+
+from zero_ex.sra_client import ApiClient, Configuration
+
+from ..stand_in_relayer import order
+
+N_ORDERS = 1000
+
+N_REPEATS = 20
+
+
+class _Response:  # pylint: disable=too-few-public-methods
+    def __init__(self, data: str):
+        self.data = data
+
+
+def report(label: str, seconds: float, n_orders: int) -> None:
+    """Print the time per page and the rate of orders."""
+    print(
+        f"{label:<25} {seconds * 1000:>9,.1f} ms/page"
+        + f" {n_orders / seconds:>12,.0f} orders/second"
+    )
+
+
+def main(n_orders: int = N_ORDERS, n_repeats: int = N_REPEATS) -> None:
+    """Report the time to deserialize a page of `n_orders`:code:."""
+    response = _Response(
+        json.dumps(
+            {
+                "total": n_orders,
+                "page": 1,
+                "perPage": n_orders,
+                "records": [order(index) for index in range(n_orders)],
+            }
+        )
+    )
+    print(f"a page of {n_orders} orders:")
+    for raw_responses in (False, True):
+        configuration = Configuration()
+        if raw_responses:
+            configuration.raw_responses = True
+        api_client = ApiClient(configuration)
+        page = api_client.deserialize(
+            response, "RelayerApiOrdersResponseSchema"
+        )
+        assert len(page["records"] if raw_responses else page.records) == (
+            n_orders
+        )
+        seconds = (
+            timeit(
+                lambda: api_client.deserialize(
+                    response, "RelayerApiOrdersResponseSchema"
+                ),
+                number=n_repeats,
+            )
+            / n_repeats
+        )
+        report(
+            "  raw_responses" if raw_responses else "  models",
+            seconds,
+            n_orders,
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,91 @@
+"""Measure reading a whole orderbook page by page, and with iter_orders().
+
+The orders are served over HTTP by a local stand-in for a relayer, started
+by the benchmark, which waits a while before answering each request, as a
+remote relayer would.  Each order is then processed, which takes a while
+too.  A loop calling `get_orders()`:code: for one page after another,
+collecting the orders and then processing them, is compared with
+processing each order as :meth:`RelayerApi.iter_orders` yields it.
+"""
+
+import sys
+import time
+import tracemalloc
+from timeit import default_timer
+
+from zero_ex.sra_client import RelayerApi
+
+from ..stand_in_relayer import StandInRelayer
+
+N_ORDERS = 2000
+
+PER_PAGE = 100
+
+LATENCY = 0.05
+
+PROCESSING_TIME = 0.0005
+"""Seconds spent on each order, by the caller."""
+
+
+def report(label: str, n_orders: int, seconds: float, peak: int) -> None:
+    """Print the rate of orders and the peak memory allocated."""
+    print(
+        f"{label:<30} {n_orders / seconds:>9,.0f} orders/second"
+        + f" {peak / 2 ** 20:>9,.1f} MiB peak"
+    )
+
+
+def _process(order) -> None:
+    time.sleep(PROCESSING_TIME)
+    assert order.meta_data["orderHash"]
+
+
+def _get_every_page(relayer: RelayerApi) -> list:
+    orders = []
+    page = 1
+    while True:
+        records = relayer.get_orders(page=page, per_page=PER_PAGE).records
+        if not records:
+            return orders
+        orders.extend(records)
+        page += 1
+
+
+def main(n_orders: int = N_ORDERS) -> None:
+    """Report the rate of orders processed each way."""
+    with StandInRelayer(n_orders=n_orders, latency=LATENCY) as stand_in:
+        relayer = RelayerApi(stand_in.url)
+        print(
+            f"{n_orders} orders, {PER_PAGE} per page, "
+            + f"latency {LATENCY * 1000:g} ms:"
+        )
+
+        tracemalloc.start()
+        start = default_timer()
+        for order in _get_every_page(relayer):
+            _process(order)
+        seconds = default_timer() - start
+        report(
+            "  get_orders(), page by page",
+            n_orders,
+            seconds,
+            tracemalloc.get_traced_memory()[1],
+        )
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        start = default_timer()
+        for order in relayer.iter_orders(per_page=PER_PAGE):
+            _process(order)
+        seconds = default_timer() - start
+        report(
+            "  iter_orders()",
+            n_orders,
+            seconds,
+            tracemalloc.get_traced_memory()[1],
+        )
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
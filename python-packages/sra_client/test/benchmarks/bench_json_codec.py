@@ -0,0 +1,91 @@
+"""Measure encoding and decoding large batches of orders, with each codec.
+
+Posting orders means encoding them to JSON, and fetching them means
+decoding them.  Before JSON codecs were pluggable, the client copied each
+request body with :meth:`ApiClient.sanitize_for_serialization` before
+encoding it, and decoded each response to a string before decoding its
+JSON, which are both measured too.
+"""
+
+import json
+import sys
+from timeit import timeit
+
+from zero_ex.sra_client import ApiClient, Configuration
+from zero_ex.sra_client.json_codec import JsonCodec, OrjsonCodec
+
+from ..stand_in_relayer import order
+
+N_ORDERS = 1000
+
+N_REPEATS = 20
+
+
+class _Response:  # pylint: disable=too-few-public-methods
+    def __init__(self, raw_data: bytes):
+        self.raw_data = raw_data
+        self.data = raw_data.decode("utf8")
+
+
+def report(label: str, seconds: float) -> None:
+    """Print the time per batch."""
+    print(f"{label:<45} {seconds * 1000:>9,.2f} ms/batch")
+
+
+def _time(function, n_repeats: int) -> float:
+    return timeit(function, number=n_repeats) / n_repeats
+
+
+def main(n_orders: int = N_ORDERS, n_repeats: int = N_REPEATS) -> None:
+    """Report the time to encode and decode a batch of `n_orders`:code:."""
+    orders = [order(index)["order"] for index in range(n_orders)]
+    page = {
+        "total": n_orders,
+        "page": 1,
+        "perPage": n_orders,
+        "records": [order(index) for index in range(n_orders)],
+    }
+    response = _Response(json.dumps(page).encode("utf8"))
+    api_client = ApiClient(Configuration())
+
+    print(f"{n_orders} orders, encoding:")
+    report(
+        "  sanitize_for_serialization() and json.dumps()",
+        _time(
+            lambda: json.dumps(api_client.sanitize_for_serialization(orders)),
+            n_repeats,
+        ),
+    )
+    for codec in (JsonCodec(), OrjsonCodec()):
+        report(
+            f"  {type(codec).__name__}.dumps()",
+            _time(lambda: codec.dumps(orders), n_repeats),
+        )
+
+    print(f"{n_orders} orders, decoding:")
+    report(
+        "  bytes.decode() and json.loads()",
+        _time(lambda: json.loads(response.raw_data.decode("utf8")), n_repeats),
+    )
+    for codec in (JsonCodec(), OrjsonCodec()):
+        report(
+            f"  {type(codec).__name__}.loads()",
+            _time(lambda: codec.loads(response.raw_data), n_repeats),
+        )
+
+    print(f"{n_orders} orders, deserializing into models:")
+    for codec in (JsonCodec(), OrjsonCodec()):
+        api_client.configuration.json_codec = codec
+        report(
+            f"  with {type(codec).__name__}",
+            _time(
+                lambda: api_client.deserialize(
+                    response, "RelayerApiOrdersResponseSchema"
+                ),
+                n_repeats,
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,150 @@
+"""Measure an OrderbookMirror against polling get_orderbook().
+
+The orderbook is served by a local stand-in for a relayer, started by the
+benchmark, which waits a while before answering each request for a page of
+it, as a remote relayer would.  Getting the best bid and ask by polling
+every page of :meth:`AsyncRelayerApi.get_orderbook` is compared with
+reading them from an :class:`OrderbookMirror`, and the rate at which the
+mirror applies updates, and how soon it reflects a new order, are
+measured.
+"""
+
+import asyncio
+import sys
+from timeit import default_timer, timeit
+
+from zero_ex.sra_client import AsyncRelayerApi, OrderbookMirror
+
+from ..stand_in_orders_channel import (
+    BASE_ASSET_DATA,
+    QUOTE_ASSET_DATA,
+    StandInOrdersChannel,
+    priced_order,
+)
+
+N_ORDERS = 1000
+"""The number of orders on each side of the book."""
+
+PER_PAGE = 100
+
+LATENCY = 0.05
+
+N_UPDATES = 100
+
+
+def report(label: str, value: float, unit: str) -> None:
+    """Print a measurement."""
+    print(f"{label:<45} {value:>12,.1f} {unit}")
+
+
+async def _poll(relayer: AsyncRelayerApi) -> tuple:
+    """Get the best bid and ask from every page of the orderbook."""
+    bids, asks, page = [], [], 1
+    while True:
+        orderbook = await relayer.get_orderbook(
+            BASE_ASSET_DATA, QUOTE_ASSET_DATA, page=page, per_page=PER_PAGE
+        )
+        bids.extend(orderbook.bids.records)
+        asks.extend(orderbook.asks.records)
+        if (
+            len(orderbook.bids.records) < PER_PAGE
+            and len(orderbook.asks.records) < PER_PAGE
+        ):
+            break
+        page += 1
+    return (
+        max(
+            bids,
+            key=lambda order: int(order.order["makerAssetAmount"])
+            / int(order.order["takerAssetAmount"]),
+        ),
+        min(
+            asks,
+            key=lambda order: int(order.order["takerAssetAmount"])
+            / int(order.order["makerAssetAmount"]),
+        ),
+    )
+
+
+async def _measure(stand_in: StandInOrdersChannel, n_orders: int) -> None:
+    loop = asyncio.get_running_loop()
+    async with AsyncRelayerApi(stand_in.url) as relayer:
+        start = default_timer()
+        await _poll(relayer)
+        report(
+            "  polling get_orderbook(), per poll",
+            (default_timer() - start) * 1000,
+            "ms",
+        )
+
+        start = default_timer()
+        async with OrderbookMirror(
+            relayer,
+            stand_in.websocket_url,
+            BASE_ASSET_DATA,
+            QUOTE_ASSET_DATA,
+            per_page=PER_PAGE,
+        ) as mirror:
+            report(
+                "  OrderbookMirror, first snapshot",
+                (default_timer() - start) * 1000,
+                "ms",
+            )
+            n_lookups = 100000
+            seconds = timeit(
+                lambda: (mirror.best_bid, mirror.best_ask), number=n_lookups
+            )
+            report(
+                "  OrderbookMirror, best bid and ask",
+                seconds / n_lookups * 1e9,
+                "ns",
+            )
+
+            # pylint: disable=protected-access
+            updates = [
+                mirror.relayer.api_client.deserialize_data(
+                    [priced_order(index, 50 + index % 100, index % 2 == 0)],
+                    "list[RelayerApiOrderSchema]",
+                )
+                for index in range(n_orders)
+            ]
+            start = default_timer()
+            for update in updates:
+                mirror._apply(update)
+            report(
+                "  OrderbookMirror, updates applied",
+                n_orders / (default_timer() - start),
+                "/second",
+            )
+
+            delays = []
+            for index in range(N_UPDATES):
+                record = priced_order(10 ** 6 + index, 1, False)
+                order_hash = record["metaData"]["orderHash"]
+                start = default_timer()
+                await loop.run_in_executor(None, stand_in.put, record)
+                while mirror.asks.get(order_hash) is None:
+                    await asyncio.sleep(0)
+                delays.append(default_timer() - start)
+            report(
+                "  OrderbookMirror, new order to best ask",
+                sum(delays) / len(delays) * 1000,
+                "ms",
+            )
+
+
+def main(n_orders: int = N_ORDERS) -> None:
+    """Report the cost of the best bid and ask each way."""
+    with StandInOrdersChannel(snapshot_latency=LATENCY) as stand_in:
+        for index in range(n_orders):
+            stand_in.put(priced_order(index, 100 + index, False))
+            stand_in.put(priced_order(n_orders + index, 1 + index % 99, True))
+        print(
+            f"{n_orders} orders a side, {PER_PAGE} per page, "
+            + f"latency {LATENCY * 1000:g} ms:"
+        )
+        asyncio.run(_measure(stand_in, n_orders))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
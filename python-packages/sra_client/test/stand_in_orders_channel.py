@@ -0,0 +1,213 @@
+"""A local stand-in for an SRA relayer's orderbook and orders channel."""
+
+import asyncio
+import json
+import threading
+import time
+from typing import Optional
+
+from aiohttp import web
+
+from .stand_in_relayer import ASSET_DATA_A, ASSET_DATA_B, order
+
+BASE_ASSET_DATA = ASSET_DATA_A
+
+QUOTE_ASSET_DATA = ASSET_DATA_B
+
+
+def priced_order(index: int, price: int, is_bid: bool) -> dict:
+    """Get an order for 1000 units of the base asset, at `price`:code:.
+
+    :param price: the number of units of the quote asset for each unit of
+        the base asset.
+    :param is_bid: whether the order buys the base asset, rather than sells
+        it.
+    """
+    record = order(index)
+    base_amount = "1000"
+    quote_amount = str(1000 * price)
+    if is_bid:
+        record["order"].update(
+            makerAssetData=QUOTE_ASSET_DATA,
+            takerAssetData=BASE_ASSET_DATA,
+            makerAssetAmount=quote_amount,
+            takerAssetAmount=base_amount,
+        )
+    else:
+        record["order"].update(
+            makerAssetData=BASE_ASSET_DATA,
+            takerAssetData=QUOTE_ASSET_DATA,
+            makerAssetAmount=base_amount,
+            takerAssetAmount=quote_amount,
+        )
+    record["metaData"]["remainingFillableTakerAssetAmount"] = record["order"][
+        "takerAssetAmount"
+    ]
+    return record
+
+
+class StandInOrdersChannel:
+    """Serve `/v3/orderbook`:code: and the websocket orders channel.
+
+    The orderbook is :attr:`orders`.  Changing it through :meth:`put` and
+    :meth:`remove` sends an update to each subscription it matches.  Use it
+    as a context manager to run it in a background thread.
+
+    :param snapshot_latency: seconds to wait before answering each request
+        for a page of the orderbook, with the orders as they were when it
+        was received.
+    """
+
+    def __init__(self, snapshot_latency: float = 0.0):
+        """Prepare to serve an empty orderbook."""
+        self.snapshot_latency = snapshot_latency
+        self.orders = {}
+        """The orders, by hash."""
+        self.orderbook_requests = 0
+        self.connections = 0
+        """The number of websocket connections accepted so far."""
+        self.lock = threading.Lock()
+        self._subscriptions = {}
+        self._loop = asyncio.new_event_loop()
+        self._runner: Optional[web.AppRunner] = None
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, daemon=True
+        )
+        self._port = None
+
+    @property
+    def url(self) -> str:
+        """Get the URL of the HTTP API."""
+        return "http://127.0.0.1:{}".format(self._port)
+
+    @property
+    def websocket_url(self) -> str:
+        """Get the URL of the websocket API."""
+        return "ws://127.0.0.1:{}/ws".format(self._port)
+
+    def put(self, record: dict):
+        """Add an order, or replace it, and send an update about it."""
+        with self.lock:
+            self.orders[record["metaData"]["orderHash"]] = record
+        self._call(self._publish(record))
+
+    def remove(self, order_hash: str):
+        """Remove an order, and send an update saying it's fully filled."""
+        with self.lock:
+            record = json.loads(json.dumps(self.orders.pop(order_hash)))
+        record["metaData"]["remainingFillableTakerAssetAmount"] = "0"
+        self._call(self._publish(record))
+
+    def drop_connections(self):
+        """Close every websocket connection."""
+        self._call(self._drop_connections())
+
+    def _call(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    async def _publish(self, record: dict):
+        for (websocket, subscriptions) in list(self._subscriptions.items()):
+            for (request_id, payload) in subscriptions:
+                if payload.get("makerAssetData") in (
+                    None,
+                    record["order"]["makerAssetData"],
+                ) and payload.get("takerAssetData") in (
+                    None,
+                    record["order"]["takerAssetData"],
+                ):
+                    await websocket.send_str(
+                        json.dumps(
+                            {
+                                "type": "update",
+                                "channel": "orders",
+                                "requestId": request_id,
+                                "payload": [record],
+                            }
+                        )
+                    )
+
+    async def _drop_connections(self):
+        for websocket in list(self._subscriptions):
+            await websocket.close()
+
+    async def _orderbook(self, request):
+        with self.lock:
+            self.orderbook_requests += 1
+            records = list(self.orders.values())
+        base = request.query["baseAssetData"]
+        quote = request.query["quoteAssetData"]
+        page = int(request.query.get("page", "1"))
+        per_page = int(request.query.get("perPage", "100"))
+        await asyncio.sleep(self.snapshot_latency)
+
+        def collection(maker_asset_data, taker_asset_data):
+            matching = [
+                record
+                for record in records
+                if record["order"]["makerAssetData"] == maker_asset_data
+                and record["order"]["takerAssetData"] == taker_asset_data
+            ]
+            return {
+                "total": len(matching),
+                "page": page,
+                "perPage": per_page,
+                "records": matching[
+                    slice((page - 1) * per_page, page * per_page)
+                ],
+            }
+
+        return web.json_response(
+            {"bids": collection(quote, base), "asks": collection(base, quote)}
+        )
+
+    async def _websocket(self, request):
+        websocket = web.WebSocketResponse()
+        await websocket.prepare(request)
+        self.connections += 1
+        self._subscriptions[websocket] = []
+        try:
+            async for message in websocket:
+                subscription = json.loads(message.data)
+                if subscription.get("type") == "subscribe":
+                    self._subscriptions[websocket].append(
+                        (
+                            subscription["requestId"],
+                            subscription.get("payload") or {},
+                        )
+                    )
+        finally:
+            del self._subscriptions[websocket]
+        return websocket
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_get("/v3/orderbook", self._orderbook)
+        app.router.add_get("/ws", self._websocket)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self._port = self._runner.addresses[0][1]
+
+    def wait_for_subscriptions(self, n_subscriptions: int, timeout=5.0):
+        """Wait until there are `n_subscriptions`:code: in all."""
+        deadline = time.monotonic() + timeout
+        while (
+            sum(map(len, list(self._subscriptions.values()))) < n_subscriptions
+        ):
+            if time.monotonic() > deadline:
+                raise TimeoutError("not enough subscriptions")
+            time.sleep(0.01)
+
+    def __enter__(self) -> "StandInOrdersChannel":
+        """Start serving."""
+        self._thread.start()
+        self._call(self._start())
+        return self
+
+    def __exit__(self, *args):
+        """Stop serving."""
+        self._call(self._runner.cleanup())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
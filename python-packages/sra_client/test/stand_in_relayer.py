@@ -0,0 +1,201 @@
+"""A local HTTP stand-in for an SRA relayer, serving canned responses."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import sys
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+ASSET_DATA_A = "0xf47261b0" + "00" * 12 + "11" * 20
+
+ASSET_DATA_B = "0xf47261b0" + "00" * 12 + "22" * 20
+
+FEE_RECIPIENT = "0x" + "33" * 20
+
+
+def order(index: int) -> dict:
+    """Get an order of the stand-in's orderbook, with its metadata."""
+    return {
+        "order": {
+            "makerAddress": "0x" + "44" * 20,
+            "takerAddress": "0x" + "00" * 20,
+            "feeRecipientAddress": FEE_RECIPIENT,
+            "senderAddress": "0x" + "00" * 20,
+            "makerAssetAmount": str(1000 + index),
+            "takerAssetAmount": "2000",
+            "makerFee": "0",
+            "takerFee": "0",
+            "expirationTimeSeconds": "1600000000",
+            "salt": str(index),
+            "makerAssetData": ASSET_DATA_A,
+            "takerAssetData": ASSET_DATA_B,
+            "makerFeeAssetData": "0x",
+            "takerFeeAssetData": "0x",
+            "exchangeAddress": "0x" + "55" * 20,
+            "chainId": 1337,
+            "signature": "0x" + "66" * 66,
+        },
+        "metaData": {"orderHash": "0x{:064x}".format(index)},
+    }
+
+
+class _Server(ThreadingHTTPServer):
+    """Accept many concurrent connections."""
+
+    request_queue_size = 1024
+
+    def handle_error(self, request, client_address):
+        """Report errors, except for clients which hung up, as they may."""
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Answer SRA v3 requests."""
+
+    protocol_version = "HTTP/1.1"
+
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer a GET request."""
+        self._answer(None)
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Answer a POST request."""
+        length = int(self.headers.get("Content-Length") or 0)
+        self._answer(json.loads(self.rfile.read(length) or b"null"))
+
+    def _answer(self, body):
+        relayer = self.server.relayer  # type: ignore
+        time.sleep(relayer.latency)
+        url = urlparse(self.path)
+        (status, response) = relayer.answer(
+            self.command, url.path, parse_qs(url.query), body
+        )
+        content = b"" if response is None else json.dumps(response).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """Keep quiet."""
+
+
+class StandInRelayer:
+    """Serve the SRA v3 endpoints from an orderbook of `n_orders`:code:.
+
+    Use it as a context manager to run it in a background thread.
+
+    :param n_orders: the number of orders in the orderbook.
+    :param latency: seconds to wait before answering each request, to stand
+        in for the network between a client and a remote relayer.
+    """
+
+    def __init__(self, n_orders: int = 10, latency: float = 0.0):
+        """Bind to a free local port."""
+        self.latency = latency
+        self.orders = [order(index) for index in range(n_orders)]
+        self.posted = []
+        """The body of each order posted."""
+        self.report_total = True
+        """Whether pages say how many records there are in all."""
+        self.requested_pages = []
+        """The path and page number of each request for a page."""
+        self.lock = threading.Lock()
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.relayer = self  # type: ignore
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            daemon=True,
+        )
+
+    @property
+    def url(self) -> str:
+        """Get the URL to connect to."""
+        return "http://127.0.0.1:{}".format(self._server.server_port)
+
+    def _page(self, records: list, query: dict) -> dict:
+        page = int(query.get("page", ["1"])[0])
+        per_page = int(query.get("perPage", ["100"])[0])
+        response = {
+            "total": len(records),
+            "page": page,
+            "perPage": per_page,
+            "records": records[slice((page - 1) * per_page, page * per_page)],
+        }
+        if not self.report_total:
+            del response["total"]
+        return response
+
+    def answer(self, method: str, path: str, query: dict, body) -> tuple:
+        """Get the status and body of the response to a request."""
+        # pylint: disable=too-many-return-statements
+        if method == "GET" and "page" in query:
+            with self.lock:
+                self.requested_pages.append((path, int(query["page"][0])))
+        if method == "GET" and path == "/v3/asset_pairs":
+            pair = {
+                "assetDataA": {
+                    "assetData": ASSET_DATA_A,
+                    "minAmount": "0",
+                    "maxAmount": "1000000",
+                    "precision": 18,
+                },
+                "assetDataB": {
+                    "assetData": ASSET_DATA_B,
+                    "minAmount": "0",
+                    "maxAmount": "1000000",
+                    "precision": 18,
+                },
+            }
+            return (200, self._page([pair], query))
+        if method == "GET" and path == "/v3/orders":
+            return (200, self._page(self.orders, query))
+        if method == "GET" and path == "/v3/orderbook":
+            return (
+                200,
+                {
+                    "bids": self._page([], query),
+                    "asks": self._page(self.orders, query),
+                },
+            )
+        if method == "GET" and path.startswith("/v3/order/"):
+            order_hash = path.rsplit("/", 1)[1]
+            for record in self.orders:
+                if record["metaData"]["orderHash"] == order_hash:
+                    return (200, record)
+            return (404, {"code": 100, "reason": "Not found"})
+        if method == "GET" and path == "/v3/fee_recipients":
+            return (200, self._page([FEE_RECIPIENT], query))
+        if method == "POST" and path == "/v3/order_config":
+            return (
+                200,
+                {
+                    "makerFee": "0",
+                    "takerFee": "0",
+                    "feeRecipientAddress": FEE_RECIPIENT,
+                    "senderAddress": "0x" + "00" * 20,
+                    "makerFeeAssetData": "0x",
+                    "takerFeeAssetData": "0x",
+                },
+            )
+        if method == "POST" and path == "/v3/order":
+            with self.lock:
+                self.posted.append(body)
+            return (200, None)
+        return (404, {"code": 100, "reason": "Not found"})
+
+    def __enter__(self) -> "StandInRelayer":
+        """Start serving."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        """Stop serving."""
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,181 @@
+"""Tests for deserializing responses with :class:`ApiClient`."""
+
+import datetime
+import json
+
+import pytest
+
+from zero_ex.sra_client import ApiClient, Configuration
+from zero_ex.sra_client.models import (
+    RelayerApiOrderbookResponseSchema,
+    RelayerApiOrderSchema,
+    RelayerApiOrdersResponseSchema,
+)
+from zero_ex.sra_client.rest import ApiException
+
+from .stand_in_relayer import order
+
+
+class _Response:  # pylint: disable=too-few-public-methods
+    def __init__(self, data: str):
+        self.data = data
+
+
+def _records(*indices):
+    records = [order(index) for index in indices]
+    # fields a relayer may leave null, which are kept as they are
+    records[0]["order"]["takerAddress"] = None
+    records[0]["metaData"]["remainingFillableTakerAssetAmount"] = None
+    return records
+
+
+def _expected_orders(records):
+    return RelayerApiOrdersResponseSchema(
+        records=[
+            RelayerApiOrderSchema(
+                order=record["order"], meta_data=record["metaData"]
+            )
+            for record in records
+        ]
+    )
+
+
+def _deserialize(body, response_type, **configuration):
+    api_client = ApiClient(Configuration())
+    for (name, value) in configuration.items():
+        setattr(api_client.configuration, name, value)
+    return api_client.deserialize(_Response(json.dumps(body)), response_type)
+
+
+def test_deserialize__orders_response():
+    """Test that a page of orders is deserialized into models."""
+    records = _records(0, 1, 2)
+    body = {"total": 3, "page": 1, "perPage": 10, "records": records}
+    orders = _deserialize(body, "RelayerApiOrdersResponseSchema")
+    assert orders == _expected_orders(records)
+    assert orders.records[0].order["takerAddress"] is None
+    assert orders.records[0].meta_data == records[0]["metaData"]
+
+    assert (
+        _deserialize(
+            body, "RelayerApiOrdersResponseSchema", raw_responses=True
+        )
+        == body
+    )
+
+
+def test_deserialize__orderbook_response():
+    """Test that an orderbook is deserialized into models, bids and asks."""
+    (bids, asks) = (_records(0, 1), _records(2, 3, 4))
+    body = {
+        "bids": {"total": 2, "page": 1, "perPage": 10, "records": bids},
+        "asks": {"total": 3, "page": 1, "perPage": 10, "records": asks},
+    }
+    orderbook = _deserialize(body, "RelayerApiOrderbookResponseSchema")
+    assert orderbook == RelayerApiOrderbookResponseSchema(
+        bids=_expected_orders(bids), asks=_expected_orders(asks)
+    )
+    assert isinstance(orderbook.asks, RelayerApiOrdersResponseSchema)
+
+    assert (
+        _deserialize(
+            body, RelayerApiOrderbookResponseSchema, raw_responses=True
+        )
+        == body
+    )
+
+
+def test_deserialize__required_field_null():
+    """Test that a model's required field, if null, is refused."""
+    with pytest.raises(ValueError, match="meta_data"):
+        _deserialize(
+            {"records": [{"order": order(0)["order"], "metaData": None}]},
+            "RelayerApiOrdersResponseSchema",
+        )
+
+
+@pytest.mark.parametrize(
+    "data,response_type,expected",
+    [
+        ([["1", 2], [3.0]], "list[list[int]]", [[1, 2], [3]]),
+        (
+            {"a": ["1.5"], "b": []},
+            "dict(str, list[float])",
+            {"a": [1.5], "b": []},
+        ),
+        ([{"a": 1}, None], "list[dict(str, str)]", [{"a": "1"}, None]),
+        ("2019-05-01", "date", datetime.date(2019, 5, 1)),
+        (
+            "2019-05-01T12:30:00",
+            "datetime",
+            datetime.datetime(2019, 5, 1, 12, 30),
+        ),
+        ({"a": [None]}, "object", {"a": [None]}),
+        (None, "list[int]", None),
+        (None, "dict(str, int)", None),
+        (None, "date", None),
+        (None, "RelayerApiOrdersResponseSchema", None),
+    ],
+)
+def test_deserialize_data(data, response_type, expected):
+    """Test lists, dicts, dates and nulls, nested in one another."""
+    assert ApiClient().deserialize_data(data, response_type) == expected
+
+
+def test_deserialize_data__models_in_dict():
+    """Test that models are deserialized as the values of a dict."""
+    records = _records(5, 6)
+    orders = ApiClient().deserialize_data(
+        {record["metaData"]["orderHash"]: record for record in records},
+        "dict(str, RelayerApiOrderSchema)",
+    )
+    assert list(orders.values()) == _expected_orders(records).records
+    assert list(orders) == [
+        record["metaData"]["orderHash"] for record in records
+    ]
+
+
+def test_deserialize_data__bad_date():
+    """Test that a string which isn't a date raises an ApiException."""
+    with pytest.raises(ApiException, match="as date object"):
+        ApiClient().deserialize_data("not a date", "date")
+
+
+class _Order(RelayerApiOrderSchema):
+    """An order which may be deserialized as a child model."""
+
+    def get_real_child_model(self, data):  # pylint: disable=no-self-use
+        """Get the name of the model `data` is really of, if any."""
+        return data["metaData"].get("model")
+
+
+def test_deserialize_data__child_model():
+    """Test that a model naming a child model is deserialized as that."""
+    record = order(0)
+    assert type(ApiClient().deserialize_data(record, _Order)) is _Order
+
+    record["metaData"]["model"] = "RelayerApiOrdersResponseSchema"
+    record["records"] = [order(1)]
+    assert ApiClient().deserialize_data(record, _Order) == _expected_orders(
+        [order(1)]
+    )
+
+
+def test_deserialization_plans_kept():
+    """Test that the plan for a type is made only once, and shared."""
+    api_client = ApiClient()
+    # pylint: disable=protected-access
+    plan = api_client._get_deserialization_plan(
+        "RelayerApiOrdersResponseSchema"
+    )
+    assert (
+        api_client._get_deserialization_plan("RelayerApiOrdersResponseSchema")
+        is plan
+    )
+    assert (
+        api_client._get_deserialization_plan(RelayerApiOrdersResponseSchema)
+        is plan
+    )
+    assert api_client._get_deserialization_plan(
+        "list[RelayerApiOrderSchema]"
+    ) is api_client._get_deserialization_plan("list[RelayerApiOrderSchema]")
@@ -0,0 +1,109 @@
+"""Tests for :class:`zero_ex.sra_client.AsyncRelayerApi`."""
+
+import aiohttp
+import pytest
+
+from zero_ex.sra_client import AsyncRelayerApi, RelayerApi
+from zero_ex.sra_client.rest import ApiException
+
+from .stand_in_relayer import ASSET_DATA_A, ASSET_DATA_B, StandInRelayer
+
+ORDER_CONFIG_PAYLOAD = {
+    "makerAddress": "0x" + "44" * 20,
+    "takerAddress": "0x" + "00" * 20,
+    "makerAssetAmount": "1000",
+    "takerAssetAmount": "2000",
+    "makerAssetData": ASSET_DATA_A,
+    "takerAssetData": ASSET_DATA_B,
+    "exchangeAddress": "0x" + "55" * 20,
+    "expirationTimeSeconds": "1600000000",
+}
+
+
+@pytest.fixture
+def stand_in():
+    """Run a stand-in relayer for the duration of a test."""
+    with StandInRelayer(n_orders=25) as relayer:
+        yield relayer
+
+
+ENDPOINTS = [
+    ("get_asset_pairs", (), {}),
+    ("get_fee_recipients", (), {}),
+    ("get_order", ("0x{:064x}".format(3),), {}),
+    (
+        "get_order_config",
+        (),
+        {"relayer_api_order_config_payload_schema": ORDER_CONFIG_PAYLOAD},
+    ),
+    ("get_orderbook", (ASSET_DATA_A, ASSET_DATA_B), {"per_page": 10}),
+    ("get_orders", (), {"page": 2, "per_page": 10}),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method_name,args,kwargs", ENDPOINTS, ids=[e[0] for e in ENDPOINTS]
+)
+async def test_async_relayer_api__same_as_relayer_api(
+    stand_in, method_name, args, kwargs  # pylint: disable=redefined-outer-name
+):
+    """Test that each endpoint returns what RelayerApi's does."""
+    expected = getattr(RelayerApi(stand_in.url), method_name)(*args, **kwargs)
+    async with AsyncRelayerApi(stand_in.url) as relayer:
+        actual = await getattr(relayer, method_name)(*args, **kwargs)
+    assert actual == expected
+    assert isinstance(actual, type(expected))
+
+
+@pytest.mark.asyncio
+async def test_async_relayer_api__error_status(
+    stand_in,  # pylint: disable=redefined-outer-name
+):
+    """Test that a response other than 2xx raises an ApiException."""
+    async with AsyncRelayerApi(stand_in.url) as relayer:
+        with pytest.raises(ApiException) as exception_info:
+            await relayer.get_order("0x" + "ff" * 32)
+    assert exception_info.value.status == 404
+    assert "Not found" in exception_info.value.body
+
+
+@pytest.mark.asyncio
+async def test_async_relayer_api__post_order(
+    stand_in,  # pylint: disable=redefined-outer-name
+):
+    """Test that post_order() sends the order as the JSON body."""
+    signed_order = stand_in.orders[7]["order"]
+    async with AsyncRelayerApi(stand_in.url) as relayer:
+        assert await relayer.post_order(signed_order_schema=signed_order) is (
+            None
+        )
+    assert stand_in.posted == [signed_order]
+
+
+@pytest.mark.asyncio
+async def test_async_relayer_api__own_session_closed(
+    stand_in,  # pylint: disable=redefined-outer-name
+):
+    """Test that the session the instance opened is closed on exit."""
+    async with AsyncRelayerApi(stand_in.url) as relayer:
+        await relayer.get_fee_recipients()
+        # pylint: disable=protected-access
+        session = relayer.api_client.rest_client._session
+        assert not session.closed
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_async_relayer_api__shared_session_left_open(
+    stand_in,  # pylint: disable=redefined-outer-name
+):
+    """Test that a session passed in outlives the instance."""
+    async with aiohttp.ClientSession() as session:
+        async with AsyncRelayerApi(stand_in.url, session=session) as relayer:
+            await relayer.get_fee_recipients()
+        assert not session.closed
+        async with AsyncRelayerApi(stand_in.url, session=session) as relayer:
+            fee_recipients = await relayer.get_fee_recipients()
+        assert fee_recipients.records
+        assert not session.closed
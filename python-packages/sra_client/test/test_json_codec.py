@@ -0,0 +1,46 @@
+"""Tests for :mod:`zero_ex.sra_client.json_codec`."""
+
+import json
+
+import pytest
+
+from zero_ex.sra_client import Configuration
+from zero_ex.sra_client.json_codec import JsonCodec, OrjsonCodec
+
+from .stand_in_relayer import order
+
+pytest.importorskip("orjson")
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        '{"total": 18446744073709551616}',
+        '[1, -9223372036854775809, {"a": [ 123456789012345678901234]}]',
+        '{"amount": 1e400, "remaining": NaN}',
+    ],
+)
+def test_orjson_codec__decodes_as_json_does(data):
+    """Test that large integers, and what orjson refuses, are decoded."""
+    for body in (data, data.encode()):
+        decoded = OrjsonCodec().loads(body)
+        # compared as reprs, since an integer equals a float near it, and
+        # NaN equals nothing
+        assert repr(decoded) == repr(json.loads(data))
+
+
+def test_orjson_codec__long_amounts_decoded_by_orjson(monkeypatch):
+    """Test that strings of many digits don't need the standard library."""
+
+    def refuse(self, data):  # pylint: disable=unused-argument
+        raise AssertionError("decoded with the standard library")
+
+    monkeypatch.setattr(JsonCodec, "loads", refuse)
+    record = order(0)
+    record["order"]["makerAssetAmount"] = "5" + "0" * 30
+    assert OrjsonCodec().loads(json.dumps([record]).encode()) == [record]
+
+
+def test_configuration__orjson_codec_by_default():
+    """Test that orjson is used when it's installed."""
+    assert isinstance(Configuration().json_codec, OrjsonCodec)
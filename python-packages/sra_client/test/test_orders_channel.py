@@ -0,0 +1,265 @@
+"""Tests for :mod:`zero_ex.sra_client.orders_channel`."""
+
+import asyncio
+
+import aiohttp
+import pytest
+
+from zero_ex.sra_client import ApiClient, AsyncRelayerApi, OrderbookMirror
+from zero_ex.sra_client.orders_channel import OrderbookSide, REMOVED_STATES
+from zero_ex.sra_client.rest import ApiException
+
+from .stand_in_orders_channel import (
+    BASE_ASSET_DATA,
+    QUOTE_ASSET_DATA,
+    StandInOrdersChannel,
+    priced_order,
+)
+
+N_ASKS = 25
+
+N_BIDS = 15
+
+PER_PAGE = 10
+
+
+@pytest.fixture
+def stand_in():
+    """Serve an orderbook of several pages, with its orders channel."""
+    with StandInOrdersChannel() as orders_channel:
+        for index in range(N_ASKS):
+            orders_channel.put(priced_order(index, 100 + index, False))
+        for index in range(N_BIDS):
+            orders_channel.put(priced_order(N_ASKS + index, 1 + index, True))
+        yield orders_channel
+
+
+def _mirror(relayer, orders_channel, **kwargs):
+    kwargs.setdefault("per_page", PER_PAGE)
+    kwargs.setdefault("reconnect_delay", 0.01)
+    return OrderbookMirror(
+        relayer,
+        orders_channel.websocket_url,
+        BASE_ASSET_DATA,
+        QUOTE_ASSET_DATA,
+        **kwargs
+    )
+
+
+def _order_hash(index):
+    return priced_order(index, 1, False)["metaData"]["orderHash"]
+
+
+async def _in_thread(function, *args):
+    """Call `function` without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(
+        None, function, *args
+    )
+
+
+async def _wait_until(condition):
+    """Wait for `condition()` to be true, for a few seconds at most."""
+    for _ in range(500):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("timed out")
+
+
+@pytest.mark.asyncio
+async def test_orderbook_mirror__snapshot_of_several_pages(
+    stand_in,  # pylint: disable=redefined-outer-name
+):
+    """Test that the mirror is seeded with every page of the orderbook."""
+    async with AsyncRelayerApi(stand_in.url) as relayer:
+        async with _mirror(relayer, stand_in) as mirror:
+            assert mirror.synced
+            assert mirror.n_snapshots == 1
+            assert len(mirror.asks) == N_ASKS
+            assert len(mirror.bids) == N_BIDS
+            assert mirror.best_ask.meta_data["orderHash"] == _order_hash(0)
+            assert mirror.best_bid.meta_data["orderHash"] == _order_hash(
+                N_ASKS + N_BIDS - 1
+            )
+            assert mirror.get_order(_order_hash(3)) is mirror.asks.get(
+                _order_hash(3)
+            )
+    assert stand_in.orderbook_requests == 3
+
+
+@pytest.mark.asyncio
+async def test_orderbook_mirror__updates_during_snapshot(
+    stand_in,  # pylint: disable=redefined-outer-name
+):
+    """Test that updates arriving during the snapshot are applied after it."""
+    stand_in.snapshot_latency = 0.3
+    new_order = priced_order(1000, 50, False)
+    async with AsyncRelayerApi(stand_in.url) as relayer:
+        mirror = _mirror(relayer, stand_in, per_page=100)
+        try:
+            mirror.start()
+            await _wait_until(lambda: stand_in.orderbook_requests == 1)
+            await _in_thread(stand_in.put, new_order)
+            await _in_thread(stand_in.remove, _order_hash(0))
+            assert not mirror.synced
+
+            await mirror.wait_synced()
+            assert mirror.n_snapshots == 1
+            assert mirror.best_ask.meta_data["orderHash"] == _order_hash(1000)
+            assert mirror.get_order(_order_hash(0)) is None
+            assert len(mirror.asks) == N_ASKS
+        finally:
+            await mirror.close()
+    assert stand_in.orderbook_requests == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("state", [None] + sorted(REMOVED_STATES))
+async def test_orderbook_mirror__removals(
+    stand_in, state  # pylint: disable=redefined-outer-name
+):
+    """Test that orders no longer fillable are removed from the mirror."""
+    async with AsyncRelayerApi(stand_in.url) as relayer:
+        async with _mirror(relayer, stand_in) as mirror:
+            order_hash = _order_hash(N_ASKS)
+            assert mirror.bids.get(order_hash) is not None
+            if state is None:
+                await _in_thread(stand_in.remove, order_hash)
+            else:
+                record = priced_order(N_ASKS, 1, True)
+                record["metaData"]["state"] = state
+                await _in_thread(stand_in.put, record)
+            await _wait_until(lambda: mirror.bids.get(order_hash) is None)
+            assert len(mirror.bids) == N_BIDS - 1
+            assert len(mirror.asks) == N_ASKS
+
+
+@pytest.mark.asyncio
+async def test_orderbook_mirror__reconnect(
+    stand_in,  # pylint: disable=redefined-outer-name
+):
+    """Test that a dropped connection is resubscribed and resynced."""
+    async with AsyncRelayerApi(stand_in.url) as relayer:
+        async with _mirror(relayer, stand_in) as mirror:
+            assert stand_in.connections == 1
+            # an order the mirror can only learn of from a new snapshot
+            missed = priced_order(2000, 1000, True)
+            with stand_in.lock:
+                stand_in.orders[missed["metaData"]["orderHash"]] = missed
+
+            await _in_thread(stand_in.drop_connections)
+            await _wait_until(lambda: mirror.n_snapshots == 2)
+            await mirror.wait_synced()
+            assert stand_in.connections == 2
+            assert mirror.best_bid.meta_data["orderHash"] == _order_hash(2000)
+
+            await _in_thread(stand_in.wait_for_subscriptions, 2)
+            await _in_thread(stand_in.remove, _order_hash(2000))
+            await _wait_until(
+                lambda: mirror.get_order(_order_hash(2000)) is None
+            )
+
+
+@pytest.mark.asyncio
+async def test_orderbook_mirror__error_not_retried(
+    stand_in,  # pylint: disable=redefined-outer-name
+):
+    """Test that an error connecting again won't fix is raised."""
+    async with AsyncRelayerApi(stand_in.url + "/no-such-api") as relayer:
+        mirror = _mirror(relayer, stand_in)
+        with pytest.raises(ApiException) as exception_info:
+            await asyncio.wait_for(mirror.wait_synced(), 5)
+        await mirror.close()
+    assert exception_info.value.status == 404
+    assert mirror.n_snapshots == 0
+
+
+@pytest.mark.asyncio
+async def test_orderbook_mirror__sessions(
+    stand_in,  # pylint: disable=redefined-outer-name
+):
+    """Test that close() closes the mirror's own session, and only that."""
+    async with AsyncRelayerApi(stand_in.url) as relayer:
+        async with aiohttp.ClientSession() as session:
+            async with _mirror(relayer, stand_in, session=session):
+                pass
+            assert not session.closed
+
+        async with _mirror(relayer, stand_in) as mirror:
+            # pylint: disable=protected-access
+            own_session = mirror._session
+        assert own_session.closed
+
+
+def test_orderbook_mirror__raw_responses_rejected():
+    """Test that the mirror needs a relayer which returns models."""
+    relayer = AsyncRelayerApi("http://127.0.0.1:1", raw_responses=True)
+    with pytest.raises(ValueError, match="raw_responses"):
+        OrderbookMirror(
+            relayer, "ws://127.0.0.1:1", BASE_ASSET_DATA, QUOTE_ASSET_DATA
+        )
+
+
+def _orders(*records):
+    return ApiClient().deserialize_data(
+        list(records), "list[RelayerApiOrderSchema]"
+    )
+
+
+def test_orderbook_side__best_price_first():
+    """Test that bids and asks are kept in order of price, best first."""
+    bids = OrderbookSide(is_bid=True)
+    asks = OrderbookSide(is_bid=False)
+    for (index, price) in enumerate([3, 1, 4, 5, 2]):
+        (bid, ask) = _orders(
+            priced_order(index, price, True),
+            priced_order(10 + index, price, False),
+        )
+        bids.put(bid)
+        asks.put(ask)
+    assert [int(bid.order["makerAssetAmount"]) for bid in bids] == [
+        5000,
+        4000,
+        3000,
+        2000,
+        1000,
+    ]
+    assert [int(ask.order["takerAssetAmount"]) for ask in asks] == [
+        1000,
+        2000,
+        3000,
+        4000,
+        5000,
+    ]
+    assert bids.best.meta_data["orderHash"] == _order_hash(3)
+    assert asks.best.meta_data["orderHash"] == _order_hash(11)
+
+    # a better price for an order moves it to the front
+    record = priced_order(14, 1, False)
+    record["order"]["takerAssetAmount"] = "500"
+    (replacement,) = _orders(record)
+    asks.put(replacement)
+    assert asks.best is replacement
+    assert len(asks) == 5
+
+    asks.remove(_order_hash(14))
+    asks.remove(_order_hash(14))
+    assert asks.best.meta_data["orderHash"] == _order_hash(11)
+    assert len(asks) == 4
+
+
+def test_orderbook_side__zero_amounts_dropped():
+    """Test that orders for nothing, or nothing in return, are left out."""
+    asks = OrderbookSide(is_bid=False)
+    records = [priced_order(index, 1, False) for index in range(3)]
+    records[0]["order"]["makerAssetAmount"] = "0"
+    records[1]["order"]["takerAssetAmount"] = "0"
+    for order in _orders(*records):
+        asks.put(order)
+    assert [ask.meta_data["orderHash"] for ask in asks] == [_order_hash(2)]
+
+    # an order replaced by one for nothing is dropped
+    (emptied,) = _orders({**records[0], "metaData": records[2]["metaData"]})
+    asks.put(emptied)
+    assert len(asks) == 0
+    assert asks.best is None
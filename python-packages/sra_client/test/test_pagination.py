@@ -0,0 +1,154 @@
+"""Tests for :meth:`RelayerApi.iter_orders` and its kin."""
+
+import asyncio
+import time
+
+import pytest
+
+from zero_ex.sra_client import AsyncRelayerApi, RelayerApi
+
+from .stand_in_relayer import StandInRelayer
+
+PER_PAGE = 10
+
+
+@pytest.fixture
+def stand_in():
+    """Run a stand-in relayer for the duration of a test."""
+    with StandInRelayer(n_orders=25) as relayer:
+        yield relayer
+
+
+def _order_hashes(stand_in):  # pylint: disable=redefined-outer-name
+    return [record["metaData"]["orderHash"] for record in stand_in.orders]
+
+
+def _pages_requested(stand_in):  # pylint: disable=redefined-outer-name
+    return sorted(page for (_, page) in stand_in.requested_pages)
+
+
+async def _aiter_order_hashes(url, **kwargs):
+    async with AsyncRelayerApi(url) as relayer:
+        return [
+            order.meta_data["orderHash"]
+            async for order in relayer.iter_orders(per_page=PER_PAGE, **kwargs)
+        ]
+
+
+def _iter_order_hashes(url, **kwargs):
+    return [
+        order.meta_data["orderHash"]
+        for order in RelayerApi(url).iter_orders(per_page=PER_PAGE, **kwargs)
+    ]
+
+
+@pytest.fixture(params=["sync", "async"])
+def iter_order_hashes(request):
+    """Get the hashes of all the orders, from iter_orders() either way."""
+    if request.param == "sync":
+        return _iter_order_hashes
+    return lambda url, **kwargs: asyncio.run(
+        _aiter_order_hashes(url, **kwargs)
+    )
+
+
+def test_iter_orders__until_total(
+    stand_in, iter_order_hashes  # pylint: disable=redefined-outer-name
+):
+    """Test that pages are requested until `total` records are yielded."""
+    assert iter_order_hashes(stand_in.url) == _order_hashes(stand_in)
+    assert _pages_requested(stand_in) == [1, 2, 3]
+
+    stand_in.requested_pages.clear()
+    del stand_in.orders[20:]
+    assert iter_order_hashes(stand_in.url) == _order_hashes(stand_in)
+    # the second page makes up the total, so no third page is requested
+    assert _pages_requested(stand_in) == [1, 2]
+
+
+def test_iter_orders__empty_page(
+    stand_in, iter_order_hashes  # pylint: disable=redefined-outer-name
+):
+    """Test that an empty page stops the iteration."""
+    stand_in.orders.clear()
+    assert iter_order_hashes(stand_in.url) == []
+    assert _pages_requested(stand_in) == [1]
+
+    stand_in.requested_pages.clear()
+    stand_in.report_total = False
+    stand_in.orders.extend(StandInRelayer(n_orders=20).orders)
+    assert iter_order_hashes(stand_in.url) == _order_hashes(stand_in)
+    assert _pages_requested(stand_in) == [1, 2, 3]
+
+
+def test_iter_orders__short_page_without_total(
+    stand_in, iter_order_hashes  # pylint: disable=redefined-outer-name
+):
+    """Test that without a `total`, a page less than full is the last."""
+    stand_in.report_total = False
+    assert iter_order_hashes(stand_in.url) == _order_hashes(stand_in)
+    assert _pages_requested(stand_in) == [1, 2, 3]
+
+
+def test_iter_asset_pairs(stand_in):  # pylint: disable=redefined-outer-name
+    """Test that the asset pairs are yielded as dicts."""
+    pairs = list(RelayerApi(stand_in.url).iter_asset_pairs())
+    assert len(pairs) == 1
+    assert isinstance(pairs[0], dict)
+    assert set(pairs[0]) == {"assetDataA", "assetDataB"}
+
+
+def _wait_for_page(stand_in, page):  # pylint: disable=redefined-outer-name
+    deadline = time.monotonic() + 5
+    while page not in _pages_requested(stand_in):
+        assert time.monotonic() < deadline, f"page {page} never requested"
+        time.sleep(0.01)
+
+
+def test_iter_orders__next_page_prefetched(
+    stand_in,  # pylint: disable=redefined-outer-name
+):
+    """Test that the next page is requested before its records are wanted."""
+    orders = RelayerApi(stand_in.url).iter_orders(per_page=PER_PAGE)
+    next(orders)
+    _wait_for_page(stand_in, 2)
+    assert 3 not in _pages_requested(stand_in)
+    orders.close()
+
+
+@pytest.mark.asyncio
+async def test_aiter_orders__next_page_prefetched(
+    stand_in,  # pylint: disable=redefined-outer-name
+):
+    """Test that the next page is requested before its records are wanted."""
+    async with AsyncRelayerApi(stand_in.url) as relayer:
+        orders = relayer.iter_orders(per_page=PER_PAGE)
+        await orders.__anext__()
+        deadline = time.monotonic() + 5
+        while 2 not in _pages_requested(stand_in):
+            assert time.monotonic() < deadline, "page 2 never requested"
+            await asyncio.sleep(0.01)
+        assert 3 not in _pages_requested(stand_in)
+        await orders.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aiter_orders__left_early(
+    stand_in,  # pylint: disable=redefined-outer-name
+):
+    """Test that leaving `async for` early cancels the next page's request."""
+    stand_in.latency = 0.2
+    async with AsyncRelayerApi(stand_in.url) as relayer:
+        orders = relayer.iter_orders(per_page=PER_PAGE)
+        try:
+            async for _ in orders:
+                break
+            pending = asyncio.all_tasks() - {asyncio.current_task()}
+            assert len(pending) == 1
+            # let the request for the next page get under way
+            await asyncio.sleep(0.05)
+            assert not any(task.done() for task in pending)
+        finally:
+            await orders.aclose()
+        await asyncio.sleep(0)
+        assert all(task.cancelled() for task in pending)